@@ -23,11 +23,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSlot, QSize, QEvent
 from PyQt6.QtGui import QIcon, QCloseEvent, QAction
 
-from .panels import ConfigPanel, ProgressPanel, LogPanel
+from .panels import ConfigPanel, ProgressPanel, ProgressSnapshot, LogPanel
 from .workers import WorkflowWorker
 from .workers.workflow_worker import WorkflowType
 from .utils import ConfigManager, LogManager
-from .styles import get_main_stylesheet, Colors, Sizes, Fonts
+from .styles import Colors, Sizes, Fonts
 from .theme_manager import ThemeManager
 
 
@@ -485,7 +485,7 @@ class MainWindow(QMainWindow):
         is_dark = self.theme_manager.is_dark()
 
         # 1. 更新全局样式表
-        self.setStyleSheet(get_main_stylesheet(colors))
+        self.setStyleSheet(self.theme_manager.get_main_stylesheet())
 
         # 2. 更新法律声明卡片样式
         warning_bg = "#fff3cd" if not is_dark else "#4a3800"
@@ -623,7 +623,7 @@ class MainWindow(QMainWindow):
         log_file = self.config_manager.get_project_root() / "logs" / "desktop.log"
         qt_handler = log_manager.setup_logging(
             level=logging.INFO, log_file=str(log_file))
-        qt_handler.log_signal.log_message.connect(self.log_panel.append_log)
+        qt_handler.log_signal.log_batch.connect(self.log_panel.append_logs)
         logging.info(f"{self.APP_NAME} v{self.APP_VERSION} 启动")
 
     # ==================== Actions ====================
@@ -727,6 +727,8 @@ class MainWindow(QMainWindow):
         self._worker.progress.connect(self._on_progress)
         self._worker.finished_signal.connect(self._on_finished)
         self._worker.error.connect(self._on_error)
+        # 线程真正结束后才恢复按钮（取消后后台步骤可能仍在收尾）
+        self._worker.finished.connect(self._on_worker_thread_finished)
 
         self._worker.start()
 
@@ -738,13 +740,11 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(int, str, str)
     def _on_progress(self, progress, status, detail):
-        self.progress_panel.set_progress(progress)
-        self.progress_panel.set_status(status, "info")
-        self.progress_panel.set_detail(detail)
+        self.progress_panel.apply(ProgressSnapshot(
+            status=status, color_key="info", progress=progress, detail=detail))
 
     @pyqtSlot(bool, str, str)
     def _on_finished(self, success, message, output_file):
-        self._update_buttons(True)
         if success:
             self.progress_panel.set_success(message)
             if output_file:
@@ -794,6 +794,9 @@ class MainWindow(QMainWindow):
         logging.error(msg)
         self.progress_panel.set_error("发生错误")
         QMessageBox.critical(self, "错误", msg)
+
+    @pyqtSlot()
+    def _on_worker_thread_finished(self):
         self._update_buttons(True)
 
     def _update_buttons(self, enabled: bool):
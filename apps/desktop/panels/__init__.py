@@ -6,7 +6,7 @@ GUI 面板模块
 """
 
 from .config_panel import ConfigPanel
-from .progress_panel import ProgressPanel
+from .progress_panel import ProgressPanel, ProgressSnapshot
 from .log_panel import LogPanel
 
-__all__ = ["ConfigPanel", "ProgressPanel", "LogPanel"]
+__all__ = ["ConfigPanel", "ProgressPanel", "ProgressSnapshot", "LogPanel"]
@@ -6,21 +6,70 @@
 支持根据采集模式动态显示/隐藏对应的配置区域。
 """
 
+import os
+import subprocess
+import sys
 from datetime import datetime, date
 from typing import Optional, Dict
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QGroupBox, QLabel, QLineEdit, QPushButton,
     QListWidget, QComboBox, QCheckBox, QRadioButton,
-    QDateEdit, QMessageBox, QInputDialog, QFrame,
-    QSpinBox, QFileDialog, QButtonGroup, QSizePolicy,
+    QDateEdit, QFrame, QSpinBox, QButtonGroup,
     QScrollArea, QTextEdit, QTimeEdit
 )
-from PyQt6.QtCore import Qt, QDate, QTime, pyqtSignal, QSize
-from PyQt6.QtGui import QIcon, QAction
+from PyQt6.QtCore import Qt, QDate, QTime, QTimer, QRegularExpression, pyqtSignal
 
 from ..utils.config_manager import ConfigManager
-from ..styles import Colors, Sizes, apply_shadow_effect, Fonts
+from ..utils.env_file_manager import EnvFileManager
+from ..styles import Sizes, Fonts
+
+# 注意：QMessageBox / QInputDialog / QFileDialog 只在用户点击时使用，
+# 在对应的处理函数内按需导入
+
+# 字号样式片段（导入时生成一次，各样式表直接拼接复用）
+_QSS_FONT_SMALL = f"font-size: {Fonts.SIZE_SMALL}px;"
+_QSS_FONT_BODY = f"font-size: {Fonts.SIZE_BODY}px;"
+
+# 面板中与主题无关的尺寸样式：通过 role 属性统一声明控件宽度（替代逐个 setFixedWidth），
+# 状态标签统一使用小号字体；在创建子控件前先设置到面板上，使子控件首次 polish 即可生效
+_LAYOUT_QSS = """
+    QDateEdit[role="date"] { min-width: 140px; max-width: 140px; }
+    QTimeEdit[role="time"] { min-width: 80px; max-width: 80px; }
+    QPushButton[role="quick_date"] { min-width: 80px; max-width: 80px; }
+    QPushButton[role="quick_range"] { min-width: 100px; max-width: 100px; }
+    QPushButton[role="browse"] { min-width: 60px; max-width: 60px; }
+    QLabel[role="field_label"] { min-width: 60px; max-width: 60px; }
+    QLabel#tokenStatusLabel { min-width: 100px; max-width: 100px; }
+    QLabel[status] { %s }
+""" % _QSS_FONT_SMALL
+
+# API 模式“全天”时间范围的起止时间（QTime 为值类型，可安全共享）
+_DAY_START = QTime(0, 0)
+_DAY_END = QTime(23, 59)
+
+# 敏感输入框是否明文显示 -> 回显模式
+_ECHO_MODES = {
+    True: QLineEdit.EchoMode.Normal,
+    False: QLineEdit.EchoMode.Password,
+}
+
+# 敏感数据来源 -> 状态标签文字（未列出的来源均视为未配置）
+_SOURCE_TEXT = {
+    'config': "✓ 来自 config.yaml",
+    'env_file': "✓ 来自 .env 文件",
+    'system': "✓ 来自系统环境变量",
+    None: "⚠️ 未配置",
+}
+
+# 微信公众号文章链接的合法前缀（前缀匹配，无效链接可在开头几个字符就被拒绝）
+WECHAT_ARTICLE_URL_PREFIXES = (
+    "http://mp.weixin.qq.com/",
+    "https://mp.weixin.qq.com/",
+)
+
+# 匹配任意非空白字符，用于判断多行输入框是否只有空白
+_NON_BLANK = QRegularExpression(r"\S")
 
 
 class ConfigPanel(QWidget):
@@ -32,17 +81,55 @@ class ConfigPanel(QWidget):
     # 配置变化信号
     config_changed = pyqtSignal()
 
+    # GUI 模板配置项：(配置键, 显示名称)
+    GUI_TEMPLATES = (
+        ("search_website", "访问网页按钮"),
+        ("three_dots", "菜单按钮"),
+        ("turnback", "返回按钮"),
+    )
+
+    # 配置变化信号的防抖间隔（毫秒）：连续输入停顿后才发出一次信号
+    CONFIG_CHANGED_DEBOUNCE_MS = 250
+
+    # 日期卡片提示文字（按采集模式）
+    DATE_HINTS = {
+        "api": "选择要采集文章的发布时间范围（精确到分钟）",
+        "rpa": "选择要采集文章的发布日期（精确到天）",
+    }
+
+    # 复选框选中状态对应的整数值（stateChanged 信号传递的是 int）
+    _CHECKED = int(Qt.CheckState.Checked.value)
+
     def __init__(self, config_manager: ConfigManager, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.config_manager = config_manager
         self._collect_mode = "api"  # 默认使用 API 模式
         self._current_colors = {}  # 存储当前主题颜色
+        self._theme_key: Optional[tuple] = None  # 当前已应用主题的颜色键
+        self._theme_cache: Dict[tuple, str] = {}  # 颜色键 -> 面板样式表
+        # 敏感数据来源缓存：键 -> (值, 来源)，保存配置后失效
+        self._source_cache: Dict[str, tuple] = {}
+        # 程序化更新控件期间置为 True，此时忽略控件触发的配置变化通知
+        self._updating = False
+        # 列表内容的集合副本，用于 O(1) 查重（随列表的填充、添加、删除同步维护）
+        self._account_name_set: set = set()
+        self._url_set: set = set()
+        # 最近一次加载/保存时界面上的配置值，保存时据此跳过未变化的字段
+        self._saved_values: Dict[str, object] = {}
+        self._env_manager: Optional[EnvFileManager] = None  # 首次使用时创建
+
+        # 配置变化防抖定时器（单次触发，重复 start 会重新计时）
+        self._cfg_timer = QTimer(self)
+        self._cfg_timer.setSingleShot(True)
+        self._cfg_timer.setInterval(self.CONFIG_CHANGED_DEBOUNCE_MS)
+        self._cfg_timer.timeout.connect(self.config_changed.emit)
+
+        # 先设置尺寸样式再创建子控件，避免子控件创建后再次 polish
+        self.setStyleSheet(_LAYOUT_QSS)
 
         self._setup_ui()
         self._load_config()
         self._connect_signals()
-        # 初始化时根据默认模式更新界面显隐
-        self._on_mode_changed()
 
     def _setup_ui(self) -> None:
         """设置 UI 布局"""
@@ -57,175 +144,191 @@ class ConfigPanel(QWidget):
         scroll.setFrameShape(QFrame.Shape.NoFrame)
         scroll.setHorizontalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # 视口内容静态：滚动时只重绘新露出的区域，而不是整个视口
+        scroll.viewport().setAttribute(
+            Qt.WidgetAttribute.WA_StaticContents, True)
 
-        # 内容容器
+        # 内容容器（不透明背景，由面板样式表中的 #ConfigContent 规则着色）
         content_widget = QWidget()
+        content_widget.setObjectName("ConfigContent")
+        content_widget.setAutoFillBackground(True)
         content_layout = QVBoxLayout(content_widget)
         content_layout.setSpacing(Sizes.MARGIN_LARGE)
         content_layout.setContentsMargins(
             Sizes.MARGIN_LARGE, Sizes.MARGIN_LARGE, Sizes.MARGIN_LARGE, Sizes.MARGIN_LARGE)
 
-        # 1. 日期设置卡片
-        self.date_card = self._create_date_card()
-        apply_shadow_effect(self.date_card)
-        content_layout.addWidget(self.date_card)
-
-        # 2. 敏感数据保存方式卡片（新增）
-        self.sensitive_data_mode_card = self._create_sensitive_data_mode_card()
-        apply_shadow_effect(self.sensitive_data_mode_card)
-        content_layout.addWidget(self.sensitive_data_mode_card)
-
-        # 3. 采集模式选择卡片
-        self.mode_card = self._create_mode_card()
-        apply_shadow_effect(self.mode_card)
-        content_layout.addWidget(self.mode_card)
-
-        # 4. API 模式配置卡片
-        self.api_config_card = self._create_api_config_card()
-        apply_shadow_effect(self.api_config_card)
-        content_layout.addWidget(self.api_config_card)
-
-        # 5. RPA 模式配置卡片（原 urls_card 改造）
-        self.rpa_config_card = self._create_rpa_config_card()
-        apply_shadow_effect(self.rpa_config_card)
-        content_layout.addWidget(self.rpa_config_card)
-
-        # 6. 文本模型配置卡片（通用，从原 model_config_card 拆分）
-        self.llm_config_card = self._create_llm_config_card()
-        apply_shadow_effect(self.llm_config_card)
-        content_layout.addWidget(self.llm_config_card)
-
-        # 7. 视觉模型配置卡片（RPA 模式专用）
-        self.vlm_config_card = self._create_vlm_config_card()
-        apply_shadow_effect(self.vlm_config_card)
-        content_layout.addWidget(self.vlm_config_card)
-
-        # 8. GUI 模板配置卡片（RPA 模式专用）
-        self.template_card = self._create_template_card()
-        apply_shadow_effect(self.template_card)
-        content_layout.addWidget(self.template_card)
-
-        # 9. 发布配置卡片（通用）
-        self.publish_card = self._create_publish_card()
-        apply_shadow_effect(self.publish_card)
-        content_layout.addWidget(self.publish_card)
+        # 卡片不使用 QGraphicsDropShadowEffect：阴影效果会让卡片在滚动时走软件重绘，
+        # 卡片外观完全由全局样式表中的 QGroupBox 边框和圆角提供
+
+        # RPA 模式专用卡片在 API 模式下只放置隐藏的占位控件，
+        # 首次切换到 RPA 模式时再由 _build_rpa_cards() 创建真实卡片
+        self._rpa_cards_built = self._collect_mode == "rpa"
+
+        for attr, factory, rpa_only in self._card_specs():
+            if rpa_only and not self._rpa_cards_built:
+                card = self._create_placeholder()
+            else:
+                card = factory()
+            # 与当前模式不符的卡片在构造时即隐藏，首次显示时布局就是正确的
+            if rpa_only != (self._collect_mode == "rpa"):
+                card.setVisible(False)
+            setattr(self, attr, card)
+            content_layout.addWidget(card)
 
         content_layout.addStretch()
+        self._content_layout = content_layout
 
         scroll.setWidget(content_widget)
         main_layout.addWidget(scroll)
 
+    def _card_specs(self) -> tuple:
+        """配置卡片列表（按显示顺序）
+
+        Returns:
+            tuple: ((属性名, 创建方法, 是否 RPA 模式专用), ...)
+        """
+        return (
+            # 1. 日期设置卡片
+            ("date_card", self._create_date_card, False),
+            # 2. 敏感数据保存方式卡片
+            ("sensitive_data_mode_card", self._create_sensitive_data_mode_card, False),
+            # 3. 采集模式选择卡片
+            ("mode_card", self._create_mode_card, False),
+            # 4. API 模式配置卡片
+            ("api_config_card", self._create_api_config_card, False),
+            # 5. RPA 模式配置卡片（RPA 模式专用）
+            ("rpa_config_card", self._create_rpa_config_card, True),
+            # 6. 文本模型配置卡片（通用）
+            ("llm_config_card", self._create_llm_config_card, False),
+            # 7. 视觉模型配置卡片（RPA 模式专用）
+            ("vlm_config_card", self._create_vlm_config_card, True),
+            # 8. GUI 模板配置卡片（RPA 模式专用）
+            ("template_card", self._create_template_card, True),
+            # 9. 发布配置卡片（通用）
+            ("publish_card", self._create_publish_card, False),
+        )
+
+    @staticmethod
+    def _create_placeholder() -> QWidget:
+        """创建隐藏的占位控件（用于延迟创建的卡片）"""
+        placeholder = QWidget()
+        placeholder.setVisible(False)
+        return placeholder
+
+    def _build_rpa_cards(self) -> None:
+        """创建 RPA 模式专用卡片（仅在首次切换到 RPA 模式时执行一次）
+
+        用真实卡片替换占位控件，并加载对应配置、连接信号。
+        主题样式由面板级样式表统一下发，无需单独处理。
+        """
+        if self._rpa_cards_built:
+            return
+        self._rpa_cards_built = True
+
+        for attr, factory, rpa_only in self._card_specs():
+            if not rpa_only:
+                continue
+            placeholder = getattr(self, attr)
+            card = factory()
+            self._content_layout.replaceWidget(placeholder, card)
+            placeholder.deleteLater()
+            setattr(self, attr, card)
+
+        self._load_rpa_config()
+        self._saved_values.update(self._collect_rpa_values())
+        self._connect_rpa_signals()
+
     def update_theme(self, colors: Dict[str, str]):
-        """更新主题样式"""
+        """更新主题样式
+
+        面板内所有需要随主题变化的控件通过 objectName / 动态属性选择器统一声明，
+        主题切换时只需对面板调用一次 setStyleSheet，避免逐个控件重复触发样式计算。
+        生成的样式表按颜色缓存，颜色未变化时直接返回，不重复格式化与解析。
+        """
+        key = tuple(sorted(colors.items()))
+        if key == self._theme_key:
+            return
+        self._theme_key = key
         self._current_colors = colors
 
-        # 更新敏感数据保存方式卡片的样式
-        sensitive_mode_style = f"""
-            QFrame {{
+        css = self._theme_cache.get(key)
+        if css is None:
+            css = _LAYOUT_QSS + self._build_theme_stylesheet(colors)
+            self._theme_cache[key] = css
+        # 状态标签的颜色由样式表中的 status 属性选择器决定，无需逐个刷新
+        self.setStyleSheet(css)
+
+    def _build_theme_stylesheet(self, colors: Dict[str, str]) -> str:
+        """生成面板级主题样式表
+
+        选择器约定：
+        - QFrame[role="option"]：敏感数据保存方式、采集模式中的选项容器
+        - QLabel[role="hint"] / QLabel[role="warning_hint"]：提示文字
+        - QLabel[role="section_title"]：区块小标题
+        """
+        return f"""
+            QWidget#ConfigContent {{
+                background-color: {colors['content_bg']};
+            }}
+            QFrame[role="option"] {{
                 background-color: {colors['input_bg']};
                 border: 1px solid {colors['border_light']};
                 border-radius: {Sizes.RADIUS_MEDIUM}px;
             }}
-            QFrame:hover {{
+            QFrame[role="option"]:hover {{
                 background-color: {colors['input_bg_hover']};
                 border-color: {colors['primary']};
             }}
-            QRadioButton {{
+            QFrame[role="option"] QRadioButton {{
                 font-weight: bold;
-                font-size: {Fonts.SIZE_BODY}px;
+                {_QSS_FONT_BODY}
                 background-color: transparent;
                 border: none;
                 color: {colors['text_primary']};
                 padding: 4px;
             }}
-            QRadioButton::indicator {{
+            QFrame[role="option"] QRadioButton::indicator {{
                 width: 16px;
                 height: 16px;
                 border-radius: 9px;
                 border: 1px solid {colors['border']};
                 background-color: {colors['card_bg']};
             }}
-            QRadioButton::indicator:checked {{
+            QFrame[role="option"] QRadioButton::indicator:checked {{
                 border: 5px solid {colors['primary']};
                 background-color: {colors['card_bg']};
             }}
-            QRadioButton::indicator:hover {{
+            QFrame[role="option"] QRadioButton::indicator:hover {{
                 border-color: {colors['primary']};
             }}
-            QLabel {{
+            QFrame[role="option"] QLabel {{
                 color: {colors['text_secondary']};
-                font-size: {Fonts.SIZE_SMALL}px;
+                {_QSS_FONT_SMALL}
                 background-color: transparent;
                 border: none;
             }}
-        """
-        self.env_mode_container.setStyleSheet(sensitive_mode_style)
-        self.config_mode_container.setStyleSheet(sensitive_mode_style)
-
-        # 更新模式选择卡片的样式
-        option_style = f"""
-            QFrame {{
-                background-color: {colors['input_bg']};
-                border: 1px solid {colors['border_light']};
-                border-radius: {Sizes.RADIUS_MEDIUM}px;
-            }}
-            QFrame:hover {{
-                background-color: {colors['input_bg_hover']};
-                border-color: {colors['primary']};
+            QLabel[role="hint"] {{
+                color: {colors['text_hint']};
+                {_QSS_FONT_SMALL}
             }}
-            QRadioButton {{
-                font-weight: bold;
-                font-size: {Fonts.SIZE_BODY}px;
-                background-color: transparent;
-                border: none;
-                color: {colors['text_primary']};
-                padding: 4px;
+            QLabel[role="warning_hint"] {{
+                color: {colors['warning']};
+                {_QSS_FONT_SMALL}
             }}
-            QRadioButton::indicator {{
-                width: 16px;
-                height: 16px;
-                border-radius: 9px;
-                border: 1px solid {colors['border']};
-                background-color: {colors['card_bg']};
-            }}
-            QRadioButton::indicator:checked {{
-                border: 5px solid {colors['primary']};
-                background-color: {colors['card_bg']};
+            QLabel[status="success"] {{
+                color: {colors['success']};
             }}
-            QRadioButton::indicator:hover {{
-                border-color: {colors['primary']};
+            QLabel[status="warning"] {{
+                color: {colors['warning']};
             }}
-            QLabel {{
+            QLabel[role="section_title"] {{
+                font-weight: bold;
                 color: {colors['text_secondary']};
-                font-size: {Fonts.SIZE_SMALL}px;
-                background-color: transparent;
-                border: none;
+            }}
+            QLabel#cookieLabel {{
+                margin-top: 8px;
             }}
         """
-        self.api_container.setStyleSheet(option_style)
-        self.rpa_container.setStyleSheet(option_style)
-
-        # 更新其他可能需要手动更新颜色的控件
-        # 例如提示文字颜色
-        hint_style = f"color: {colors['text_hint']}; font-size: {Fonts.SIZE_SMALL}px;"
-        self.date_hint.setStyleSheet(hint_style)
-        self.priority_hint.setStyleSheet(hint_style)
-        self.token_hint.setStyleSheet(
-            f"color: {colors['warning']}; font-size: {Fonts.SIZE_SMALL}px;")
-        self.url_hint.setStyleSheet(hint_style)
-        self.vlm_hint.setStyleSheet(hint_style)
-        self.publish_hint.setStyleSheet(hint_style)
-
-        label_bold_style = f"font-weight: bold; color: {colors['text_secondary']};"
-        self.name_label.setStyleSheet(label_bold_style)
-        self.cookie_label.setStyleSheet(f"{label_bold_style} margin-top: 8px;")
-        self.api_title.setStyleSheet(label_bold_style)
-        self.model_title.setStyleSheet(label_bold_style)
-
-        # 刷新状态颜色
-        self._update_env_status()
-        self._update_wechat_credentials_status()
-        self._update_api_credentials_status()
 
     def _create_date_card(self) -> QGroupBox:
         """创建日期选择卡片
@@ -249,17 +352,17 @@ class ConfigPanel(QWidget):
         self.date_edit.setCalendarPopup(True)
         self.date_edit.setDate(QDate.currentDate())
         self.date_edit.setDisplayFormat("yyyy-MM-dd")
-        self.date_edit.setFixedWidth(140)
+        self.date_edit.setProperty("role", "date")
         rpa_layout.addWidget(self.date_edit)
 
         # RPA 模式快捷按钮
         self.btn_today_rpa = QPushButton("今天")
-        self.btn_today_rpa.setFixedWidth(80)
+        self.btn_today_rpa.setProperty("role", "quick_date")
         self.btn_today_rpa.clicked.connect(self._set_today_rpa)
         rpa_layout.addWidget(self.btn_today_rpa)
 
         self.btn_yesterday_rpa = QPushButton("昨天")
-        self.btn_yesterday_rpa.setFixedWidth(80)
+        self.btn_yesterday_rpa.setProperty("role", "quick_date")
         self.btn_yesterday_rpa.clicked.connect(self._set_yesterday_rpa)
         rpa_layout.addWidget(self.btn_yesterday_rpa)
 
@@ -281,13 +384,13 @@ class ConfigPanel(QWidget):
         self.start_date_edit.setCalendarPopup(True)
         self.start_date_edit.setDate(QDate.currentDate())
         self.start_date_edit.setDisplayFormat("yyyy-MM-dd")
-        self.start_date_edit.setFixedWidth(140)
+        self.start_date_edit.setProperty("role", "date")
         start_row.addWidget(self.start_date_edit)
 
         self.start_time_edit = QTimeEdit()
         self.start_time_edit.setDisplayFormat("HH:mm")
-        self.start_time_edit.setTime(QTime(0, 0))
-        self.start_time_edit.setFixedWidth(80)
+        self.start_time_edit.setTime(_DAY_START)
+        self.start_time_edit.setProperty("role", "time")
         start_row.addWidget(self.start_time_edit)
 
         start_row.addStretch()
@@ -302,13 +405,13 @@ class ConfigPanel(QWidget):
         self.end_date_edit.setCalendarPopup(True)
         self.end_date_edit.setDate(QDate.currentDate())
         self.end_date_edit.setDisplayFormat("yyyy-MM-dd")
-        self.end_date_edit.setFixedWidth(140)
+        self.end_date_edit.setProperty("role", "date")
         end_row.addWidget(self.end_date_edit)
 
         self.end_time_edit = QTimeEdit()
         self.end_time_edit.setDisplayFormat("HH:mm")
-        self.end_time_edit.setTime(QTime(23, 59))
-        self.end_time_edit.setFixedWidth(80)
+        self.end_time_edit.setTime(_DAY_END)
+        self.end_time_edit.setProperty("role", "time")
         end_row.addWidget(self.end_time_edit)
 
         end_row.addStretch()
@@ -319,12 +422,12 @@ class ConfigPanel(QWidget):
         quick_row.setSpacing(Sizes.MARGIN_MEDIUM)
 
         self.btn_today_api = QPushButton("今天全天")
-        self.btn_today_api.setFixedWidth(100)
+        self.btn_today_api.setProperty("role", "quick_range")
         self.btn_today_api.clicked.connect(self._set_today_api)
         quick_row.addWidget(self.btn_today_api)
 
         self.btn_yesterday_api = QPushButton("昨天全天")
-        self.btn_yesterday_api.setFixedWidth(100)
+        self.btn_yesterday_api.setProperty("role", "quick_range")
         self.btn_yesterday_api.clicked.connect(self._set_yesterday_api)
         quick_row.addWidget(self.btn_yesterday_api)
 
@@ -333,8 +436,15 @@ class ConfigPanel(QWidget):
 
         layout.addWidget(self.api_date_container)
 
+        # 构造时即按当前模式设置显隐，避免首次显示前再做一次布局
+        if self._collect_mode == "api":
+            self.rpa_date_container.setVisible(False)
+        else:
+            self.api_date_container.setVisible(False)
+
         # ==================== 提示信息 ====================
-        self.date_hint = QLabel("选择要采集文章的发布时间")
+        self.date_hint = QLabel(self.DATE_HINTS[self._collect_mode])
+        self.date_hint.setProperty("role", "hint")
         layout.addWidget(self.date_hint)
 
         group.setLayout(layout)
@@ -362,6 +472,7 @@ class ConfigPanel(QWidget):
 
         # --- 环境变量模式选项 ---
         self.env_mode_container = QFrame()
+        self.env_mode_container.setProperty("role", "option")
         env_mode_layout = QVBoxLayout(self.env_mode_container)
         env_mode_layout.setSpacing(6)
         env_mode_layout.setContentsMargins(16, 16, 16, 16)
@@ -385,6 +496,7 @@ class ConfigPanel(QWidget):
 
         # --- 配置文件模式选项 ---
         self.config_mode_container = QFrame()
+        self.config_mode_container.setProperty("role", "option")
         config_mode_layout = QVBoxLayout(self.config_mode_container)
         config_mode_layout.setSpacing(6)
         config_mode_layout.setContentsMargins(16, 16, 16, 16)
@@ -412,7 +524,7 @@ class ConfigPanel(QWidget):
             "💡 配置优先级（从高到低）：config.yaml > .env 文件 > 系统环境变量"
         )
         priority_hint.setWordWrap(True)
-        # 样式将在 update_theme 中设置
+        priority_hint.setProperty("role", "hint")
         layout.addWidget(priority_hint)
         self.priority_hint = priority_hint
 
@@ -444,7 +556,7 @@ class ConfigPanel(QWidget):
 
         # --- API 模式选项 ---
         self.api_container = QFrame()
-        # 样式将在 update_theme 中设置
+        self.api_container.setProperty("role", "option")
         api_layout = QVBoxLayout(self.api_container)
         api_layout.setSpacing(6)
         api_layout.setContentsMargins(16, 16, 16, 16)
@@ -465,7 +577,7 @@ class ConfigPanel(QWidget):
 
         # --- RPA 模式选项 ---
         self.rpa_container = QFrame()
-        # 样式将在 update_theme 中设置
+        self.rpa_container.setProperty("role", "option")
         rpa_layout = QVBoxLayout(self.rpa_container)
         rpa_layout.setSpacing(6)
         rpa_layout.setContentsMargins(16, 16, 16, 16)
@@ -494,7 +606,7 @@ class ConfigPanel(QWidget):
 
         # ==================== 公众号名称列表 ====================
         self.name_label = QLabel("公众号名称列表：")
-        # 样式将在 update_theme 中设置
+        self.name_label.setProperty("role", "section_title")
         layout.addWidget(self.name_label)
 
         # 工具栏
@@ -521,6 +633,9 @@ class ConfigPanel(QWidget):
         self.account_list = QListWidget()
         self.account_list.setSelectionMode(
             QListWidget.SelectionMode.ExtendedSelection)
+        self.account_list.setUniformItemSizes(True)
+        self.account_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.account_list.setBatchSize(50)
         self.account_list.setMinimumHeight(80)
         self.account_list.setMaximumHeight(120)
         layout.addWidget(self.account_list)
@@ -528,7 +643,7 @@ class ConfigPanel(QWidget):
         # ==================== Token ====================
         token_layout = QHBoxLayout()
         token_label = QLabel("Token:")
-        token_label.setFixedWidth(60)
+        token_label.setProperty("role", "field_label")
         token_layout.addWidget(token_label)
 
         self.token_input = QLineEdit()
@@ -537,9 +652,8 @@ class ConfigPanel(QWidget):
 
         # Token 状态标签
         self.token_status_label = QLabel()
-        self.token_status_label.setStyleSheet(
-            f"font-size: {Fonts.SIZE_SMALL}px;")
-        self.token_status_label.setFixedWidth(100)
+        self.token_status_label.setProperty("status", "none")
+        self.token_status_label.setObjectName("tokenStatusLabel")
         token_layout.addWidget(self.token_status_label)
 
         layout.addLayout(token_layout)
@@ -547,15 +661,15 @@ class ConfigPanel(QWidget):
         # ==================== Cookie ====================
         cookie_header_layout = QHBoxLayout()
         self.cookie_label = QLabel("Cookie:")
-        # 样式将在 update_theme 中设置
+        self.cookie_label.setObjectName("cookieLabel")
+        self.cookie_label.setProperty("role", "section_title")
         cookie_header_layout.addWidget(self.cookie_label)
 
         cookie_header_layout.addStretch()
 
         # Cookie 状态标签
         self.cookie_status_label = QLabel()
-        self.cookie_status_label.setStyleSheet(
-            f"font-size: {Fonts.SIZE_SMALL}px;")
+        self.cookie_status_label.setProperty("status", "none")
         cookie_header_layout.addWidget(self.cookie_status_label)
 
         layout.addLayout(cookie_header_layout)
@@ -571,7 +685,7 @@ class ConfigPanel(QWidget):
             "⚠️ Cookie 和 Token 会过期，需定期从公众平台后台 (mp.weixin.qq.com) 获取更新\n"
             "💡 配置优先级：界面输入 > config.yaml > 环境变量 (WECHAT_API_TOKEN/WECHAT_API_COOKIE)")
         self.token_hint.setWordWrap(True)
-        # 样式将在 update_theme 中设置
+        self.token_hint.setProperty("role", "warning_hint")
         layout.addWidget(self.token_hint)
 
         group.setLayout(layout)
@@ -607,13 +721,16 @@ class ConfigPanel(QWidget):
         self.url_list = QListWidget()
         self.url_list.setSelectionMode(
             QListWidget.SelectionMode.ExtendedSelection)
+        self.url_list.setUniformItemSizes(True)
+        self.url_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.url_list.setBatchSize(50)
         self.url_list.setMinimumHeight(120)
         self.url_list.setMaximumHeight(200)
         layout.addWidget(self.url_list)
 
         # 提示
         self.url_hint = QLabel("💡 每个公众号仅需提供一篇近期文章链接，系统将自动定位该公众号。")
-        # 样式将在 update_theme 中设置
+        self.url_hint.setProperty("role", "hint")
         layout.addWidget(self.url_hint)
 
         group.setLayout(layout)
@@ -630,7 +747,7 @@ class ConfigPanel(QWidget):
         api_layout.setSpacing(Sizes.MARGIN_SMALL)
 
         self.api_title = QLabel("API Key 设置")
-        # 样式将在 update_theme 中设置
+        self.api_title.setProperty("role", "section_title")
         api_layout.addWidget(self.api_title)
 
         # 输入框
@@ -642,22 +759,20 @@ class ConfigPanel(QWidget):
         # 显示切换
         hbox = QHBoxLayout()
         self.chk_show_key = QCheckBox("显示 Key")
-        self.chk_show_key.stateChanged.connect(self._toggle_api_key_visibility)
+        self.chk_show_key.toggled.connect(self._set_api_key_visible)
         hbox.addWidget(self.chk_show_key)
         hbox.addStretch()
         api_layout.addLayout(hbox)
 
         # 来源状态显示（只读，由全局敏感数据保存方式统一控制）
         self.env_status_label = QLabel()
-        self.env_status_label.setStyleSheet(
-            f"font-size: {Fonts.SIZE_SMALL}px;")
+        self.env_status_label.setProperty("status", "none")
         api_layout.addWidget(self.env_status_label)
-        self._update_env_status()
 
         # 提示信息
         hint = QLabel("💡 保存方式由上方「敏感数据保存方式」统一控制")
         hint.setWordWrap(True)
-        hint.setStyleSheet(f"color: gray; font-size: {Fonts.SIZE_SMALL}px;")
+        hint.setProperty("role", "hint")
         api_layout.addWidget(hint)
 
         api_layout.addStretch()
@@ -671,36 +786,38 @@ class ConfigPanel(QWidget):
         main_layout.addWidget(line)
 
         # ==================== 右侧：LLM 参数 ====================
-        model_layout = QGridLayout()
-        model_layout.setVerticalSpacing(Sizes.MARGIN_SMALL)
-        model_layout.setHorizontalSpacing(Sizes.MARGIN_MEDIUM)
+        model_layout = QVBoxLayout()
+        model_layout.setSpacing(Sizes.MARGIN_SMALL)
 
         # 标题
         self.model_title = QLabel("LLM 参数设置")
-        # 样式将在 update_theme 中设置
-        model_layout.addWidget(self.model_title, 0, 0, 1, 2)
+        self.model_title.setProperty("role", "section_title")
+        model_layout.addWidget(self.model_title)
+
+        form = QFormLayout()
+        form.setVerticalSpacing(Sizes.MARGIN_SMALL)
+        form.setHorizontalSpacing(Sizes.MARGIN_MEDIUM)
 
         # LLM 模型
-        model_layout.addWidget(QLabel("文本模型:"), 1, 0)
         self.llm_model_combo = QComboBox()
         self.llm_model_combo.addItems(
             ["qwen-plus", "qwen3-max"])
-        model_layout.addWidget(self.llm_model_combo, 1, 1)
+        form.addRow("文本模型:", self.llm_model_combo)
 
         # Thinking
-        model_layout.addWidget(QLabel("思考模式:"), 2, 0)
         self.chk_enable_thinking = QCheckBox("启用")
-        model_layout.addWidget(self.chk_enable_thinking, 2, 1)
+        form.addRow("思考模式:", self.chk_enable_thinking)
 
-        model_layout.addWidget(QLabel("思考预算:"), 3, 0)
         self.thinking_budget_spin = QSpinBox()
         self.thinking_budget_spin.setRange(256, 8192)
         self.thinking_budget_spin.setSingleStep(256)
         self.thinking_budget_spin.setSuffix(" tokens")
-        model_layout.addWidget(self.thinking_budget_spin, 3, 1)
+        form.addRow("思考预算:", self.thinking_budget_spin)
+
+        model_layout.addLayout(form)
 
         # 底部填充
-        model_layout.setRowStretch(4, 1)
+        model_layout.addStretch()
 
         main_layout.addLayout(model_layout, 1)
 
@@ -710,21 +827,20 @@ class ConfigPanel(QWidget):
     def _create_vlm_config_card(self) -> QGroupBox:
         """创建视觉模型配置卡片（RPA 模式专用）"""
         group = QGroupBox("👁️ 视觉模型配置 (RPA 模式专用)")
-        layout = QGridLayout()
+        layout = QFormLayout()
         layout.setVerticalSpacing(Sizes.MARGIN_SMALL)
         layout.setHorizontalSpacing(Sizes.MARGIN_MEDIUM)
 
         # VLM 模型
-        layout.addWidget(QLabel("视觉模型:"), 0, 0)
         self.vlm_model_combo = QComboBox()
         self.vlm_model_combo.addItems(
             ["qwen3-vl-plus", "qwen-vl-max", "qwen-vl-plus"])
-        layout.addWidget(self.vlm_model_combo, 0, 1)
+        layout.addRow("视觉模型:", self.vlm_model_combo)
 
-        # 提示
+        # 提示（跨两列）
         self.vlm_hint = QLabel("💡 视觉模型用于识别公众号页面中的文章日期位置")
-        # 样式将在 update_theme 中设置
-        layout.addWidget(self.vlm_hint, 1, 0, 1, 2)
+        self.vlm_hint.setProperty("role", "hint")
+        layout.addRow(self.vlm_hint)
 
         group.setLayout(layout)
         return group
@@ -732,32 +848,30 @@ class ConfigPanel(QWidget):
     def _create_template_card(self) -> QGroupBox:
         """创建 GUI 模板配置卡片（RPA 模式专用）"""
         group = QGroupBox("🖼️ GUI 模板配置 (RPA 模式专用)")
-        layout = QGridLayout()
+        layout = QFormLayout()
         layout.setVerticalSpacing(Sizes.MARGIN_SMALL)
 
-        templates = [
-            ("search_website", "访问网页按钮"),
-            ("three_dots", "菜单按钮"),
-            ("turnback", "返回按钮")
-        ]
-
         self.template_inputs = {}
 
-        for i, (key, label_text) in enumerate(templates):
-            layout.addWidget(QLabel(label_text + ":"), i, 0)
+        for key, label_text in self.GUI_TEMPLATES:
+            row_layout = QHBoxLayout()
+            row_layout.setSpacing(Sizes.MARGIN_SMALL)
 
             input_field = QLineEdit()
             input_field.setReadOnly(True)
             input_field.setPlaceholderText("默认路径")
             self.template_inputs[key] = input_field
-            layout.addWidget(input_field, i, 1)
+            row_layout.addWidget(input_field)
 
+            # 所有浏览按钮共用一个槽函数，通过 tpl_key 属性区分模板
             btn = QPushButton("浏览")
-            btn.setFixedWidth(60)
+            btn.setProperty("role", "browse")
             btn.setProperty("ghost", True)
-            btn.clicked.connect(
-                lambda checked, k=key: self._browse_template(k))
-            layout.addWidget(btn, i, 2)
+            btn.setProperty("tpl_key", key)
+            btn.clicked.connect(self._on_browse_template_clicked)
+            row_layout.addWidget(btn)
+
+            layout.addRow(label_text + ":", row_layout)
 
         group.setLayout(layout)
         return group
@@ -765,25 +879,22 @@ class ConfigPanel(QWidget):
     def _create_publish_card(self) -> QGroupBox:
         """创建发布配置卡片"""
         group = QGroupBox("📤 发布配置")
-        layout = QGridLayout()
+        layout = QFormLayout()
         layout.setVerticalSpacing(Sizes.MARGIN_SMALL)
         layout.setHorizontalSpacing(Sizes.MARGIN_MEDIUM)
 
-        row = 0
-
-        # AppID
-        layout.addWidget(QLabel("AppID:"), row, 0)
+        # AppID（输入框 + 来源状态）
+        appid_layout = QHBoxLayout()
+        appid_layout.setSpacing(Sizes.MARGIN_MEDIUM)
         self.appid_input = QLineEdit()
         self.appid_input.setPlaceholderText("留空则从环境变量读取")
-        layout.addWidget(self.appid_input, row, 1)
+        appid_layout.addWidget(self.appid_input)
         self.appid_status_label = QLabel()
-        self.appid_status_label.setStyleSheet(
-            f"font-size: {Fonts.SIZE_SMALL}px;")
-        layout.addWidget(self.appid_status_label, row, 2)
-        row += 1
+        self.appid_status_label.setProperty("status", "none")
+        appid_layout.addWidget(self.appid_status_label)
+        layout.addRow("AppID:", appid_layout)
 
-        # AppSecret
-        layout.addWidget(QLabel("AppSecret:"), row, 0)
+        # AppSecret（输入框 + 显示切换 + 来源状态）
         secret_layout = QHBoxLayout()
         secret_layout.setSpacing(Sizes.MARGIN_SMALL)
         self.appsecret_input = QLineEdit()
@@ -791,25 +902,19 @@ class ConfigPanel(QWidget):
         self.appsecret_input.setPlaceholderText("留空则从环境变量读取")
         secret_layout.addWidget(self.appsecret_input)
         self.chk_show_secret = QCheckBox("显示")
-        self.chk_show_secret.stateChanged.connect(
-            self._toggle_appsecret_visibility)
+        self.chk_show_secret.toggled.connect(self._set_appsecret_visible)
         secret_layout.addWidget(self.chk_show_secret)
-        layout.addLayout(secret_layout, row, 1)
         self.appsecret_status_label = QLabel()
-        self.appsecret_status_label.setStyleSheet(
-            f"font-size: {Fonts.SIZE_SMALL}px;")
-        layout.addWidget(self.appsecret_status_label, row, 2)
-        row += 1
+        self.appsecret_status_label.setProperty("status", "none")
+        secret_layout.addWidget(self.appsecret_status_label)
+        layout.addRow("AppSecret:", secret_layout)
 
         # 作者名
-        layout.addWidget(QLabel("作者名:"), row, 0)
         self.author_input = QLineEdit()
         self.author_input.setPlaceholderText("公众号文章作者名")
-        layout.addWidget(self.author_input, row, 1)
-        row += 1
+        layout.addRow("作者名:", self.author_input)
 
         # 封面图片
-        layout.addWidget(QLabel("封面图片:"), row, 0)
         cover_layout = QHBoxLayout()
         cover_layout.setSpacing(Sizes.MARGIN_SMALL)
         self.cover_path_input = QLineEdit()
@@ -817,64 +922,70 @@ class ConfigPanel(QWidget):
         self.cover_path_input.setReadOnly(True)
         cover_layout.addWidget(self.cover_path_input)
         self.btn_browse_cover = QPushButton("浏览")
-        self.btn_browse_cover.setFixedWidth(60)
+        self.btn_browse_cover.setProperty("role", "browse")
         self.btn_browse_cover.setProperty("ghost", True)
         self.btn_browse_cover.clicked.connect(self._browse_cover_image)
         cover_layout.addWidget(self.btn_browse_cover)
-        layout.addLayout(cover_layout, row, 1, 1, 2)
-        row += 1
+        layout.addRow("封面图片:", cover_layout)
 
         # 默认标题
-        layout.addWidget(QLabel("默认标题:"), row, 0)
         self.publish_title_input = QLineEdit()
         self.publish_title_input.setPlaceholderText("留空则自动生成")
-        layout.addWidget(self.publish_title_input, row, 1, 1, 2)
-        row += 1
+        layout.addRow("默认标题:", self.publish_title_input)
 
         # 摘要描述
-        layout.addWidget(QLabel("摘要描述:"), row, 0)
         self.publish_digest_input = QLineEdit()
         self.publish_digest_input.setPlaceholderText("公众号文章摘要描述")
-        layout.addWidget(self.publish_digest_input, row, 1, 1, 2)
-        row += 1
+        layout.addRow("摘要描述:", self.publish_digest_input)
 
-        # 提示信息
+        # 提示信息（跨两列）
         self.publish_hint = QLabel("💡 凭证优先读取配置文件，为空时从环境变量读取")
-        # 样式将在 update_theme 中设置
-        layout.addWidget(self.publish_hint, row, 0, 1, 3)
+        self.publish_hint.setProperty("role", "hint")
+        layout.addRow(self.publish_hint)
 
         group.setLayout(layout)
         return group
 
     # ==================== 模式切换逻辑 ====================
 
-    def _on_mode_changed(self) -> None:
-        """模式切换时更新界面显隐"""
-        if self.radio_api_mode.isChecked():
-            self._collect_mode = "api"
-            # 显示 API 配置，隐藏 RPA 配置
-            self.api_config_card.setVisible(True)
-            self.rpa_config_card.setVisible(False)
-            self.vlm_config_card.setVisible(False)
-            self.template_card.setVisible(False)
-            # 显示时间范围选择，隐藏单日期选择
-            self.api_date_container.setVisible(True)
-            self.rpa_date_container.setVisible(False)
-            self.date_hint.setText("选择要采集文章的发布时间范围（精确到分钟）")
-        else:
-            self._collect_mode = "rpa"
-            # 显示 RPA 配置，隐藏 API 配置
-            self.api_config_card.setVisible(False)
-            self.rpa_config_card.setVisible(True)
-            self.vlm_config_card.setVisible(True)
-            self.template_card.setVisible(True)
-            # 显示单日期选择，隐藏时间范围选择
-            self.api_date_container.setVisible(False)
-            self.rpa_date_container.setVisible(True)
-            self.date_hint.setText("选择要采集文章的发布日期（精确到天）")
+    def _on_mode_changed(self, *_args) -> None:
+        """模式切换时更新界面显隐（模式未变化时直接返回）
 
+        buttonClicked 传入的按钮参数不需要，模式直接从单选框状态读取。
+        """
+        new_mode = "api" if self.radio_api_mode.isChecked() else "rpa"
+        if new_mode == self._collect_mode:
+            return
+        self._collect_mode = new_mode
+        self._apply_mode(new_mode)
         self._on_config_changed()
 
+    def _apply_mode(self, mode: str) -> None:
+        """根据采集模式切换卡片和日期控件的显隐
+
+        Args:
+            mode: 'api' 或 'rpa'
+        """
+        is_api = mode == "api"
+        if not is_api:
+            # 首次进入 RPA 模式时创建 RPA 专用卡片
+            self._build_rpa_cards()
+
+        # 暂停重绘，多个控件显隐变化合并为一次布局和绘制
+        self.setUpdatesEnabled(False)
+        try:
+            # API 配置与 RPA 配置互斥显示
+            self.api_config_card.setVisible(is_api)
+            self.rpa_config_card.setVisible(not is_api)
+            self.vlm_config_card.setVisible(not is_api)
+            self.template_card.setVisible(not is_api)
+            # API 模式显示时间范围选择，RPA 模式显示单日期选择
+            self.api_date_container.setVisible(is_api)
+            self.rpa_date_container.setVisible(not is_api)
+            self.date_hint.setText(self.DATE_HINTS[mode])
+        finally:
+            self.setUpdatesEnabled(True)
+
     def get_collect_mode(self) -> str:
         """获取当前选择的采集模式
 
@@ -887,124 +998,91 @@ class ConfigPanel(QWidget):
 
     def _update_env_status(self) -> None:
         """更新 API Key 状态显示"""
-        colors = self._current_colors
-        if not colors:  # 尚未初始化，使用默认颜色
-            colors = {'success': '#52c41a', 'warning': '#faad14'}
-
         # 使用 get_api_key_with_source() 检测所有来源
-        _, api_key_source = self.config_manager.get_api_key_with_source()
-
-        if api_key_source == 'config':
-            self.env_status_label.setText("✓ 来自 config.yaml")
-            self.env_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif api_key_source == 'env_file':
-            self.env_status_label.setText("✓ 来自 .env 文件")
-            self.env_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif api_key_source == 'system':
-            self.env_status_label.setText("✓ 来自系统环境变量")
-            self.env_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        else:
-            self.env_status_label.setText("⚠️ 未配置")
-            self.env_status_label.setStyleSheet(
-                f"color: {colors['warning']}; font-size: {Fonts.SIZE_SMALL}px;")
+        _, api_key_source = self._cached_source('api_key')
+        self._apply_source_status(self.env_status_label, api_key_source)
 
     def _update_wechat_credentials_status(self) -> None:
-        """更新微信凭证状态显示"""
-        colors = self._current_colors
-        if not colors:  # 尚未初始化，使用默认颜色
-            colors = {'success': '#52c41a', 'warning': '#faad14'}
-
-        # 更新 AppID 状态
-        _, appid_source = self.config_manager.get_wechat_appid()
-        if appid_source == 'config':
-            self.appid_status_label.setText("✓ 来自 config.yaml")
-            self.appid_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif appid_source == 'env_file':
-            self.appid_status_label.setText("✓ 来自 .env 文件")
-            self.appid_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif appid_source == 'system':
-            self.appid_status_label.setText("✓ 来自系统环境变量")
-            self.appid_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        else:
-            self.appid_status_label.setText("⚠️ 未配置")
-            self.appid_status_label.setStyleSheet(
-                f"color: {colors['warning']}; font-size: {Fonts.SIZE_SMALL}px;")
-
-        # 更新 AppSecret 状态
-        _, appsecret_source = self.config_manager.get_wechat_appsecret()
-        if appsecret_source == 'config':
-            self.appsecret_status_label.setText("✓ 来自 config.yaml")
-            self.appsecret_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif appsecret_source == 'env_file':
-            self.appsecret_status_label.setText("✓ 来自 .env 文件")
-            self.appsecret_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif appsecret_source == 'system':
-            self.appsecret_status_label.setText("✓ 来自系统环境变量")
-            self.appsecret_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        else:
-            self.appsecret_status_label.setText("⚠️ 未配置")
-            self.appsecret_status_label.setStyleSheet(
-                f"color: {colors['warning']}; font-size: {Fonts.SIZE_SMALL}px;")
+        """更新微信凭证状态显示（AppID/AppSecret）"""
+        self._update_source_labels((
+            (self.appid_status_label, 'appid'),
+            (self.appsecret_status_label, 'appsecret'),
+        ))
 
     def _update_api_credentials_status(self) -> None:
         """更新 API 模式凭证状态显示（Token/Cookie）"""
-        colors = self._current_colors
-        if not colors:  # 尚未初始化，使用默认颜色
-            colors = {'success': '#52c41a', 'warning': '#faad14'}
-
-        # 更新 Token 状态
-        _, token_source = self.config_manager.get_api_token_with_source()
-        if token_source == 'config':
-            self.token_status_label.setText("✓ 来自 config.yaml")
-            self.token_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif token_source == 'env_file':
-            self.token_status_label.setText("✓ 来自 .env 文件")
-            self.token_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif token_source == 'system':
-            self.token_status_label.setText("✓ 来自系统环境变量")
-            self.token_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        else:
-            self.token_status_label.setText("⚠️ 未配置")
-            self.token_status_label.setStyleSheet(
-                f"color: {colors['warning']}; font-size: {Fonts.SIZE_SMALL}px;")
-
-        # 更新 Cookie 状态
-        _, cookie_source = self.config_manager.get_api_cookie_with_source()
-        if cookie_source == 'config':
-            self.cookie_status_label.setText("✓ 来自 config.yaml")
-            self.cookie_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif cookie_source == 'env_file':
-            self.cookie_status_label.setText("✓ 来自 .env 文件")
-            self.cookie_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        elif cookie_source == 'system':
-            self.cookie_status_label.setText("✓ 来自系统环境变量")
-            self.cookie_status_label.setStyleSheet(
-                f"color: {colors['success']}; font-size: {Fonts.SIZE_SMALL}px;")
-        else:
-            self.cookie_status_label.setText("⚠️ 未配置")
-            self.cookie_status_label.setStyleSheet(
-                f"color: {colors['warning']}; font-size: {Fonts.SIZE_SMALL}px;")
+        self._update_source_labels((
+            (self.token_status_label, 'api_token'),
+            (self.cookie_status_label, 'api_cookie'),
+        ))
+
+    def _update_source_labels(self, pairs) -> None:
+        """批量刷新状态标签
+
+        Args:
+            pairs: ((状态标签, 敏感数据键), ...)
+        """
+        for label, key in pairs:
+            _, source = self._cached_source(key)
+            self._apply_source_status(label, source)
+
+    def _cached_source(self, key: str) -> tuple:
+        """获取敏感数据的值及来源（带缓存，避免重复读取 .env 文件和环境变量）
+
+        Args:
+            key: 'api_key' | 'appid' | 'appsecret' | 'api_token' | 'api_cookie'
+
+        Returns:
+            tuple: (值, 来源)
+        """
+        if key not in self._source_cache:
+            getter = {
+                'api_key': self.config_manager.get_api_key_with_source,
+                'appid': self.config_manager.get_wechat_appid,
+                'appsecret': self.config_manager.get_wechat_appsecret,
+                'api_token': self.config_manager.get_api_token_with_source,
+                'api_cookie': self.config_manager.get_api_cookie_with_source,
+            }[key]
+            self._source_cache[key] = getter()
+        return self._source_cache[key]
+
+    def invalidate_source_cache(self) -> None:
+        """清空敏感数据来源缓存（配置保存后调用）"""
+        self._source_cache.clear()
+
+    def _apply_source_status(self, label: QLabel, source: str) -> None:
+        """根据配置来源更新状态标签的文字和颜色
+
+        Args:
+            label: 状态标签
+            source: 来源，'config' | 'env_file' | 'system' | 'not_set'
+        """
+        if source not in _SOURCE_TEXT:
+            source = None
+        label.setText(_SOURCE_TEXT[source])
+        self._set_status(label, "success" if source else "warning")
+
+    @staticmethod
+    def _set_status(label: QLabel, status: str) -> None:
+        """切换状态标签的 status 属性，颜色由面板样式表中的选择器决定
+
+        Args:
+            label: 状态标签
+            status: 'success' | 'warning' | 'none'
+        """
+        if label.property("status") == status:
+            return
+        label.setProperty("status", status)
+        # 动态属性变化后需要重新 polish，选择器才会重新匹配
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     # ==================== 信号连接 ====================
 
     def _connect_signals(self) -> None:
         """连接所有信号"""
         # 模式切换
-        self.mode_group.buttonClicked.connect(lambda: self._on_mode_changed())
+        self.mode_group.buttonClicked.connect(self._on_mode_changed)
 
         # RPA 模式日期
         self.date_edit.dateChanged.connect(self._on_config_changed)
@@ -1020,15 +1098,10 @@ class ConfigPanel(QWidget):
         self.token_input.textChanged.connect(self._on_config_changed)
         self.cookie_input.textChanged.connect(self._on_config_changed)
 
-        # RPA 模式配置
-        self.url_list.itemChanged.connect(self._on_config_changed)
-
         # 模型配置
         self.api_key_input.textChanged.connect(self._on_config_changed)
         self.llm_model_combo.currentTextChanged.connect(
             self._on_config_changed)
-        self.vlm_model_combo.currentTextChanged.connect(
-            self._on_config_changed)
         self.chk_enable_thinking.stateChanged.connect(
             self._on_thinking_state_changed)
         self.thinking_budget_spin.valueChanged.connect(self._on_config_changed)
@@ -1040,20 +1113,78 @@ class ConfigPanel(QWidget):
         self.publish_title_input.textChanged.connect(self._on_config_changed)
         self.publish_digest_input.textChanged.connect(self._on_config_changed)
 
+        # RPA 模式专用卡片（已创建时）
+        if self._rpa_cards_built:
+            self._connect_rpa_signals()
+
+    def _connect_rpa_signals(self) -> None:
+        """连接 RPA 模式专用卡片的信号（卡片创建后调用）"""
+        self.url_list.itemChanged.connect(self._on_config_changed)
+        self.vlm_model_combo.currentTextChanged.connect(
+            self._on_config_changed)
+
     def _on_thinking_state_changed(self, state: int) -> None:
         """思考模式状态变化"""
-        enabled = state == Qt.CheckState.Checked.value
-        self.thinking_budget_spin.setEnabled(enabled)
+        enabled = state == self._CHECKED
+        self._updating = True
+        try:
+            self.thinking_budget_spin.setEnabled(enabled)
+        finally:
+            self._updating = False
         self._on_config_changed()
 
     def _on_config_changed(self) -> None:
-        """配置变化时发出信号"""
-        self.config_changed.emit()
+        """配置变化时发出信号（经防抖定时器合并连续的修改）"""
+        if self._updating:
+            return
+        self._cfg_timer.start()
 
     # ==================== 配置加载与保存 ====================
 
     def _load_config(self) -> None:
-        """从配置管理器加载配置"""
+        """从配置管理器加载配置
+
+        程序化填充期间屏蔽面板及各输入控件的信号，避免每次 setText/setValue
+        都派发一次配置变化通知。
+        """
+        widgets = [self, *self._tracked_inputs()]
+        was_blocked = [w.blockSignals(True) for w in widgets]
+        self._updating = True
+        try:
+            self._fill_from_config()
+        finally:
+            for widget, blocked in zip(widgets, was_blocked):
+                widget.blockSignals(blocked)
+            self._updating = False
+            self._cfg_timer.stop()
+        self._saved_values = self._collect_values()
+        self._saved_values.update(self._stored_date_values())
+
+    def _tracked_inputs(self) -> list:
+        """返回连接了配置变化通知的输入控件"""
+        widgets = [
+            self.date_edit,
+            self.start_date_edit, self.start_time_edit,
+            self.end_date_edit, self.end_time_edit,
+            self.account_list, self.token_input, self.cookie_input,
+            self.api_key_input, self.llm_model_combo,
+            self.chk_enable_thinking, self.thinking_budget_spin,
+            self.appid_input, self.appsecret_input, self.author_input,
+            self.publish_title_input, self.publish_digest_input,
+        ]
+        if self._rpa_cards_built:
+            widgets += [self.url_list, self.vlm_model_combo]
+        return widgets
+
+    def _fill_from_config(self) -> None:
+        """将配置管理器中的配置填充到各控件
+
+        敏感数据通过 _cached_source() 读取，读取结果同时供后面的状态标签刷新复用，
+        每个来源在一次加载中只检测一次。
+        """
+        # 重新加载时来源可能已变化，先清空缓存
+        self.invalidate_source_cache()
+
         # RPA 模式日期
         target_date = self.config_manager.get_target_date()
         self._set_date_from_config(target_date)
@@ -1065,26 +1196,19 @@ class ConfigPanel(QWidget):
 
         # API 模式配置
         account_names = self.config_manager.get_account_names()
-        self.account_list.clear()
-        for name in account_names:
-            self.account_list.addItem(name)
+        self._account_name_set = self._bulk_fill(
+            self.account_list, account_names)
 
         # Token - 自动从各来源读取（包括系统环境变量）
-        token, token_source = self.config_manager.get_api_token_with_source()
+        token, token_source = self._cached_source('api_token')
         self.token_input.setText(token or "")
 
         # Cookie - 自动从各来源读取（包括系统环境变量）
-        cookie, cookie_source = self.config_manager.get_api_cookie_with_source()
+        cookie, cookie_source = self._cached_source('api_cookie')
         self.cookie_input.setPlainText(cookie or "")
 
-        # RPA 模式配置
-        urls = self.config_manager.get_article_urls()
-        self.url_list.clear()
-        for url in urls:
-            self.url_list.addItem(url)
-
         # API Key - 自动从各来源读取（包括系统环境变量）
-        api_key, api_key_source = self.config_manager.get_api_key_with_source()
+        api_key, api_key_source = self._cached_source('api_key')
         self.api_key_input.setText(api_key or "")
 
         # 根据任一敏感数据的来源，推断用户上次使用的保存方式
@@ -1101,27 +1225,17 @@ class ConfigPanel(QWidget):
         if (index := self.llm_model_combo.findText(llm_model)) >= 0:
             self.llm_model_combo.setCurrentIndex(index)
 
-        vlm_model = self.config_manager.get_vlm_model()
-        if (index := self.vlm_model_combo.findText(vlm_model)) >= 0:
-            self.vlm_model_combo.setCurrentIndex(index)
-
         enable_thinking = self.config_manager.get_enable_thinking()
         self.chk_enable_thinking.setChecked(enable_thinking)
         self.thinking_budget_spin.setEnabled(enable_thinking)
         self.thinking_budget_spin.setValue(
             self.config_manager.get_thinking_budget())
 
-        # GUI 模板配置
-        gui_config = self.config_manager.get_gui_config()
-        for key, input_field in self.template_inputs.items():
-            if key in gui_config:
-                input_field.setText(gui_config[key])
-
         # 发布配置 - 敏感数据（自动从各来源读取，包括系统环境变量）
-        appid, appid_source = self.config_manager.get_wechat_appid()
+        appid, _ = self._cached_source('appid')
         self.appid_input.setText(appid or "")
 
-        appsecret, appsecret_source = self.config_manager.get_wechat_appsecret()
+        appsecret, _ = self._cached_source('appsecret')
         self.appsecret_input.setText(appsecret or "")
 
         # 非敏感配置直接从 config.yaml 读取
@@ -1135,10 +1249,48 @@ class ConfigPanel(QWidget):
         self.publish_digest_input.setText(
             self.config_manager.get_publish_digest())
 
-        # 更新状态显示
+        # RPA 模式配置（卡片已创建时才需要加载）
+        if self._rpa_cards_built:
+            self._load_rpa_config()
+
+        # 更新状态显示（直接使用上面已缓存的来源）
+        self._update_env_status()
         self._update_wechat_credentials_status()
         self._update_api_credentials_status()
 
+    @staticmethod
+    def _bulk_fill(list_widget: QListWidget, items) -> set:
+        """批量填充列表（暂停重绘和信号，一次性添加所有条目）
+
+        Returns:
+            set: 填充后的条目集合，供查重使用
+        """
+        items = list(items)
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            list_widget.addItems(items)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+        return set(items)
+
+    def _load_rpa_config(self) -> None:
+        """加载 RPA 模式专用卡片的配置（文章链接、视觉模型、GUI 模板）"""
+        urls = self.config_manager.get_article_urls()
+        self._url_set = self._bulk_fill(self.url_list, urls)
+
+        vlm_model = self.config_manager.get_vlm_model()
+        if (index := self.vlm_model_combo.findText(vlm_model)) >= 0:
+            self.vlm_model_combo.setCurrentIndex(index)
+
+        # GUI 模板配置
+        gui_config = self.config_manager.get_gui_config()
+        for key, input_field in self.template_inputs.items():
+            if key in gui_config:
+                input_field.setText(gui_config[key])
+
     def _set_date_from_config(self, target_date) -> None:
         """从配置设置日期
 
@@ -1153,20 +1305,16 @@ class ConfigPanel(QWidget):
             self.date_edit.setDate(QDate.currentDate())
         elif target_date == "yesterday":
             self.date_edit.setDate(QDate.currentDate().addDays(-1))
-        elif isinstance(target_date, datetime):
-            # YAML 解析器可能返回 datetime 对象
-            self.date_edit.setDate(
-                QDate(target_date.year, target_date.month, target_date.day))
         elif isinstance(target_date, date):
-            # YAML 解析器可能返回 date 对象
+            # YAML 解析器可能返回 date 或 datetime 对象（datetime 是 date 的子类）
             self.date_edit.setDate(
                 QDate(target_date.year, target_date.month, target_date.day))
         elif isinstance(target_date, str):
-            try:
-                parsed_date = datetime.strptime(target_date, "%Y-%m-%d")
+            parsed_date = self._parse_date_str(target_date)
+            if parsed_date:
                 self.date_edit.setDate(
                     QDate(parsed_date.year, parsed_date.month, parsed_date.day))
-            except ValueError:
+            else:
                 self.date_edit.setDate(QDate.currentDate())
         else:
             # 未知类型，使用当天日期
@@ -1189,7 +1337,7 @@ class ConfigPanel(QWidget):
         else:
             # 默认：当天 00:00
             self.start_date_edit.setDate(QDate.currentDate())
-            self.start_time_edit.setTime(QTime(0, 0))
+            self.start_time_edit.setTime(_DAY_START)
 
         # 解析结束时间
         end_dt = self._parse_datetime_value(end_date)
@@ -1201,7 +1349,7 @@ class ConfigPanel(QWidget):
         else:
             # 默认：当天 23:59
             self.end_date_edit.setDate(QDate.currentDate())
-            self.end_time_edit.setTime(QTime(23, 59))
+            self.end_time_edit.setTime(_DAY_END)
 
     def _parse_datetime_value(self, value) -> Optional[datetime]:
         """解析日期时间值
@@ -1221,132 +1369,203 @@ class ConfigPanel(QWidget):
         if isinstance(value, date):
             return datetime.combine(value, datetime.min.time())
 
+        # 支持格式：YYYY-MM-DD HH:mm 与 YYYY-MM-DD
         if isinstance(value, str):
-            # 尝试格式：YYYY-MM-DD HH:mm
-            try:
-                return datetime.strptime(value, "%Y-%m-%d %H:%M")
-            except ValueError:
-                pass
-
-            # 尝试格式：YYYY-MM-DD
-            try:
-                return datetime.strptime(value, "%Y-%m-%d")
-            except ValueError:
-                pass
+            # 补零的标准写法先按长度限定格式，再交给 C 实现的 fromisoformat 解析（比 strptime 快得多）
+            if len(value) in (10, 16):
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError:
+                    pass
+            # 未补零的写法（如 2025-1-5 9:00）由 strptime 兜底
+            for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+                try:
+                    return datetime.strptime(value, fmt)
+                except ValueError:
+                    pass
 
         return None
 
+    @staticmethod
+    def _parse_date_str(value: str) -> Optional[date]:
+        """解析 YYYY-MM-DD 格式的日期字符串，无法解析时返回 None
+
+        优先使用 C 实现的 fromisoformat；月、日未补零的写法（如 2025-1-5）由 strptime 兜底。
+        """
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _list_texts(list_widget: QListWidget) -> tuple:
+        """读取列表中所有非空条目的文本（去除首尾空白）"""
+        item = list_widget.item
+        return tuple(filter(None, (item(i).text().strip()
+                                   for i in range(list_widget.count()))))
+
+    def _stored_date_values(self) -> Dict[str, Optional[str]]:
+        """配置文件中实际保存的日期值（与 _collect_values 使用相同的字符串格式）
+
+        日期为空或无法解析时控件显示回退值（当天），快照必须取自配置文件本身，
+        否则回退值会被视为“未变化”而永远不会写入配置文件。
+        """
+        return {
+            "target_date": self._format_stored_date(
+                self.config_manager.get_target_date(), "%Y-%m-%d"),
+            "start_date": self._format_stored_date(
+                self.config_manager.get_start_date(), "%Y-%m-%d %H:%M"),
+            "end_date": self._format_stored_date(
+                self.config_manager.get_end_date(), "%Y-%m-%d %H:%M"),
+        }
+
+    @staticmethod
+    def _format_stored_date(value, fmt: str) -> Optional[str]:
+        """将配置中的日期值转换为字符串，空值返回 None"""
+        if isinstance(value, date):
+            return value.strftime(fmt)
+        if isinstance(value, str):
+            return value.strip()
+        return None
+
+    def _collect_rpa_values(self) -> Dict[str, object]:
+        """收集 RPA 模式专用卡片上的配置值"""
+        return {
+            "article_urls": self._list_texts(self.url_list),
+            "vlm_model": self.vlm_model_combo.currentText(),
+            "gui_templates": tuple(
+                (key, input_field.text().strip())
+                for key, input_field in self.template_inputs.items()),
+        }
+
+    def _collect_values(self) -> Dict[str, object]:
+        """收集界面上的全部配置值（用于与上次加载/保存的值比较）"""
+        start_datetime, end_datetime = self.get_selected_date_range()
+        values = {
+            "save_to_env": self.radio_save_to_env.isChecked(),
+            "target_date": self.get_selected_date().strftime("%Y-%m-%d"),
+            "start_date": start_datetime.strftime("%Y-%m-%d %H:%M"),
+            "end_date": end_datetime.strftime("%Y-%m-%d %H:%M"),
+            "account_names": self._list_texts(self.account_list),
+            "api_token": self.token_input.text().strip(),
+            "api_cookie": self.cookie_input.toPlainText().strip(),
+            "api_key": self.api_key_input.text().strip(),
+            "appid": self.appid_input.text().strip(),
+            "appsecret": self.appsecret_input.text().strip(),
+            "llm_model": self.llm_model_combo.currentText(),
+            "enable_thinking": self.chk_enable_thinking.isChecked(),
+            "thinking_budget": self.thinking_budget_spin.value(),
+            "author": self.author_input.text().strip(),
+            "cover_path": self.cover_path_input.text().strip(),
+            "publish_title": self.publish_title_input.text().strip(),
+            "publish_digest": self.publish_digest_input.text().strip(),
+        }
+        # RPA 卡片尚未创建时，界面上没有改动，保持配置文件中的原值
+        if self._rpa_cards_built:
+            values.update(self._collect_rpa_values())
+        return values
+
     def save_config(self) -> bool:
         """保存配置到配置管理器
 
         根据用户选择的保存方式（.env 文件或 config.yaml）统一处理所有敏感数据。
+        只写入与上次加载/保存相比发生变化的字段；没有任何变化时不重写配置文件。
         """
+        values = self._collect_values()
+        changed = {key for key, value in values.items()
+                   if self._saved_values.get(key) != value}
+        if not changed:
+            return True
+
         # 获取用户选择的敏感数据保存方式
-        save_to_env = self.radio_save_to_env.isChecked()
+        save_to_env = values["save_to_env"]
+        if "save_to_env" in changed:
+            # 保存方式变化时，所有敏感数据都需要写到新的位置
+            changed |= {"api_token", "api_cookie", "api_key",
+                        "appid", "appsecret"}
 
         # RPA 模式日期
-        selected_date = self.get_selected_date()
-        date_str = selected_date.strftime("%Y-%m-%d")
-        self.config_manager.set_target_date(date_str)
+        if "target_date" in changed:
+            self.config_manager.set_target_date(values["target_date"])
 
         # API 模式时间范围
-        start_datetime, end_datetime = self.get_selected_date_range()
-        start_str = start_datetime.strftime("%Y-%m-%d %H:%M")
-        end_str = end_datetime.strftime("%Y-%m-%d %H:%M")
-        self.config_manager.set_start_date(start_str)
-        self.config_manager.set_end_date(end_str)
+        if "start_date" in changed:
+            self.config_manager.set_start_date(values["start_date"])
+        if "end_date" in changed:
+            self.config_manager.set_end_date(values["end_date"])
 
         # API 模式配置 - 公众号名称列表（非敏感数据）
-        account_names = []
-        for i in range(self.account_list.count()):
-            name = self.account_list.item(i).text().strip()
-            if name:
-                account_names.append(name)
-        self.config_manager.set_account_names(account_names)
+        if "account_names" in changed:
+            self.config_manager.set_account_names(
+                list(values["account_names"]))
 
         # ==================== 敏感数据保存 ====================
 
-        # Token
-        current_token = self.token_input.text().strip()
-        self.config_manager.set_api_token(
-            current_token, save_to_env=save_to_env)
-
-        # Cookie
-        current_cookie = self.cookie_input.toPlainText().strip()
-        self.config_manager.set_api_cookie(
-            current_cookie, save_to_env=save_to_env)
+        if "api_token" in changed:
+            self.config_manager.set_api_token(
+                values["api_token"], save_to_env=save_to_env)
+        if "api_cookie" in changed:
+            self.config_manager.set_api_cookie(
+                values["api_cookie"], save_to_env=save_to_env)
+        if "api_key" in changed:
+            self.config_manager.set_api_key(
+                values["api_key"], save_to_env=save_to_env)
+        if "appid" in changed:
+            self.config_manager.set_wechat_appid(
+                values["appid"], save_to_config=not save_to_env)
+        if "appsecret" in changed:
+            self.config_manager.set_wechat_appsecret(
+                values["appsecret"], save_to_config=not save_to_env)
 
-        # API Key
-        current_api_key = self.api_key_input.text().strip()
-        self.config_manager.set_api_key(
-            current_api_key, save_to_env=save_to_env)
-
-        # AppID
-        current_appid = self.appid_input.text().strip()
-        self.config_manager.set_wechat_appid(
-            current_appid, save_to_config=not save_to_env)
+        # ==================== 模型配置（非敏感数据） ====================
 
-        # AppSecret
-        current_appsecret = self.appsecret_input.text().strip()
-        self.config_manager.set_wechat_appsecret(
-            current_appsecret, save_to_config=not save_to_env)
+        if "llm_model" in changed:
+            self.config_manager.set_llm_model(values["llm_model"])
+        if "enable_thinking" in changed:
+            self.config_manager.set_enable_thinking(values["enable_thinking"])
+        if "thinking_budget" in changed:
+            self.config_manager.set_thinking_budget(values["thinking_budget"])
 
         # ==================== RPA 模式配置（非敏感数据） ====================
 
-        urls = []
-        for i in range(self.url_list.count()):
-            url = self.url_list.item(i).text().strip()
-            if url:
-                urls.append(url)
-        self.config_manager.set_article_urls(urls)
-
-        # ==================== 模型配置（非敏感数据） ====================
-
-        self.config_manager.set_llm_model(self.llm_model_combo.currentText())
-        self.config_manager.set_vlm_model(self.vlm_model_combo.currentText())
-        self.config_manager.set_enable_thinking(
-            self.chk_enable_thinking.isChecked())
-        self.config_manager.set_thinking_budget(
-            self.thinking_budget_spin.value())
-
-        # GUI 模板配置
-        for key, input_field in self.template_inputs.items():
-            path = input_field.text().strip()
-            if path:
-                self.config_manager.set_gui_template_path(key, path)
+        if "article_urls" in changed:
+            self.config_manager.set_article_urls(list(values["article_urls"]))
+        if "vlm_model" in changed:
+            self.config_manager.set_vlm_model(values["vlm_model"])
+        if "gui_templates" in changed:
+            for key, path in values["gui_templates"]:
+                if path:
+                    self.config_manager.set_gui_template_path(key, path)
 
         # ==================== 发布配置（非敏感数据） ====================
 
-        # 作者名
-        author = self.author_input.text().strip()
-        if author:
-            self.config_manager.set_publish_author(author)
-
-        # 封面路径
-        cover_path = self.cover_path_input.text().strip()
-        if cover_path:
-            self.config_manager.set_publish_cover_path(cover_path)
-
-        # 发布标题
-        publish_title = self.publish_title_input.text().strip()
-        if publish_title:
-            self.config_manager.set_publish_title(publish_title)
-
-        # 摘要描述
-        publish_digest = self.publish_digest_input.text().strip()
-        self.config_manager.set_publish_digest(publish_digest)
+        # 作者名、封面路径、发布标题为空时保持原值
+        if "author" in changed and values["author"]:
+            self.config_manager.set_publish_author(values["author"])
+        if "cover_path" in changed and values["cover_path"]:
+            self.config_manager.set_publish_cover_path(values["cover_path"])
+        if "publish_title" in changed and values["publish_title"]:
+            self.config_manager.set_publish_title(values["publish_title"])
+        if "publish_digest" in changed:
+            self.config_manager.set_publish_digest(values["publish_digest"])
 
         # 保存 config.yaml
         success = self.config_manager.save_config()
+        # 敏感数据可能已写入 .env 或 config.yaml，来源需要重新检测
+        self.invalidate_source_cache()
+        if success:
+            self._saved_values = values
 
         if success and save_to_env:
             # 如果选择保存到 .env，显示提示信息
-            from ..utils import EnvFileManager
-            env_manager = EnvFileManager(
-                self.config_manager.get_project_root())
+            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.information(
                 self, "保存成功",
-                f"配置已保存！\n\n敏感数据已保存到：\n{env_manager.get_file_path()}\n\n"
+                f"配置已保存！\n\n敏感数据已保存到：\n{self._get_env_manager().get_file_path()}\n\n"
                 f"💡 .env 文件已自动添加到 .gitignore，不会提交到版本控制。"
             )
 
@@ -1389,17 +1608,17 @@ class ConfigPanel(QWidget):
                 return False, "请至少添加一个公众号名称"
             if not self.token_input.text().strip():
                 return False, "请填写 Token"
-            if not self.cookie_input.toPlainText().strip():
+            # Cookie 可能很长，直接在文档中查找非空白字符，避免复制整段文本
+            if self.cookie_input.document().find(_NON_BLANK).isNull():
                 return False, "请填写 Cookie"
         else:
             # RPA 模式验证
             if self.url_list.count() == 0:
                 return False, "请至少添加一个文章链接"
 
-        # 通用验证：API Key
+        # 通用验证：API Key（输入框有值时不再读取环境变量）
         api_key = self.api_key_input.text().strip()
-        env_api_key = self.config_manager.get_env_api_key()
-        if not api_key and not env_api_key:
+        if not api_key and not self.config_manager.get_env_api_key():
             return False, "请设置 API Key"
 
         return True, ""
@@ -1418,95 +1637,115 @@ class ConfigPanel(QWidget):
     # API 模式时间范围快捷按钮
     def _set_today_api(self) -> None:
         """设置为今天全天（API 模式）"""
-        today = QDate.currentDate()
-        self.start_date_edit.setDate(today)
-        self.start_time_edit.setTime(QTime(0, 0))
-        self.end_date_edit.setDate(today)
-        self.end_time_edit.setTime(QTime(23, 59))
+        self._set_api_full_day(QDate.currentDate())
 
     def _set_yesterday_api(self) -> None:
         """设置为昨天全天（API 模式）"""
-        yesterday = QDate.currentDate().addDays(-1)
-        self.start_date_edit.setDate(yesterday)
-        self.start_time_edit.setTime(QTime(0, 0))
-        self.end_date_edit.setDate(yesterday)
-        self.end_time_edit.setTime(QTime(23, 59))
+        self._set_api_full_day(QDate.currentDate().addDays(-1))
+
+    def _set_api_full_day(self, day: QDate) -> None:
+        """将 API 模式时间范围设置为指定日期的全天（00:00 - 23:59）"""
+        self.start_date_edit.setDate(day)
+        self.start_time_edit.setTime(_DAY_START)
+        self.end_date_edit.setDate(day)
+        self.end_time_edit.setTime(_DAY_END)
 
     # API 模式操作
     def _add_account_name(self) -> None:
         """添加公众号名称"""
+        from PyQt6.QtWidgets import QInputDialog, QMessageBox
+
         name, ok = QInputDialog.getText(self, "添加公众号", "请输入公众号名称:")
-        if ok and name.strip():
-            name = name.strip()
-            # 查重
-            for i in range(self.account_list.count()):
-                if self.account_list.item(i).text() == name:
-                    QMessageBox.warning(self, "重复", "该公众号名称已存在")
-                    return
-            self.account_list.addItem(name)
-            self._on_config_changed()
+        if not ok:
+            return
+        name = name.strip()
+        if not name:
+            return
+        # 查重
+        if name in self._account_name_set:
+            QMessageBox.warning(self, "重复", "该公众号名称已存在")
+            return
+        self.account_list.addItem(name)
+        self._account_name_set.add(name)
+        self._on_config_changed()
 
     def _remove_selected_accounts(self) -> None:
         """删除选中的公众号名称"""
-        for item in self.account_list.selectedItems():
-            self.account_list.takeItem(self.account_list.row(item))
+        # 先一次性收集行号，再倒序按行删除，避免删除过程中行号错位
+        rows = sorted({self.account_list.row(item)
+                       for item in self.account_list.selectedItems()}, reverse=True)
+        if not rows:
+            return
+        self.account_list.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self._account_name_set.discard(self.account_list.takeItem(row).text())
+        finally:
+            self.account_list.setUpdatesEnabled(True)
         self._on_config_changed()
 
     def _reload_accounts(self) -> None:
         """重新加载公众号名称列表"""
         self.config_manager.load_config()
         account_names = self.config_manager.get_account_names()
-        self.account_list.clear()
-        for name in account_names:
-            self.account_list.addItem(name)
+        self._account_name_set = self._bulk_fill(
+            self.account_list, account_names)
 
     # RPA 模式操作
     def _add_url(self) -> None:
         """添加文章链接"""
+        from PyQt6.QtWidgets import QInputDialog, QMessageBox
+
         url, ok = QInputDialog.getText(self, "添加链接", "请输入微信公众号文章链接:")
-        if ok and url.strip():
-            url = url.strip()
-            if "mp.weixin.qq.com" not in url:
-                QMessageBox.warning(self, "无效链接", "请输入有效的微信公众号文章链接")
-                return
-            # 查重
-            for i in range(self.url_list.count()):
-                if self.url_list.item(i).text() == url:
-                    return
-            self.url_list.addItem(url)
-            self._on_config_changed()
+        if not ok:
+            return
+        url = url.strip()
+        if not url:
+            return
+        if not url.startswith(WECHAT_ARTICLE_URL_PREFIXES):
+            QMessageBox.warning(self, "无效链接", "请输入有效的微信公众号文章链接")
+            return
+        # 查重
+        if url in self._url_set:
+            return
+        self.url_list.addItem(url)
+        self._url_set.add(url)
+        self._on_config_changed()
 
     def _remove_selected_urls(self) -> None:
         """删除选中的链接"""
-        for item in self.url_list.selectedItems():
-            self.url_list.takeItem(self.url_list.row(item))
+        # 先一次性收集行号，再倒序按行删除，避免删除过程中行号错位
+        rows = sorted({self.url_list.row(item)
+                       for item in self.url_list.selectedItems()}, reverse=True)
+        if not rows:
+            return
+        self.url_list.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self._url_set.discard(self.url_list.takeItem(row).text())
+        finally:
+            self.url_list.setUpdatesEnabled(True)
         self._on_config_changed()
 
     def _reload_urls(self) -> None:
         """重新加载链接列表"""
         self.config_manager.load_config()
         urls = self.config_manager.get_article_urls()
-        self.url_list.clear()
-        for url in urls:
-            self.url_list.addItem(url)
+        self._url_set = self._bulk_fill(self.url_list, urls)
 
     # 通用操作
-    def _toggle_api_key_visibility(self, state: int) -> None:
+    def _set_api_key_visible(self, visible: bool) -> None:
         """切换 API Key 显示/隐藏"""
-        if state == Qt.CheckState.Checked.value:
-            self.api_key_input.setEchoMode(QLineEdit.EchoMode.Normal)
-        else:
-            self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.api_key_input.setEchoMode(_ECHO_MODES[visible])
 
-    def _toggle_appsecret_visibility(self, state: int) -> None:
+    def _set_appsecret_visible(self, visible: bool) -> None:
         """切换 AppSecret 显示/隐藏"""
-        if state == Qt.CheckState.Checked.value:
-            self.appsecret_input.setEchoMode(QLineEdit.EchoMode.Normal)
-        else:
-            self.appsecret_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.appsecret_input.setEchoMode(_ECHO_MODES[visible])
 
     def _browse_cover_image(self) -> None:
         """浏览选择封面图片"""
+        from PyQt6.QtWidgets import QFileDialog
+
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择封面图片",
             str(self.config_manager.get_project_root() / "templates"),
@@ -1516,8 +1755,14 @@ class ConfigPanel(QWidget):
             self.cover_path_input.setText(file_path)
             self._on_config_changed()
 
+    def _on_browse_template_clicked(self) -> None:
+        """模板浏览按钮点击（根据按钮的 tpl_key 属性确定模板）"""
+        self._browse_template(self.sender().property("tpl_key"))
+
     def _browse_template(self, key: str) -> None:
         """浏览选择模板图片"""
+        from PyQt6.QtWidgets import QFileDialog
+
         file_path, _ = QFileDialog.getOpenFileName(
             self, f"选择模板 - {key}",
             str(self.config_manager.get_project_root() / "templates"),
@@ -1527,13 +1772,18 @@ class ConfigPanel(QWidget):
             self.template_inputs[key].setText(file_path)
             self._on_config_changed()
 
+    def _get_env_manager(self) -> EnvFileManager:
+        """获取 .env 文件管理器（首次调用时创建，之后复用）"""
+        if self._env_manager is None:
+            self._env_manager = EnvFileManager(
+                self.config_manager.get_project_root())
+        return self._env_manager
+
     def _open_env_file(self) -> None:
         """打开 .env 文件"""
-        from ..utils import EnvFileManager
-        import subprocess
-        import sys
+        from PyQt6.QtWidgets import QMessageBox
 
-        env_manager = EnvFileManager(self.config_manager.get_project_root())
+        env_manager = self._get_env_manager()
         env_file = env_manager.get_file_path()
 
         if not env_manager.exists():
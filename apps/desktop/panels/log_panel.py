@@ -6,7 +6,9 @@
 """
 
 import logging
-from typing import Optional, Dict
+from collections import deque
+from itertools import groupby
+from typing import Optional, Dict, List, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QPushButton, QLabel, QApplication, QMessageBox
@@ -16,6 +18,9 @@ from PyQt6.QtGui import QTextCursor, QColor, QTextCharFormat, QFont
 
 from ..styles import Colors, Sizes, get_log_level_color, Fonts
 
+# 标题样式模板（字号固定，只有颜色随主题变化）
+_TITLE_QSS = "font-size: %dpx; font-weight: bold; color: %%s;" % Fonts.SIZE_TITLE
+
 
 class LogPanel(QWidget):
     """日志面板
@@ -24,11 +29,16 @@ class LogPanel(QWidget):
     """
     
     MAX_LOG_LINES = 2000
+    TRIM_SLACK_LINES = 128  # 超出 MAX_LOG_LINES 的行数达到该值时才裁剪
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._auto_scroll = True
         self._is_dark = False # 默认为浅色模式
+        # 纯文本日志副本，复制/导出时直接使用，无需遍历文档
+        self._log_buffer: deque = deque(maxlen=self.MAX_LOG_LINES)
+        # 日志级别 -> 字符格式缓存（颜色随主题变化，切换主题时清空）
+        self._format_cache: Dict[int, QTextCharFormat] = {}
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -73,38 +83,65 @@ class LogPanel(QWidget):
 
     def update_theme(self, colors: Dict[str, str], is_dark: bool):
         """更新主题样式"""
+        if is_dark != self._is_dark:
+            self._format_cache.clear()
         self._is_dark = is_dark
-        self.title.setStyleSheet(f"font-size: {Fonts.SIZE_TITLE}px; font-weight: bold; color: {colors['text_primary']};")
+        title_qss = _TITLE_QSS % colors['text_primary']
+        # 样式文本相同时跳过，避免 Qt 重新解析样式表
+        if self.title.styleSheet() != title_qss:
+            self.title.setStyleSheet(title_qss)
         
     @pyqtSlot(str, int)
     def append_log(self, message: str, level: int = logging.INFO) -> None:
-        color = get_log_level_color(level, self._is_dark)
-        
+        self.append_logs([(message, level)])
+
+    @pyqtSlot(list)
+    def append_logs(self, entries: List[Tuple[str, int]]) -> None:
+        """批量追加日志 [(消息, 级别), ...]
+
+        日志已由 QtLogHandler 按时间窗口合并，这里直接一次性写入文档。
+        """
+        if not entries:
+            return
+        self._log_buffer.extend(message for message, _ in entries)
+
         cursor = self.log_text.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        
-        char_format = QTextCharFormat()
-        char_format.setForeground(QColor(color))
-        
-        cursor.insertText(message + "\n", char_format)
-        
+
+        # 相邻且级别相同的日志合并为一次 insertText
+        for level, group in groupby(entries, key=lambda entry: entry[1]):
+            text = "".join(message + "\n" for message, _ in group)
+            cursor.insertText(text, self._char_format(level))
+
         self._trim_logs()
-        
+
         if self._auto_scroll:
             self.log_text.setTextCursor(cursor)
             self.log_text.ensureCursorVisible()
     
+    def _char_format(self, level: int) -> QTextCharFormat:
+        """获取日志级别对应的字符格式（按级别缓存）"""
+        char_format = self._format_cache.get(level)
+        if char_format is None:
+            char_format = QTextCharFormat()
+            char_format.setForeground(QColor(get_log_level_color(level, self._is_dark)))
+            self._format_cache[level] = char_format
+        return char_format
+
     def _trim_logs(self) -> None:
+        # 超出上限一定余量后才裁剪，把光标操作分摊到多次追加上
         document = self.log_text.document()
-        if document.blockCount() > self.MAX_LOG_LINES:
+        block_count = document.blockCount()
+        if block_count > self.MAX_LOG_LINES + self.TRIM_SLACK_LINES:
             cursor = QTextCursor(document)
             cursor.movePosition(QTextCursor.MoveOperation.Start)
-            lines_to_remove = document.blockCount() - self.MAX_LOG_LINES
-            for _ in range(lines_to_remove):
-                cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor)
+            lines_to_remove = block_count - self.MAX_LOG_LINES
+            cursor.movePosition(QTextCursor.MoveOperation.NextBlock,
+                                QTextCursor.MoveMode.KeepAnchor, lines_to_remove)
             cursor.removeSelectedText()
     
     def clear_logs(self) -> None:
+        self._log_buffer.clear()
         self.log_text.clear()
     
     def _toggle_auto_scroll(self) -> None:
@@ -116,9 +153,8 @@ class LogPanel(QWidget):
             self.log_text.setTextCursor(cursor)
 
     def _copy_logs(self) -> None:
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.log_text.toPlainText())
+        QApplication.clipboard().setText(self.get_log_content())
         QMessageBox.information(self, "提示", "日志已复制到剪贴板")
 
     def get_log_content(self) -> str:
-        return self.log_text.toPlainText()
+        return "\n".join(self._log_buffer)
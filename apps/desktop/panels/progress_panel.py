@@ -5,15 +5,62 @@
 显示工作流执行进度、状态信息等。
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout,
-    QGroupBox, QLabel, QProgressBar, QFrame
+    QWidget, QGridLayout,
+    QGroupBox, QLabel, QProgressBar, QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QFontMetrics
 
 from ..styles import Colors, Sizes, Fonts
 
+# 状态标签样式模板，以及会用到的语义颜色键
+_STATUS_QSS = "font-weight: bold; color: %s;"
+_STATUS_COLOR_KEYS = ("text_primary", "info", "success", "error", "warning")
+
+# 面板样式模板（模块加载时确定结构，切换主题时只填入颜色）
+_PANEL_QSS = """
+    ProgressPanel {{
+        background-color: {window_bg};
+        border-top: 1px solid {border_light};
+    }}
+    QProgressBar {{
+        border: none;
+        background-color: {progress_bg};
+        border-radius: 2px;
+        height: 4px;
+    }}
+    QProgressBar::chunk {{
+        background-color: {progress_chunk};
+        border-radius: 2px;
+    }}
+"""
+
+
+@lru_cache(maxsize=4)
+def _panel_qss(window_bg: str, border_light: str,
+               progress_bg: str, progress_chunk: str) -> str:
+    """按颜色生成面板样式表（同一主题的多个面板实例共用同一个字符串）"""
+    return _PANEL_QSS.format(window_bg=window_bg, border_light=border_light,
+                             progress_bg=progress_bg, progress_chunk=progress_chunk)
+
+
+# 小字号标签样式模板（字号固定，只有颜色随主题变化）
+_SMALL_LABEL_QSS = "color: %%s; font-size: %dpx;" % Fonts.SIZE_SMALL
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressSnapshot:
+    """一次进度更新的全部字段（为 None 的字段保持不变）"""
+    status: Optional[str] = None
+    color_key: Optional[str] = None
+    progress: Optional[int] = None
+    stats: Optional[str] = None
+    detail: Optional[str] = None
+
 
 class ProgressPanel(QFrame):
     """进度面板 (Footer Style)
@@ -21,121 +68,258 @@ class ProgressPanel(QFrame):
     显示工作流执行的进度和状态信息。
     """
     
+    FLUSH_INTERVAL_MS = 33  # 进度更新合并刷新间隔（约 30 Hz）
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._current_colors = {}
+        # 各控件最近一次设置的值，值未变化时跳过 Qt 调用
+        # （初始值与 _setup_ui 中创建控件时的内容一致，构造时无需再调用 reset）
+        self._last_status: Optional[str] = "就绪"
+        self._last_stats: Optional[str] = ""
+        self._last_detail: Optional[str] = ""
+        self._last_progress = 0
+        self._last_status_style: Optional[str] = None
+        # 颜色键 -> 状态标签样式表（随主题在 update_theme 中重建）
+        self._status_styles: Dict[str, str] = {}
+        self._shown_detail = ""  # 详细信息标签上实际显示的（可能已省略的）文本
+        self._detail_fm: Optional[QFontMetrics] = None  # 详细信息字体度量缓存
+        self._busy = False  # 进度条是否处于忙碌（不确定进度）模式
+        # 待刷新的更新：字段名 -> 最新值，由定时器合并后一次性应用
+        self._pending: Dict[str, object] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
         self._setup_ui()
-        self.reset()
     
     def _setup_ui(self) -> None:
-        layout = QVBoxLayout(self)
-        layout.setSpacing(8)
+        # 单个网格布局（3 行 × 2 列），避免嵌套布局带来的多次布局计算
+        layout = QGridLayout(self)
+        layout.setVerticalSpacing(8)
         layout.setContentsMargins(Sizes.MARGIN_LARGE, 12, Sizes.MARGIN_LARGE, 12)
+        # 第 0 列占据剩余宽度，把统计信息推到右侧（代替 addStretch）
+        layout.setColumnStretch(0, 1)
         
-        # 上半部分：状态和统计
-        top_row = QHBoxLayout()
-        
+        # 第一行：状态（左）和统计（右）
         self.status_label = QLabel("就绪")
         # 样式将在 update_theme 中设置
-        top_row.addWidget(self.status_label)
-        
-        top_row.addStretch()
+        layout.addWidget(self.status_label, 0, 0, Qt.AlignmentFlag.AlignLeft)
         
         self.stats_label = QLabel("")
         # 样式将在 update_theme 中设置
-        top_row.addWidget(self.stats_label)
-        
-        layout.addLayout(top_row)
+        layout.addWidget(self.stats_label, 0, 1, Qt.AlignmentFlag.AlignRight)
         
-        # 中间：进度条
+        # 第二行：进度条
         self.progress_bar = QProgressBar()
         self.progress_bar.setMinimum(0)
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)
-        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.progress_bar, 1, 0, 1, 2)
         
-        # 下半部分：详细信息
+        # 第三行：详细信息
         self.detail_label = QLabel("")
         # 样式将在 update_theme 中设置
-        self.detail_label.setWordWrap(True)
-        layout.addWidget(self.detail_label)
+        # 单行显示，过长时在右侧省略（比自动换行省去每次缩放时的多行排版）；
+        # 宽度由布局决定，不随文本长度撑开面板
+        self.detail_label.setSizePolicy(
+            QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        layout.addWidget(self.detail_label, 2, 0, 1, 2)
+
+        # 状态文本均为纯文本，跳过 QLabel 的富文本自动检测
+        for label in (self.status_label, self.stats_label, self.detail_label):
+            label.setTextFormat(Qt.TextFormat.PlainText)
 
     def update_theme(self, colors: Dict[str, str]):
         """更新主题样式"""
         self._current_colors = colors
         
-        self.setStyleSheet(f"""
-            ProgressPanel {{
-                background-color: {colors['window_bg']};
-                border-top: 1px solid {colors['border_light']};
-            }}
-            QProgressBar {{
-                border: none;
-                background-color: {colors['progress_bg']};
-                border-radius: 2px;
-                height: 4px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {colors['progress_chunk']};
-                border-radius: 2px;
-            }}
-        """)
+        panel_qss = _panel_qss(colors['window_bg'], colors['border_light'],
+                               colors['progress_bg'], colors['progress_chunk'])
+        # 样式表文本未变化时跳过，避免 Qt 重新解析
+        if self.styleSheet() != panel_qss:
+            self.setStyleSheet(panel_qss)
         
-        self.status_label.setStyleSheet(f"font-weight: bold; color: {colors['text_primary']};")
-        self.stats_label.setStyleSheet(f"color: {colors['text_secondary']}; font-size: {Fonts.SIZE_SMALL}px;")
-        self.detail_label.setStyleSheet(f"color: {colors['text_hint']}; font-size: {Fonts.SIZE_SMALL}px;")
+        self._status_styles = {key: _STATUS_QSS % colors[key]
+                               for key in _STATUS_COLOR_KEYS if key in colors}
+        self._last_status_style = self._status_styles['text_primary']
+        self.status_label.setStyleSheet(self._last_status_style)
+        self.stats_label.setStyleSheet(_SMALL_LABEL_QSS % colors['text_secondary'])
+        self.detail_label.setStyleSheet(_SMALL_LABEL_QSS % colors['text_hint'])
+        # 字号由样式表决定，样式变化后重新获取字体度量
+        self._detail_fm = None
+        self._render_detail()
 
     def reset(self) -> None:
-        self.set_status("就绪")
-        self.set_progress(0)
-        self.set_stats("")
-        self.set_detail("")
+        # 丢弃尚未刷新的更新，立即恢复初始状态
+        self._pending.clear()
+        self._flush_timer.stop()
+        self.set_determinate()
+        self.update_many(status="就绪", progress=0, stats="", detail="")
     
     @pyqtSlot(str, str)
     def set_status(self, status: str, color_key: str = None) -> None:
-        """设置状态
+        """设置状态（合并到下一次刷新中显示）
         
         Args:
             status: 状态文本
             color_key: 颜色键名 (如 'success', 'error', 'info')，如果为 None 则使用默认文字颜色
         """
-        self.status_label.setText(status)
-        
-        colors = self._current_colors
-        if not colors:
-            return
-            
-        if color_key and color_key in colors:
-            color = colors[color_key]
-        elif color_key and color_key.startswith("#"): # 兼容旧代码传入的具体颜色值
-            color = color_key
-        else:
-            color = colors['text_primary']
-            
-        self.status_label.setStyleSheet(f"font-weight: bold; color: {color};")
+        self._schedule(status=status, color_key=color_key)
     
     @pyqtSlot(int)
     def set_progress(self, value: int) -> None:
-        self.progress_bar.setValue(min(100, max(0, value)))
+        self._schedule(progress=value)
     
     @pyqtSlot(str)
     def set_stats(self, stats: str) -> None:
-        self.stats_label.setText(stats)
+        self._schedule(stats=stats)
     
     @pyqtSlot(str)
     def set_detail(self, detail: str) -> None:
-        self.detail_label.setText(detail)
+        self._schedule(detail=detail)
+
+    @pyqtSlot(object)
+    def apply(self, snapshot: ProgressSnapshot) -> None:
+        """应用一次进度快照（合并到下一次刷新中显示）
+
+        推荐使用该接口代替逐个调用 set_status / set_progress / set_stats / set_detail：
+        一次更新只需投递一次信号。
+        """
+        fields = {}
+        if snapshot.status is not None:
+            fields["status"] = snapshot.status
+            fields["color_key"] = snapshot.color_key
+        if snapshot.progress is not None:
+            fields["progress"] = snapshot.progress
+        if snapshot.stats is not None:
+            fields["stats"] = snapshot.stats
+        if snapshot.detail is not None:
+            fields["detail"] = snapshot.detail
+        if fields:
+            self._schedule(**fields)
+
+    def update_many(self, *, status: Optional[str] = None, color_key: Optional[str] = None,
+                    progress: Optional[int] = None, stats: Optional[str] = None,
+                    detail: Optional[str] = None) -> None:
+        """立即更新多个字段
+
+        为 None 的字段保持不变（color_key 只在提供 status 时生效）。
+        值未变化的控件不会被重绘；各控件的 update() 由 Qt 合并为一次绘制。
+        """
+        if status is not None:
+            self._apply_status(status, color_key)
+        if progress is not None:
+            self._apply_progress(progress)
+        if stats is not None:
+            self._apply_stats(stats)
+        if detail is not None:
+            self._apply_detail(detail)
+
+    def _schedule(self, **fields) -> None:
+        """记录待显示的值，由定时器合并刷新（同一字段只保留最新值）"""
+        self._pending.update(fields)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """一次性应用所有待显示的更新"""
+        self._flush_timer.stop()
+        pending, self._pending = self._pending, {}
+        if pending:
+            self.update_many(**pending)
+
+    def _apply_status(self, status: str, color_key: str = None) -> None:
+        if status != self._last_status:
+            self._last_status = status
+            self.status_label.setText(status)
+        
+        colors = self._current_colors
+        if not colors:
+            return
+            
+        style = self._status_styles.get(color_key) if color_key else None
+        if style is None:
+            if color_key and color_key in colors:
+                style = _STATUS_QSS % colors[color_key]
+            elif color_key and color_key.startswith("#"): # 兼容旧代码传入的具体颜色值
+                style = _STATUS_QSS % color_key
+            else:
+                style = self._status_styles['text_primary']
+            
+        # 样式未变化时不重新设置（避免 Qt 重新解析 QSS）
+        if style != self._last_status_style:
+            self._last_status_style = style
+            self.status_label.setStyleSheet(style)
+    
+    def _apply_progress(self, value: int) -> None:
+        # 收到具体进度后退出忙碌模式
+        self.set_determinate()
+        value = min(100, max(0, value))
+        if value != self._last_progress:
+            self._last_progress = value
+            self.progress_bar.setValue(value)
     
+    def _apply_stats(self, stats: str) -> None:
+        if stats != self._last_stats:
+            self._last_stats = stats
+            self.stats_label.setText(stats)
+    
+    def _apply_detail(self, detail: str) -> None:
+        if detail != self._last_detail:
+            self._last_detail = detail
+            self._render_detail()
+
+    def _render_detail(self) -> None:
+        """按标签当前宽度显示详细信息，过长时右侧省略（完整内容放在提示中）"""
+        detail = self._last_detail or ""
+        if self._detail_fm is None:
+            self.detail_label.ensurePolished()
+            self._detail_fm = QFontMetrics(self.detail_label.font())
+        shown = self._detail_fm.elidedText(
+            detail, Qt.TextElideMode.ElideRight, self.detail_label.width())
+        if shown != self._shown_detail:
+            self._shown_detail = shown
+            self.detail_label.setText(shown)
+            self.detail_label.setToolTip(detail if shown != detail else "")
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        if self._last_detail:
+            self._render_detail()
+    
+    def set_busy(self) -> None:
+        """进入忙碌模式（进度未知时由 Qt 自行播放动画，无需逐帧设置进度）"""
+        if self._busy:
+            return
+        self._busy = True
+        self.progress_bar.setRange(0, 0)
+        # 切换范围会重置进度值，恢复确定模式时需要重新设置
+        self._last_progress = -1
+
+    def set_determinate(self) -> None:
+        """恢复为 0-100 的确定进度模式"""
+        if not self._busy:
+            return
+        self._busy = False
+        self.progress_bar.setRange(0, 100)
+
+    # 以下状态切换不经过定时器：与已排队的更新合并后立即显示（只绘制一次）
     def set_running(self, task_name: str = "执行中") -> None:
-        self.set_status(f"⏳ {task_name}...", "info")
+        self._pending.update(status=f"⏳ {task_name}...", color_key="info")
+        self._flush()
+        self.set_busy()
     
     def set_success(self, message: str = "完成") -> None:
-        self.set_status(f"✅ {message}", "success")
-        self.set_progress(100)
+        self._pending.update(status=f"✅ {message}", color_key="success", progress=100)
+        self._flush()
     
     def set_error(self, message: str = "失败") -> None:
-        self.set_status(f"❌ {message}", "error")
+        self._pending.update(status=f"❌ {message}", color_key="error")
+        self._flush()
+        self.set_determinate()
     
     def set_warning(self, message: str) -> None:
-        self.set_status(f"⚠️ {message}", "warning")
+        self._pending.update(status=f"⚠️ {message}", color_key="warning")
+        self._flush()
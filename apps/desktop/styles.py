@@ -5,6 +5,7 @@ GUI 样式定义
 定义应用的主题颜色、字体、样式表等。
 """
 
+import logging
 from typing import Dict
 
 # ==================== 字体定义 ====================
@@ -63,22 +64,39 @@ class Sizes:
     SIDEBAR_ITEM_HEIGHT = 44
 
 
+# ==================== 基础色板 ====================
+# 兼容性 Colors 与 ThemeManager 的浅色/深色主题共用的色值，统一在这里定义
+PALETTE: Dict[str, str] = {
+    "wechat_green": "#07C160",  # 微信绿（主色调 / 成功）
+    "blue": "#3370FF",          # 信息
+    "orange": "#FF9500",        # 警告
+    "red": "#F54A45",           # 错误
+    "ink": "#1F2329",           # 主要文字 (深黑)
+    "slate": "#646A73",         # 次要文字 (深灰)
+    "mist": "#8F959E",          # 提示文字 (浅灰)
+    "line": "#E8EAED",          # 浅色边框
+    "white": "#FFFFFF",
+    "snow": "#F5F7FA",          # 灰白背景
+    "smoke": "#F5F5F5",         # 禁用 / 进度条底色
+}
+
+
 # ==================== 兼容性颜色定义 (Deprecated) ====================
 # 保留此类以防其他模块直接引用报错，但在新逻辑中应优先使用 ThemeManager
 class Colors:
-    PRIMARY = "#07C160"
-    INFO = "#3370FF"
-    SUCCESS = "#07C160"
-    WARNING = "#FF9500"
-    ERROR = "#F54A45"
-    TEXT_PRIMARY = "#1F2329"
-    TEXT_SECONDARY = "#646A73"
-    TEXT_HINT = "#8F959E"
-    BORDER_LIGHT = "#E8EAED"
-    BG_WINDOW = "#FFFFFF"
-    BG_CARD = "#FFFFFF"
-    BG_INPUT = "#F5F7FA"
-    BG_DISABLED = "#F5F5F5"
+    PRIMARY = PALETTE["wechat_green"]
+    INFO = PALETTE["blue"]
+    SUCCESS = PALETTE["wechat_green"]
+    WARNING = PALETTE["orange"]
+    ERROR = PALETTE["red"]
+    TEXT_PRIMARY = PALETTE["ink"]
+    TEXT_SECONDARY = PALETTE["slate"]
+    TEXT_HINT = PALETTE["mist"]
+    BORDER_LIGHT = PALETTE["line"]
+    BG_WINDOW = PALETTE["white"]
+    BG_CARD = PALETTE["white"]
+    BG_INPUT = PALETTE["snow"]
+    BG_DISABLED = PALETTE["smoke"]
 
 
 # ==================== 样式表定义 ====================
@@ -324,6 +342,23 @@ def get_main_stylesheet(colors: Dict[str, str]) -> str:
     """
 
 
+# 日志级别颜色表（标准级别直接查表）
+LOG_LEVEL_COLORS_LIGHT: Dict[int, str] = {
+    logging.CRITICAL: "#FF4D4F",  # Red
+    logging.ERROR: "#FF4D4F",     # Red
+    logging.WARNING: "#FAAD14",   # Orange
+    logging.INFO: "#52C41A",      # Green
+    logging.DEBUG: "#8C8C8C",     # Grey
+}
+LOG_LEVEL_COLORS_DARK: Dict[int, str] = {
+    logging.CRITICAL: "#FF6B6B",
+    logging.ERROR: "#FF6B6B",
+    logging.WARNING: "#FFC069",
+    logging.INFO: "#52C41A",
+    logging.DEBUG: "#AAAAAA",
+}
+
+
 def get_log_level_color(level: int, is_dark: bool = False) -> str:
     """根据日志级别获取颜色 (用于 Rich Text)
 
@@ -334,18 +369,12 @@ def get_log_level_color(level: int, is_dark: bool = False) -> str:
     Returns:
         str: 颜色代码
     """
-    import logging
-
-    if level >= logging.CRITICAL:
-        return "#FF6B6B" if is_dark else "#FF4D4F" # Red
-    elif level >= logging.ERROR:
-        return "#FF6B6B" if is_dark else "#FF4D4F" # Red
-    elif level >= logging.WARNING:
-        return "#FFC069" if is_dark else "#FAAD14" # Orange
-    elif level >= logging.INFO:
-        return "#52C41A" if is_dark else "#52C41A" # Green
-    else:
-        return "#AAAAAA" if is_dark else "#8C8C8C" # Grey
+    colors = LOG_LEVEL_COLORS_DARK if is_dark else LOG_LEVEL_COLORS_LIGHT
+    color = colors.get(level)
+    if color is None:
+        # 非标准级别：向下取整到 10 的倍数，再限制在 DEBUG ~ CRITICAL 之间查表
+        color = colors[min(max(level // 10 * 10, logging.DEBUG), logging.CRITICAL)]
+    return color
 
 
 def apply_shadow_effect(widget, blur_radius: int = 15, offset: tuple = (0, 4),
@@ -7,18 +7,123 @@
 
 import sys
 import logging
-import subprocess
-from typing import Dict, Any
-from PyQt6.QtCore import QObject, pyqtSignal
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional, Mapping
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPalette, QColor
 
-try:
-    import darkdetect
-    HAS_DARKDETECT = True
-except ImportError:
-    HAS_DARKDETECT = False
-    logging.warning("未安装 darkdetect 库，尝试使用原生命令检测系统主题。")
+from .styles import PALETTE, get_main_stylesheet
+
+# darkdetect 模块在首次检测时才导入；False 表示尚未尝试导入，None 表示未安装
+_darkdetect: Any = False
+
+
+def _load_darkdetect():
+    """按需导入 darkdetect（只尝试一次，结果缓存在模块变量中）"""
+    global _darkdetect
+    if _darkdetect is False:
+        try:
+            import darkdetect
+            _darkdetect = darkdetect
+        except ImportError:
+            _darkdetect = None
+            logging.warning("未安装 darkdetect 库，尝试使用原生命令检测系统主题。")
+    return _darkdetect
+
+
+def _probe_system_theme() -> str:
+    """实际检测系统主题（可能启动子进程，耗时较长，不要在界面线程中频繁调用）"""
+    theme = "light"
+
+    # 1. 优先尝试使用 darkdetect 库
+    darkdetect = _load_darkdetect()
+    if darkdetect is not None:
+        try:
+            if darkdetect.isDark():
+                theme = "dark"
+        except Exception as e:
+            logging.error(f"darkdetect 检测系统主题失败: {e}")
+
+    # 2. 如果没有 darkdetect 或检测失败，且在 macOS 上，直接在进程内读取系统设置
+    if theme == "light" and sys.platform == "darwin":
+        try:
+            if _macos_interface_style_is_dark():
+                theme = "dark"
+        except Exception as e:
+            logging.debug(f"进程内读取 macOS 外观设置失败，改用原生命令: {e}")
+            if _macos_defaults_is_dark():
+                theme = "dark"
+
+    return theme
+
+
+def _macos_interface_style_is_dark() -> bool:
+    """通过 ctypes 调用 NSUserDefaults 读取 AppleInterfaceStyle（进程内查询，无需启动子进程）
+
+    与 `defaults read -g AppleInterfaceStyle` 读取的是同一项设置；
+    NSUserDefaults 是线程安全的，可以在后台检测线程中调用。
+    """
+    import ctypes
+    import ctypes.util
+
+    objc = ctypes.cdll.LoadLibrary(ctypes.util.find_library("objc"))
+    ctypes.cdll.LoadLibrary(ctypes.util.find_library("Foundation"))
+    objc.objc_getClass.restype = ctypes.c_void_p
+    objc.objc_getClass.argtypes = [ctypes.c_char_p]
+    objc.sel_registerName.restype = ctypes.c_void_p
+    objc.sel_registerName.argtypes = [ctypes.c_char_p]
+
+    # objc_msgSend 需要按每种调用签名分别声明（arm64 上不能按可变参数调用）
+    send = ctypes.cast(objc.objc_msgSend, ctypes.c_void_p).value
+    void_p, char_p = ctypes.c_void_p, ctypes.c_char_p
+    send_obj = ctypes.CFUNCTYPE(void_p, void_p, void_p)(send)
+    send_obj_str = ctypes.CFUNCTYPE(void_p, void_p, void_p, char_p)(send)
+    send_obj_ptr = ctypes.CFUNCTYPE(void_p, void_p, void_p, void_p)(send)
+    send_cstr = ctypes.CFUNCTYPE(char_p, void_p, void_p)(send)
+
+    sel = objc.sel_registerName
+    key = send_obj_str(objc.objc_getClass(b"NSString"),
+                       sel(b"stringWithUTF8String:"), b"AppleInterfaceStyle")
+    defaults = send_obj(objc.objc_getClass(b"NSUserDefaults"),
+                        sel(b"standardUserDefaults"))
+    style = send_obj_ptr(defaults, sel(b"stringForKey:"), key)
+    # 浅色模式下该项不存在，返回 nil
+    if not style:
+        return False
+    return b"Dark" in (send_cstr(style, sel(b"UTF8String")) or b"")
+
+
+def _macos_defaults_is_dark() -> bool:
+    """通过 `defaults` 命令读取 macOS 外观设置（进程内查询失败时的兜底方案）"""
+    # subprocess 只在这里需要，按需导入
+    import subprocess
+    try:
+        result = subprocess.run(
+            ["defaults", "read", "-g", "AppleInterfaceStyle"],
+            capture_output=True,
+            text=True
+        )
+        # 如果命令成功且输出包含 "Dark"，则为深色模式
+        # 注意：浅色模式下该命令通常会报错（exit code 1）或输出为空
+        return result.returncode == 0 and "Dark" in result.stdout
+    except Exception as e:
+        logging.error(f"原生命令检测系统主题失败: {e}")
+        return False
+
+
+class ThemeDetectThread(QThread):
+    """系统主题检测线程
+
+    在后台线程中执行一次主题检测，通过信号把结果交回界面线程。
+    """
+
+    detected = pyqtSignal(str)  # 检测结果 ("light" or "dark")
+
+    def run(self) -> None:
+        self.detected.emit(_probe_system_theme())
 
 
 class ThemeManager(QObject):
@@ -27,51 +132,70 @@ class ThemeManager(QObject):
     # 主题切换信号
     theme_changed = pyqtSignal(str)  # 发送新主题名称 ("light" or "dark")
 
+    # 检测结果缓存有效期，同时也是后台轮询系统主题的间隔
+    DETECT_INTERVAL_MS = 2000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._current_theme = "light"
         self._auto_detect = True
+        self._detected_at: Optional[float] = None  # 最近一次检测的时间（monotonic）
+        self._detect_thread: Optional[ThemeDetectThread] = None
         
-        # 初始化主题
+        # 初始化主题（启动时同步检测一次，保证首帧就是正确的主题）
         self.detect_system_theme()
 
+        # 之后在后台线程中定期检测，界面线程不再等待子进程
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(self.DETECT_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self.refresh_async)
+        self._poll_timer.start()
+
+        # 退出前等待检测线程结束，避免线程仍在运行时被销毁
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_polling)
+
     def detect_system_theme(self) -> str:
-        """检测系统主题"""
+        """检测系统主题
+
+        缓存未过期时直接返回缓存结果，不重新检测。
+        """
         if not self._auto_detect:
             return self._current_theme
 
-        theme = "light"
-        
-        # 1. 优先尝试使用 darkdetect 库
-        if HAS_DARKDETECT:
-            try:
-                if darkdetect.isDark():
-                    theme = "dark"
-            except Exception as e:
-                logging.error(f"darkdetect 检测系统主题失败: {e}")
-                
-        # 2. 如果没有 darkdetect 或检测失败，且在 macOS 上，尝试使用原生命令
-        if theme == "light" and sys.platform == "darwin":
-            try:
-                result = subprocess.run(
-                    ["defaults", "read", "-g", "AppleInterfaceStyle"],
-                    capture_output=True,
-                    text=True
-                )
-                # 如果命令成功且输出包含 "Dark"，则为深色模式
-                # 注意：浅色模式下该命令通常会报错（exit code 1）或输出为空
-                if result.returncode == 0 and "Dark" in result.stdout:
-                    theme = "dark"
-            except Exception as e:
-                logging.error(f"原生命令检测系统主题失败: {e}")
-        
-        # 如果检测结果变化，发送信号
+        if (self._detected_at is not None and
+                (time.monotonic() - self._detected_at) * 1000 < self.DETECT_INTERVAL_MS):
+            return self._current_theme
+
+        self._apply_detected_theme(_probe_system_theme())
+        return self._current_theme
+
+    def refresh_async(self) -> None:
+        """在后台线程中重新检测系统主题（上一次检测尚未结束时跳过）"""
+        if not self._auto_detect:
+            return
+        if self._detect_thread is not None and self._detect_thread.isRunning():
+            return
+        if self._detect_thread is None:
+            self._detect_thread = ThemeDetectThread(self)
+            # 跨线程信号自动以队列方式投递，槽函数在界面线程中执行
+            self._detect_thread.detected.connect(self._apply_detected_theme)
+        self._detect_thread.start()
+
+    def _stop_polling(self) -> None:
+        """停止后台检测"""
+        self._poll_timer.stop()
+        if self._detect_thread is not None:
+            self._detect_thread.wait()
+
+    def _apply_detected_theme(self, theme: str) -> None:
+        """记录检测结果，主题变化时发送信号"""
+        self._detected_at = time.monotonic()
         if theme != self._current_theme:
             self._current_theme = theme
             self.theme_changed.emit(theme)
             logging.info(f"系统主题切换为: {theme}")
-            
-        return theme
 
     def get_current_theme(self) -> str:
         """获取当前主题名称"""
@@ -81,39 +205,43 @@ class ThemeManager(QObject):
         """是否为深色模式"""
         return self._current_theme == "dark"
 
-    def get_colors(self) -> Dict[str, str]:
-        """获取当前主题的颜色变量字典"""
+    def get_colors(self) -> Mapping[str, str]:
+        """获取当前主题的颜色变量字典（只读）"""
         if self.is_dark():
             return self.DARK_THEME
         else:
             return self.LIGHT_THEME
 
+    def get_main_stylesheet(self) -> str:
+        """获取当前主题的主窗口样式表（按主题名缓存）"""
+        return _build_main_stylesheet(self._current_theme)
+
     # ==================== 语义化颜色定义 ====================
 
     # 浅色模式 (Light Mode)
     LIGHT_THEME = {
         # 基础背景
-        "window_bg": "#F5F7FA",      # 整体背景 (灰白)
-        "content_bg": "#F5F7FA",     # 内容区背景
-        "sidebar_bg": "#FFFFFF",     # 侧边栏背景 (纯白)
+        "window_bg": PALETTE["snow"],       # 整体背景 (灰白)
+        "content_bg": PALETTE["snow"],      # 内容区背景
+        "sidebar_bg": PALETTE["white"],     # 侧边栏背景 (纯白)
         
         # 卡片与容器
-        "card_bg": "#FFFFFF",        # 卡片背景 (纯白)
-        "input_bg": "#FFFFFF",       # 输入框背景
-        "input_bg_hover": "#F5F7FA", # 输入框悬停背景
+        "card_bg": PALETTE["white"],        # 卡片背景 (纯白)
+        "input_bg": PALETTE["white"],       # 输入框背景
+        "input_bg_hover": PALETTE["snow"],  # 输入框悬停背景
         
         # 文字颜色
-        "text_primary": "#1F2329",   # 主要文字 (深黑)
-        "text_secondary": "#646A73", # 次要文字 (深灰)
-        "text_hint": "#8F959E",      # 提示文字 (浅灰)
-        "text_white": "#FFFFFF",     # 反白文字
-        "text_sidebar": "#1F2329",   # 侧边栏文字
-        "text_sidebar_selected": "#07C160", # 侧边栏选中文字
+        "text_primary": PALETTE["ink"],     # 主要文字 (深黑)
+        "text_secondary": PALETTE["slate"], # 次要文字 (深灰)
+        "text_hint": PALETTE["mist"],       # 提示文字 (浅灰)
+        "text_white": PALETTE["white"],     # 反白文字
+        "text_sidebar": PALETTE["ink"],     # 侧边栏文字
+        "text_sidebar_selected": PALETTE["wechat_green"], # 侧边栏选中文字
         
         # 边框与分割线
         "border": "#DEE0E3",         # 常规边框
-        "border_light": "#E8EAED",   # 浅色边框
-        "splitter_handle": "#E8EAED",# 分割线颜色
+        "border_light": PALETTE["line"],    # 浅色边框
+        "splitter_handle": PALETTE["line"], # 分割线颜色
         
         # 交互状态
         "sidebar_item_hover": "#F2F3F5",    # 侧边栏悬停
@@ -121,25 +249,25 @@ class ThemeManager(QObject):
         "button_hover_bg": "#F2F3F5",       # 普通按钮悬停
         
         # 功能色
-        "primary": "#07C160",        # 主色调 (微信绿)
+        "primary": PALETTE["wechat_green"], # 主色调 (微信绿)
         "primary_hover": "#06AD56",
         "primary_pressed": "#059B4C",
         "primary_light": "rgba(7, 193, 96, 0.1)",
         
-        "error": "#F54A45",
-        "warning": "#FF9500",
-        "success": "#07C160",
-        "info": "#3370FF",
+        "error": PALETTE["red"],
+        "warning": PALETTE["orange"],
+        "success": PALETTE["wechat_green"],
+        "info": PALETTE["blue"],
         
         # 日志区域
-        "log_bg": "#FFFFFF",         # 日志背景
-        "log_text": "#1F2329",       # 日志文字
+        "log_bg": PALETTE["white"],         # 日志背景
+        "log_text": PALETTE["ink"],         # 日志文字
         "log_border": "#DEE0E3",
         
         # 特殊控件
         "shadow": "rgba(0, 0, 0, 0.05)",
-        "progress_bg": "#F5F5F5",
-        "progress_chunk": "#07C160",
+        "progress_bg": PALETTE["smoke"],
+        "progress_chunk": PALETTE["wechat_green"],
     }
 
     # 深色模式 (Dark Mode)
@@ -158,9 +286,9 @@ class ThemeManager(QObject):
         "text_primary": "#E0E0E0",   # 主要文字 (灰白)
         "text_secondary": "#AAAAAA", # 次要文字 (浅灰)
         "text_hint": "#666666",      # 提示文字 (深灰)
-        "text_white": "#FFFFFF",     # 反白文字
+        "text_white": PALETTE["white"],     # 反白文字
         "text_sidebar": "#CCCCCC",   # 侧边栏文字
-        "text_sidebar_selected": "#07C160", # 侧边栏选中文字
+        "text_sidebar_selected": PALETTE["wechat_green"], # 侧边栏选中文字
         
         # 边框与分割线
         "border": "#3E3E3E",         # 常规边框
@@ -173,7 +301,7 @@ class ThemeManager(QObject):
         "button_hover_bg": "#3E3E3E",       # 普通按钮悬停
         
         # 功能色
-        "primary": "#07C160",        # 主色调 (保持)
+        "primary": PALETTE["wechat_green"], # 主色调 (保持)
         "primary_hover": "#06AD56",
         "primary_pressed": "#059B4C",
         "primary_light": "rgba(7, 193, 96, 0.2)",
@@ -191,5 +319,18 @@ class ThemeManager(QObject):
         # 特殊控件
         "shadow": "rgba(0, 0, 0, 0.3)", # 深色模式阴影加深
         "progress_bg": "#333333",
-        "progress_chunk": "#07C160",
+        "progress_chunk": PALETTE["wechat_green"],
     }
+
+
+# 调色板在类加载后冻结为只读映射：所有调用方共享同一份数据，
+# 不会被误改，基于调色板派生的样式表也因此可以安全缓存
+ThemeManager.LIGHT_THEME = MappingProxyType(ThemeManager.LIGHT_THEME)
+ThemeManager.DARK_THEME = MappingProxyType(ThemeManager.DARK_THEME)
+
+
+@lru_cache(maxsize=4)
+def _build_main_stylesheet(theme_name: str) -> str:
+    """按主题名生成主窗口样式表，来回切换主题时直接复用已生成的结果"""
+    colors = ThemeManager.DARK_THEME if theme_name == "dark" else ThemeManager.LIGHT_THEME
+    return get_main_stylesheet(colors)
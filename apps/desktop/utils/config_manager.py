@@ -5,13 +5,83 @@
 负责读写 configs/config.yaml 配置文件，管理 API Key 等敏感信息。
 """
 
+import copy
 import os
 import sys
+from functools import lru_cache, partial
+import ruamel.yaml
 from ruamel.yaml import YAML
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
+from .file_utils import atomic_write
+
+# ruamel.yaml 是否带有 libyaml C 扩展（ruamel.yaml.clib）
+# 只读模式使用 typ="safe" 加载器，有 C 扩展时自动使用 C 实现
+_HAS_LIBYAML = getattr(ruamel.yaml, "__with_libyaml__", False)
+if not _HAS_LIBYAML:
+    logging.info("未检测到 ruamel.yaml.clib，只读配置将使用纯 Python YAML 加载器")
+
+# 运行平台在进程内不变，平台相关的常量在导入时确定一次
+if sys.platform == "darwin":
+    # macOS
+    _PLATFORM_GUI_CONFIG = {
+        "search_website": "templates/search_website_mac.png",
+        "three_dots": "templates/three_dots_mac.png",
+        "turnback": "templates/turnback_mac.png"
+    }
+else:
+    # Windows 或其他
+    _PLATFORM_GUI_CONFIG = {
+        "search_website": "templates/search_website.png",
+        "three_dots": "templates/three_dots.png",
+        "turnback": "templates/turnback.png"
+    }
+
+if sys.platform == "darwin":
+    _PLATFORM_NAME = "macOS"
+elif sys.platform == "win32":
+    _PLATFORM_NAME = "Windows"
+else:
+    _PLATFORM_NAME = "Linux"
+
+
+@lru_cache(maxsize=1)
+def _discover_project_root() -> Path:
+    """通过文件系统定位项目根目录（结果在进程内不变，只查找一次）
+
+    Returns:
+        Path: 项目根目录路径
+    """
+    # 检查是否在 PyInstaller 打包环境中
+    if getattr(sys, 'frozen', False):
+        # 打包后使用 exe 所在目录
+        return Path(sys.executable).parent
+
+    # 开发环境：从当前文件向上查找
+    # 循环内使用字符串路径，只在返回时构造 Path
+    current = os.path.dirname(os.path.realpath(__file__))
+
+    for _ in range(10):  # 最多向上查找 10 级
+        # 每级只读一次目录，DirEntry 自带类型信息，无需逐个 stat
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name == "pyproject.toml":
+                        return Path(current)
+                    if entry.name == "configs" and entry.is_dir():
+                        return Path(current)
+        except OSError:
+            pass
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+
+    # 如果找不到，使用当前工作目录
+    return Path.cwd()
+
 
 class ConfigManager:
     """配置管理器
@@ -38,17 +108,27 @@ class ConfigManager:
     # 默认发布摘要
     DEFAULT_PUBLISH_DIGEST = "10分钟，掌握今日AI关键动态"
 
-    def __init__(self, config_path: Optional[str] = None):
+    # 已解析配置的进程级缓存：(文件绝对路径, 是否只读模式) -> (mtime_ns, 文件大小, 配置)
+    # 文件未变化时，新建的配置管理器直接复制缓存，无需重新解析 YAML
+    _parse_cache: Dict[tuple, tuple] = {}
+
+    def __init__(self, config_path: Optional[str] = None, read_only: bool = False):
         """初始化配置管理器
 
         Args:
             config_path: 配置文件路径，默认为 configs/config.yaml
+            read_only: 只读模式。只需读取配置的场景（如读取发布摘要）使用 safe 加载器，
+                有 libyaml C 扩展时解析更快；该模式不保留注释，因此不允许保存
         """
-        # 初始化 ruamel.yaml（保留注释和格式）
-        self.yaml = YAML()
-        self.yaml.preserve_quotes = True
-        self.yaml.default_flow_style = False
-        self.yaml.width = 4096  # 避免长行被折叠
+        self.read_only = read_only
+        if read_only:
+            self.yaml = YAML(typ="safe")
+        else:
+            # 初始化 ruamel.yaml（保留注释和格式）
+            self.yaml = YAML()
+            self.yaml.preserve_quotes = True
+            self.yaml.default_flow_style = False
+            self.yaml.width = 4096  # 避免长行被折叠
 
         # 确定项目根目录
         self.project_root = self._find_project_root()
@@ -71,9 +151,28 @@ class ConfigManager:
                     self.config_path = bundled_config
                     # 注意：_save_path 仍然指向 exe 旁边，确保保存时不会写入临时目录
 
-        # 加载配置
-        self.config: Dict[str, Any] = {}
-        self.load_config()
+        # .env 文件管理器（延迟创建，复用同一实例）及其内容缓存
+        self._env_manager = None
+        self._env_cache: Optional[Dict[str, str]] = None
+        # model_config 下 LLM / VLM 配置节的引用缓存（self.config 被替换时清空）
+        self._llm_cache: Optional[Dict[str, Any]] = None
+        self._vlm_cache: Optional[Dict[str, Any]] = None
+
+        # 配置内容在首次访问 self.config 时才加载（只需要路径信息时不解析 YAML）
+        self._config: Optional[Dict[str, Any]] = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """配置字典（首次访问时加载配置文件）"""
+        if self._config is None:
+            self.load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._llm_cache = None
+        self._vlm_cache = None
 
     def _find_project_root(self) -> Path:
         """查找项目根目录
@@ -89,26 +188,7 @@ class ConfigManager:
         if env_root:
             return Path(env_root)
 
-        # 检查是否在 PyInstaller 打包环境中
-        if getattr(sys, 'frozen', False):
-            # 打包后使用 exe 所在目录
-            return Path(sys.executable).parent
-
-        # 开发环境：从当前文件向上查找
-        current = Path(__file__).resolve().parent
-
-        for _ in range(10):  # 最多向上查找 10 级
-            if (current / "pyproject.toml").exists():
-                return current
-            if (current / "configs").is_dir():
-                return current
-            parent = current.parent
-            if parent == current:
-                break
-            current = parent
-
-        # 如果找不到，使用当前工作目录
-        return Path.cwd()
+        return _discover_project_root()
 
     def load_config(self) -> Dict[str, Any]:
         """加载配置文件
@@ -117,9 +197,22 @@ class ConfigManager:
             Dict: 配置字典
         """
         try:
-            if self.config_path.exists():
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    self.config = self.yaml.load(f) or {}
+            st = os.stat(self.config_path)
+        except OSError:
+            st = None
+
+        try:
+            if st is not None:
+                cache_key = self._parse_cache_key()
+                cached = self._parse_cache.get(cache_key)
+                if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    # 文件未变化：复制缓存（调用方会修改 self.config，不能共享同一对象）
+                    self.config = copy.deepcopy(cached[2])
+                else:
+                    with open(self.config_path, "r", encoding="utf-8") as f:
+                        self.config = self.yaml.load(f) or {}
+                    self._parse_cache[cache_key] = (
+                        st.st_mtime_ns, st.st_size, copy.deepcopy(self.config))
                 logging.info(f"配置文件加载成功: {self.config_path}")
             else:
                 logging.warning(f"配置文件不存在: {self.config_path}，使用默认配置")
@@ -128,8 +221,50 @@ class ConfigManager:
             logging.error(f"加载配置文件失败: {e}")
             self.config = self._get_default_config()
 
+        # 重新加载配置时 .env 文件也需要重新读取
+        self._env_cache = None
         return self.config
 
+    def _get_env_manager(self):
+        """获取 .env 文件管理器（首次使用时创建）"""
+        if self._env_manager is None:
+            from .env_file_manager import EnvFileManager
+            self._env_manager = EnvFileManager(self.project_root)
+        return self._env_manager
+
+    def _get_env_file_value(self, key: str) -> Optional[str]:
+        """读取 .env 文件中的变量值
+
+        首次读取时解析整个 .env 文件并缓存，之后直接查缓存；
+        通过本管理器写入 .env 或重新加载配置时缓存失效。
+
+        Args:
+            key: 环境变量名
+
+        Returns:
+            Optional[str]: 变量值，不存在返回 None
+        """
+        if self._env_cache is None:
+            self._env_cache = self._get_env_manager().read_all()
+        return self._env_cache.get(key)
+
+    def _write_env_value(self, key: str, value: str) -> None:
+        """写入 .env 文件中的变量（空字符串表示移除）"""
+        env_manager = self._get_env_manager()
+        if value:
+            env_manager.update(key, value)
+        else:
+            env_manager.remove(key)
+        self._env_cache = None
+
+    def reload_env(self) -> None:
+        """清空 .env 文件缓存，下次读取时重新解析（用于 .env 被外部修改后）"""
+        self._env_cache = None
+
+    def _parse_cache_key(self) -> tuple:
+        """解析缓存的键：同一文件的往返模式与只读模式解析结果类型不同，分开缓存"""
+        return (os.path.abspath(self.config_path), self.read_only)
+
     def save_config(self) -> bool:
         """保存配置到文件
 
@@ -140,17 +275,25 @@ class ConfigManager:
         Returns:
             bool: 保存是否成功
         """
+        if self.read_only:
+            # 只读模式加载的配置已丢失注释，写回会破坏配置文件格式
+            logging.error("只读模式的配置管理器不能保存配置")
+            return False
+
         try:
             # 确保目录存在（使用持久化保存路径）
             self._save_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self._save_path, "w", encoding="utf-8") as f:
-                self.yaml.dump(self.config, f)
+            atomic_write(self._save_path, partial(self.yaml.dump, self.config))
 
             logging.info(f"配置文件保存成功: {self._save_path}")
 
             # 保存后更新 config_path，后续读取使用新保存的文件
             self.config_path = self._save_path
+            # 文件内容已变化，丢弃该文件的解析缓存（包括只读模式的缓存）
+            path = os.path.abspath(self._save_path)
+            self._parse_cache.pop((path, False), None)
+            self._parse_cache.pop((path, True), None)
             return True
         except Exception as e:
             logging.error(f"保存配置文件失败: {e}")
@@ -188,20 +331,8 @@ class ConfigManager:
         Returns:
             Dict: GUI 模板路径配置
         """
-        if sys.platform == "darwin":
-            # macOS
-            return {
-                "search_website": "templates/search_website_mac.png",
-                "three_dots": "templates/three_dots_mac.png",
-                "turnback": "templates/turnback_mac.png"
-            }
-        else:
-            # Windows 或其他
-            return {
-                "search_website": "templates/search_website.png",
-                "three_dots": "templates/three_dots.png",
-                "turnback": "templates/turnback.png"
-            }
+        # 返回副本，调用方会直接修改 GUI_config 字典
+        return _PLATFORM_GUI_CONFIG.copy()
 
     # ==================== 日期配置管理 ====================
 
@@ -269,6 +400,9 @@ class ConfigManager:
         Args:
             urls: 文章链接列表
         """
+        # 内容未变化时保留原有序列对象，ruamel.yaml 写回时保留其注释和格式
+        if self.config.get("article_urls") == urls:
+            return
         self.config["article_urls"] = urls
 
     def add_article_url(self, url: str) -> bool:
@@ -280,10 +414,9 @@ class ConfigManager:
         Returns:
             bool: 是否添加成功（重复则返回 False）
         """
-        urls = self.get_article_urls()
+        urls = self.config.setdefault("article_urls", [])
         if url not in urls:
             urls.append(url)
-            self.config["article_urls"] = urls
             return True
         return False
 
@@ -298,8 +431,8 @@ class ConfigManager:
         """
         urls = self.get_article_urls()
         if url in urls:
+            # 能找到说明列表就是 self.config 中的对象，原地删除即可
             urls.remove(url)
-            self.config["article_urls"] = urls
             return True
         return False
 
@@ -320,9 +453,7 @@ class ConfigManager:
             return config_api_key
 
         # 2. 检查 .env 文件
-        from .env_file_manager import EnvFileManager
-        env_manager = EnvFileManager(self.project_root)
-        env_file_value = env_manager.get(self.API_KEY_ENV_NAME)
+        env_file_value = self._get_env_file_value(self.API_KEY_ENV_NAME)
         if env_file_value:
             return env_file_value
 
@@ -340,16 +471,12 @@ class ConfigManager:
             来源可能为: 'config' | 'env_file' | 'system' | 'not_set'
         """
         # 1. 先检查 config.yaml（只有值非空时才使用）
-        model_config = self.config.get("model_config", {})
-        llm_config = model_config.get("LLM", {})
-        config_value = llm_config.get("api_key")
+        config_value = self._llm().get("api_key")
         if config_value:  # 只有非空时才返回 config 来源
             return config_value, 'config'
 
         # 2. 检查 .env 文件
-        from .env_file_manager import EnvFileManager
-        env_manager = EnvFileManager(self.project_root)
-        env_file_value = env_manager.get(self.API_KEY_ENV_NAME)
+        env_file_value = self._get_env_file_value(self.API_KEY_ENV_NAME)
         if env_file_value:
             return env_file_value, 'env_file'
 
@@ -360,6 +487,34 @@ class ConfigManager:
 
         return None, 'not_set'
 
+    def _llm(self) -> Dict[str, Any]:
+        """获取 LLM 配置节（只读用途，配置节不存在时返回空字典）"""
+        if self._llm_cache is None:
+            section = (self.config.get("model_config") or {}).get("LLM")
+            if section is None:
+                # 不缓存临时空字典，之后由 setter 创建的配置节才能被读到
+                return {}
+            self._llm_cache = section
+        return self._llm_cache
+
+    def _vlm(self) -> Dict[str, Any]:
+        """获取 VLM 配置节（只读用途，配置节不存在时返回空字典）"""
+        if self._vlm_cache is None:
+            section = (self.config.get("model_config") or {}).get("VLM")
+            if section is None:
+                return {}
+            self._vlm_cache = section
+        return self._vlm_cache
+
+    def _ensure_model_config(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """确保 model_config 下的 LLM / VLM 配置节存在
+
+        Returns:
+            Tuple[Dict, Dict]: (LLM 配置节, VLM 配置节)
+        """
+        model_config = self.config.setdefault("model_config", {})
+        return model_config.setdefault("LLM", {}), model_config.setdefault("VLM", {})
+
     def set_api_key(self, api_key: str, save_to_env: bool = False) -> None:
         """设置 API Key
 
@@ -369,40 +524,18 @@ class ConfigManager:
         """
         if save_to_env:
             # 保存到 .env 文件
-            from .env_file_manager import EnvFileManager
-            env_manager = EnvFileManager(self.project_root)
-            
-            if api_key:
-                env_manager.update(self.API_KEY_ENV_NAME, api_key)
-            else:
-                # 空字符串表示清空
-                env_manager.remove(self.API_KEY_ENV_NAME)
+            self._write_env_value(self.API_KEY_ENV_NAME, api_key)
             
             # 配置文件中设为 null（确保不会从 config.yaml 读取）
-            if "model_config" not in self.config:
-                self.config["model_config"] = {}
-            if "LLM" not in self.config["model_config"]:
-                self.config["model_config"]["LLM"] = {}
-            if "VLM" not in self.config["model_config"]:
-                self.config["model_config"]["VLM"] = {}
-            self.config["model_config"]["LLM"]["api_key"] = None
-            self.config["model_config"]["VLM"]["api_key"] = None
+            llm, vlm = self._ensure_model_config()
+            llm["api_key"] = None
+            vlm["api_key"] = None
         else:
             # 保存到配置文件
-            if "model_config" not in self.config:
-                self.config["model_config"] = {}
-            if "LLM" not in self.config["model_config"]:
-                self.config["model_config"]["LLM"] = {}
-            if "VLM" not in self.config["model_config"]:
-                self.config["model_config"]["VLM"] = {}
-            
-            if api_key:
-                self.config["model_config"]["LLM"]["api_key"] = api_key
-                self.config["model_config"]["VLM"]["api_key"] = api_key
-            else:
-                # 空字符串表示清空，设为 None
-                self.config["model_config"]["LLM"]["api_key"] = None
-                self.config["model_config"]["VLM"]["api_key"] = None
+            llm, vlm = self._ensure_model_config()
+            # 空字符串表示清空，设为 None
+            llm["api_key"] = api_key or None
+            vlm["api_key"] = api_key or None
 
     # ==================== 模型配置管理 ====================
 
@@ -412,7 +545,7 @@ class ConfigManager:
         Returns:
             str: LLM 模型名称
         """
-        return self.config.get("model_config", {}).get("LLM", {}).get("model", "qwen-plus")
+        return self._llm().get("model", "qwen-plus")
 
     def set_llm_model(self, model: str) -> None:
         """设置 LLM 模型名称
@@ -420,11 +553,7 @@ class ConfigManager:
         Args:
             model: 模型名称
         """
-        if "model_config" not in self.config:
-            self.config["model_config"] = {}
-        if "LLM" not in self.config["model_config"]:
-            self.config["model_config"]["LLM"] = {}
-        self.config["model_config"]["LLM"]["model"] = model
+        self.config.setdefault("model_config", {}).setdefault("LLM", {})["model"] = model
 
     def get_vlm_model(self) -> str:
         """获取 VLM 模型名称
@@ -432,7 +561,7 @@ class ConfigManager:
         Returns:
             str: VLM 模型名称
         """
-        return self.config.get("model_config", {}).get("VLM", {}).get("model", "qwen3-vl-plus")
+        return self._vlm().get("model", "qwen3-vl-plus")
 
     def set_vlm_model(self, model: str) -> None:
         """设置 VLM 模型名称
@@ -440,11 +569,7 @@ class ConfigManager:
         Args:
             model: 模型名称
         """
-        if "model_config" not in self.config:
-            self.config["model_config"] = {}
-        if "VLM" not in self.config["model_config"]:
-            self.config["model_config"]["VLM"] = {}
-        self.config["model_config"]["VLM"]["model"] = model
+        self.config.setdefault("model_config", {}).setdefault("VLM", {})["model"] = model
 
     def get_enable_thinking(self) -> bool:
         """获取是否启用思考模式
@@ -452,7 +577,7 @@ class ConfigManager:
         Returns:
             bool: 是否启用思考模式
         """
-        return self.config.get("model_config", {}).get("LLM", {}).get("enable_thinking", True)
+        return self._llm().get("enable_thinking", True)
 
     def set_enable_thinking(self, enabled: bool) -> None:
         """设置是否启用思考模式
@@ -460,14 +585,9 @@ class ConfigManager:
         Args:
             enabled: 是否启用
         """
-        if "model_config" not in self.config:
-            self.config["model_config"] = {}
-        if "LLM" not in self.config["model_config"]:
-            self.config["model_config"]["LLM"] = {}
-        if "VLM" not in self.config["model_config"]:
-            self.config["model_config"]["VLM"] = {}
-        self.config["model_config"]["LLM"]["enable_thinking"] = enabled
-        self.config["model_config"]["VLM"]["enable_thinking"] = enabled
+        llm, vlm = self._ensure_model_config()
+        llm["enable_thinking"] = enabled
+        vlm["enable_thinking"] = enabled
 
     def get_thinking_budget(self) -> int:
         """获取思考预算（token 数量）
@@ -475,7 +595,7 @@ class ConfigManager:
         Returns:
             int: 思考预算，默认 1024
         """
-        return self.config.get("model_config", {}).get("LLM", {}).get("thinking_budget", 1024)
+        return self._llm().get("thinking_budget", 1024)
 
     def set_thinking_budget(self, budget: int) -> None:
         """设置思考预算（token 数量）
@@ -483,14 +603,9 @@ class ConfigManager:
         Args:
             budget: 思考预算
         """
-        if "model_config" not in self.config:
-            self.config["model_config"] = {}
-        if "LLM" not in self.config["model_config"]:
-            self.config["model_config"]["LLM"] = {}
-        if "VLM" not in self.config["model_config"]:
-            self.config["model_config"]["VLM"] = {}
-        self.config["model_config"]["LLM"]["thinking_budget"] = budget
-        self.config["model_config"]["VLM"]["thinking_budget"] = budget
+        llm, vlm = self._ensure_model_config()
+        llm["thinking_budget"] = budget
+        vlm["thinking_budget"] = budget
 
     # ==================== GUI 配置管理 ====================
 
@@ -526,12 +641,7 @@ class ConfigManager:
         Returns:
             str: 操作系统名称（Windows / macOS / Linux）
         """
-        if sys.platform == "darwin":
-            return "macOS"
-        elif sys.platform == "win32":
-            return "Windows"
-        else:
-            return "Linux"
+        return _PLATFORM_NAME
 
     # ==================== 环境变量检测 ====================
 
@@ -558,7 +668,7 @@ class ConfigManager:
         Returns:
             Optional[str]: 配置文件中的 API Key，如果未设置返回 None
         """
-        return self.config.get("model_config", {}).get("LLM", {}).get("api_key")
+        return self._llm().get("api_key")
 
     def get_config_path(self) -> Path:
         """获取配置文件路径
@@ -615,9 +725,7 @@ class ConfigManager:
             return config_value, 'config'
 
         # 2. 检查 .env 文件
-        from .env_file_manager import EnvFileManager
-        env_manager = EnvFileManager(self.project_root)
-        env_file_value = env_manager.get(self.WECHAT_APPID_ENV_NAME)
+        env_file_value = self._get_env_file_value(self.WECHAT_APPID_ENV_NAME)
         if env_file_value:
             return env_file_value, 'env_file'
 
@@ -645,9 +753,7 @@ class ConfigManager:
             return config_value, 'config'
 
         # 2. 检查 .env 文件
-        from .env_file_manager import EnvFileManager
-        env_manager = EnvFileManager(self.project_root)
-        env_file_value = env_manager.get(self.WECHAT_APPSECRET_ENV_NAME)
+        env_file_value = self._get_env_file_value(self.WECHAT_APPSECRET_ENV_NAME)
         if env_file_value:
             return env_file_value, 'env_file'
 
@@ -673,13 +779,7 @@ class ConfigManager:
             self.config["publish_config"]["appid"] = appid if appid else None
         else:
             # 保存到 .env 文件
-            from .env_file_manager import EnvFileManager
-            env_manager = EnvFileManager(self.project_root)
-            
-            if appid:
-                env_manager.update(self.WECHAT_APPID_ENV_NAME, appid)
-            else:
-                env_manager.remove(self.WECHAT_APPID_ENV_NAME)
+            self._write_env_value(self.WECHAT_APPID_ENV_NAME, appid)
             
             # 配置文件中设为 None
             if "publish_config" in self.config:
@@ -700,13 +800,7 @@ class ConfigManager:
             self.config["publish_config"]["appsecret"] = appsecret if appsecret else None
         else:
             # 保存到 .env 文件
-            from .env_file_manager import EnvFileManager
-            env_manager = EnvFileManager(self.project_root)
-            
-            if appsecret:
-                env_manager.update(self.WECHAT_APPSECRET_ENV_NAME, appsecret)
-            else:
-                env_manager.remove(self.WECHAT_APPSECRET_ENV_NAME)
+            self._write_env_value(self.WECHAT_APPSECRET_ENV_NAME, appsecret)
             
             # 配置文件中设为 None
             if "publish_config" in self.config:
@@ -881,9 +975,7 @@ class ConfigManager:
             return config_value, 'config'
 
         # 2. 检查 .env 文件
-        from .env_file_manager import EnvFileManager
-        env_manager = EnvFileManager(self.project_root)
-        env_file_value = env_manager.get(self.WECHAT_API_COOKIE_ENV_NAME)
+        env_file_value = self._get_env_file_value(self.WECHAT_API_COOKIE_ENV_NAME)
         if env_file_value:
             return env_file_value, 'env_file'
 
@@ -903,13 +995,7 @@ class ConfigManager:
         """
         if save_to_env:
             # 保存到 .env 文件
-            from .env_file_manager import EnvFileManager
-            env_manager = EnvFileManager(self.project_root)
-            
-            if cookie:
-                env_manager.update(self.WECHAT_API_COOKIE_ENV_NAME, cookie)
-            else:
-                env_manager.remove(self.WECHAT_API_COOKIE_ENV_NAME)
+            self._write_env_value(self.WECHAT_API_COOKIE_ENV_NAME, cookie)
             
             # 配置文件中设为 None
             self._get_api_config()["cookie"] = None
@@ -954,9 +1040,7 @@ class ConfigManager:
             return str(config_value), 'config'
 
         # 2. 检查 .env 文件
-        from .env_file_manager import EnvFileManager
-        env_manager = EnvFileManager(self.project_root)
-        env_file_value = env_manager.get(self.WECHAT_API_TOKEN_ENV_NAME)
+        env_file_value = self._get_env_file_value(self.WECHAT_API_TOKEN_ENV_NAME)
         if env_file_value:
             return env_file_value, 'env_file'
 
@@ -976,13 +1060,7 @@ class ConfigManager:
         """
         if save_to_env:
             # 保存到 .env 文件
-            from .env_file_manager import EnvFileManager
-            env_manager = EnvFileManager(self.project_root)
-            
-            if token:
-                env_manager.update(self.WECHAT_API_TOKEN_ENV_NAME, token)
-            else:
-                env_manager.remove(self.WECHAT_API_TOKEN_ENV_NAME)
+            self._write_env_value(self.WECHAT_API_TOKEN_ENV_NAME, token)
             
             # 配置文件中设为 None
             self._get_api_config()["token"] = None
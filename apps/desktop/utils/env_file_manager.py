@@ -10,6 +10,8 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 
+from .file_utils import atomic_write
+
 
 class EnvFileManager:
     """
@@ -26,6 +28,8 @@ class EnvFileManager:
         """
         self.env_file = project_root / ".env"
         self.project_root = project_root
+        # read_all 的解析缓存：(st_mtime_ns, st_size, 解析结果)
+        self._cache: Optional[Tuple[int, int, Dict[str, str]]] = None
     
     def exists(self) -> bool:
         """检查 .env 文件是否存在
@@ -35,32 +39,68 @@ class EnvFileManager:
         """
         return self.env_file.exists()
     
+    def _read_lines(self, keepends: bool = False) -> List[str]:
+        """一次性读取整个 .env 文件并拆分为行（文件很小，整体读取比逐行迭代开销更低）
+
+        Args:
+            keepends: 是否保留行尾换行符（重写文件时需要原样保留）
+
+        Returns:
+            List[str]: 文件中的所有行
+        """
+        with open(self.env_file, 'r', encoding='utf-8') as f:
+            # 只按 \n 拆分：str.splitlines 还会在 \x0c、\x85、\u2028 等字符处断行，
+            # 值中含有这些字符时会被拆坏
+            lines = f.read().split('\n')
+        # 文件以换行结尾（或为空）时最后一段是空串，不算一行
+        last = lines.pop()
+        if keepends:
+            lines = [line + '\n' for line in lines]
+        if last:
+            lines.append(last)
+        return lines
+
     def read_all(self) -> Dict[str, str]:
         """读取所有环境变量
         
         Returns:
             Dict[str, str]: 环境变量字典 {KEY: VALUE}
         """
-        if not self.exists():
+        return dict(self._read_cached())
+
+    def _read_cached(self) -> Dict[str, str]:
+        """读取并解析 .env 文件，文件 mtime/size 未变化时直接返回缓存结果
+
+        Returns:
+            Dict[str, str]: 环境变量字典（内部缓存对象，调用方不应修改）
+        """
+        try:
+            st = self.env_file.stat()
+        except FileNotFoundError:
+            self._cache = None
             return {}
-        
+
+        if self._cache and self._cache[:2] == (st.st_mtime_ns, st.st_size):
+            return self._cache[2]
+
         env_vars = {}
         try:
-            with open(self.env_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    # 跳过注释和空行
-                    if not line or line.startswith('#'):
-                        continue
-                    # 解析 KEY=VALUE
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")  # 移除引号
-                        env_vars[key] = value
+            for line in self._read_lines():
+                line = line.strip()
+                # 跳过注释和空行
+                if not line or line.startswith('#'):
+                    continue
+                # 解析 KEY=VALUE
+                if '=' in line:
+                    key, value = line.split('=', 1)
+                    key = key.strip()
+                    value = value.strip().strip('"').strip("'")  # 移除引号
+                    env_vars[key] = value
         except Exception as e:
             logging.error(f"读取 .env 文件失败: {e}")
-        
+            return env_vars
+
+        self._cache = (st.st_mtime_ns, st.st_size, env_vars)
         return env_vars
     
     def get(self, key: str) -> Optional[str]:
@@ -72,8 +112,7 @@ class EnvFileManager:
         Returns:
             Optional[str]: 环境变量值，不存在返回 None
         """
-        env_vars = self.read_all()
-        return env_vars.get(key)
+        return self._read_cached().get(key)
     
     def update(self, key: str, value: str) -> bool:
         """更新单个环境变量（保留注释和格式）
@@ -85,62 +124,83 @@ class EnvFileManager:
         Returns:
             bool: 是否成功
         """
+        return self.update_multiple({key: value})
+    
+    @staticmethod
+    def _apply_updates(lines: List[str], variables: Dict[str, str]) -> List[str]:
+        """在一次扫描中把 variables 应用到文件行上（保留注释和格式）
+        
+        已存在的键原地替换，不存在的键追加到末尾。
+        
+        Args:
+            lines: 原文件的所有行（保留换行符）
+            variables: 要写入的环境变量字典 {KEY: VALUE}
+            
+        Returns:
+            List[str]: 更新后的所有行
+        """
+        new_lines = []
+        found = set()
+        
+        for line in lines:
+            stripped = line.strip()
+            # 检查是否是要更新的键
+            if stripped and not stripped.startswith('#') and '=' in stripped:
+                existing_key = stripped.split('=', 1)[0].strip()
+                if existing_key in variables:
+                    # 更新这一行
+                    new_lines.append(f'{existing_key}="{variables[existing_key]}"\n')
+                    found.add(existing_key)
+                    continue
+            # 保留原行
+            new_lines.append(line)
+        
+        # 不存在的键追加到文件末尾
+        missing = [key for key in variables if key not in found]
+        if missing:
+            # 确保文件末尾有换行
+            if new_lines and not new_lines[-1].endswith('\n'):
+                new_lines[-1] += '\n'
+            for key in missing:
+                new_lines.append(f'{key}="{variables[key]}"\n')
+        
+        return new_lines
+    
+    def update_multiple(self, variables: Dict[str, str]) -> bool:
+        """批量更新环境变量（一次读取、一次写回）
+        
+        Args:
+            variables: 环境变量字典 {KEY: VALUE}
+            
+        Returns:
+            bool: 是否全部成功
+        """
         try:
             if not self.exists():
+                if not variables:
+                    return True
                 # 文件不存在，创建新文件
-                return self.create({key: value})
+                return self.create(variables)
             
-            # 读取所有行（保留注释和格式）
-            lines = []
-            key_found = False
+            # 值未变化的键无需写入，全部未变化时不触碰磁盘
+            current = self._read_cached()
+            variables = {k: v for k, v in variables.items() if current.get(k) != v}
+            if not variables:
+                return True
             
-            with open(self.env_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    stripped = line.strip()
-                    # 检查是否是要更新的键
-                    if stripped and not stripped.startswith('#') and '=' in stripped:
-                        existing_key = stripped.split('=', 1)[0].strip()
-                        if existing_key == key:
-                            # 更新这一行
-                            lines.append(f'{key}="{value}"\n')
-                            key_found = True
-                            continue
-                    # 保留原行
-                    lines.append(line)
-            
-            # 如果键不存在，追加到文件末尾
-            if not key_found:
-                # 确保文件末尾有换行
-                if lines and not lines[-1].endswith('\n'):
-                    lines[-1] += '\n'
-                lines.append(f'{key}="{value}"\n')
+            lines = self._apply_updates(self._read_lines(keepends=True), variables)
             
             # 写回文件
-            with open(self.env_file, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
+            atomic_write(self.env_file, lambda f: f.writelines(lines))
+            self._cache = None
             
-            logging.info(f"✅ 已更新 .env 文件: {key}")
+            logging.info(f"✅ 已更新 .env 文件: {', '.join(variables)}")
             return True
             
         except Exception as e:
             logging.error(f"更新 .env 文件失败: {e}")
             return False
     
-    def update_multiple(self, variables: Dict[str, str]) -> bool:
-        """批量更新环境变量
-        
-        Args:
-            variables: 环境变量字典 {KEY: VALUE}
-            
-        Returns:
-            bool: 是否全部成功
-        """
-        success = True
-        for key, value in variables.items():
-            if not self.update(key, value):
-                success = False
-        return success
-    
     def create(self, variables: Dict[str, str], with_header: bool = True) -> bool:
         """创建 .env 文件
         
@@ -152,7 +212,7 @@ class EnvFileManager:
             bool: 是否成功
         """
         try:
-            with open(self.env_file, 'w', encoding='utf-8') as f:
+            def write(f):
                 if with_header:
                     f.write("# 环境变量配置文件\n")
                     f.write("# 此文件包含敏感信息，请勿提交到版本控制系统\n")
@@ -166,6 +226,9 @@ class EnvFileManager:
                 for key, value in variables.items():
                     f.write(f'{key}="{value}"\n')
             
+            atomic_write(self.env_file, write)
+            self._cache = None
+            
             logging.info(f"✅ 已创建 .env 文件: {self.env_file}")
             return True
             
@@ -190,25 +253,24 @@ class EnvFileManager:
             lines = []
             key_found = False
             
-            with open(self.env_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    stripped = line.strip()
-                    # 检查是否是要删除的键
-                    if stripped and not stripped.startswith('#') and '=' in stripped:
-                        existing_key = stripped.split('=', 1)[0].strip()
-                        if existing_key == key:
-                            key_found = True
-                            continue  # 跳过这一行
-                    # 保留原行
-                    lines.append(line)
+            for line in self._read_lines(keepends=True):
+                stripped = line.strip()
+                # 检查是否是要删除的键
+                if stripped and not stripped.startswith('#') and '=' in stripped:
+                    existing_key = stripped.split('=', 1)[0].strip()
+                    if existing_key == key:
+                        key_found = True
+                        continue  # 跳过这一行
+                # 保留原行
+                lines.append(line)
             
             if not key_found:
                 logging.warning(f".env 文件中不存在键: {key}")
                 return True
             
             # 写回文件
-            with open(self.env_file, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
+            atomic_write(self.env_file, lambda f: f.writelines(lines))
+            self._cache = None
             
             logging.info(f"✅ 已从 .env 文件中移除: {key}")
             return True
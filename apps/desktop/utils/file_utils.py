@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+文件写入工具
+
+提供原子写文件的辅助函数，避免写入中途崩溃留下空的或不完整的配置文件。
+"""
+
+import os
+import stat
+from pathlib import Path
+from typing import Callable, TextIO
+
+
+def atomic_write(path: Path, writer: Callable[[TextIO], None]) -> None:
+    """原子地写入文本文件
+
+    先写入同目录下的临时文件，再通过 os.replace 替换目标文件。
+    目标文件已存在时沿用其权限位（.env 中可能有收紧过权限的密钥）。
+
+    Args:
+        path: 目标文件路径
+        writer: 写入函数，接收已打开的文本文件对象
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            writer(f)
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        # 写入失败时清理临时文件，原文件保持不变
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -6,8 +6,41 @@
 """
 
 import logging
-from typing import Optional
-from PyQt6.QtCore import QObject, pyqtSignal
+import threading
+from typing import List, Optional, Tuple
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """按秒缓存时间字符串的格式化器
+
+    日期格式只精确到秒，同一秒内的日志复用上一次的格式化结果，
+    省去每条日志的 localtime + strftime。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (秒, 格式化后的时间字符串)，整体替换以保证多线程下读取一致
+        self._last_time = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        last_sec, last_str = self._last_time
+        if sec == last_sec:
+            return last_str
+        text = super().formatTime(record, datefmt)
+        self._last_time = (sec, text)
+        return text
+
+
+# 日志格式化器无状态，所有处理器共用同一个实例
+_SHARED_FORMATTER = _SecondCachedFormatter(
+    "[%(asctime)s] %(levelname)-5s %(message)s",
+    datefmt="%H:%M:%S"
+)
+_SHARED_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(levelname)s - %(message)s"
+)
 
 
 class LogSignal(QObject):
@@ -15,21 +48,42 @@ class LogSignal(QObject):
     
     用于在日志线程和 UI 线程之间传递日志消息。
     """
-    # 日志消息信号：(消息文本, 日志级别)
-    log_message = pyqtSignal(str, int)
+    # 批量日志信号：[(消息文本, 日志级别), ...]
+    log_batch = pyqtSignal(list)
+    # 缓冲区由空变为非空时发出，在 UI 线程中启动合并定时器
+    flush_requested = pyqtSignal()
+
+    def __init__(self, interval_ms: int):
+        super().__init__()
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(interval_ms)
+        self.flush_requested.connect(self._start_flush_timer)
+
+    @pyqtSlot()
+    def _start_flush_timer(self) -> None:
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
 
 
 class QTextEditLogHandler(logging.Handler):
     """Qt 文本编辑器日志处理器
     
     将 logging 日志重定向到 Qt 信号，用于在 UI 中显示实时日志。
+    日志先进入缓冲区，每 FLUSH_INTERVAL_MS 毫秒或攒满 MAX_BATCH_SIZE 条时
+    通过 log_batch 信号整批发送，避免日志密集时每条都跨线程投递一次事件。
+    
+    需要在 UI 线程中创建。
     
     使用方法：
         handler = QTextEditLogHandler()
-        handler.log_signal.log_message.connect(your_slot_function)
+        handler.log_signal.log_batch.connect(your_slot_function)
         logging.getLogger().addHandler(handler)
     """
     
+    FLUSH_INTERVAL_MS = 50
+    MAX_BATCH_SIZE = 64
+    
     def __init__(self, level: int = logging.NOTSET):
         """初始化日志处理器
         
@@ -39,30 +93,50 @@ class QTextEditLogHandler(logging.Handler):
         super().__init__(level)
         
         # 创建信号对象
-        self.log_signal = LogSignal()
+        self.log_signal = LogSignal(self.FLUSH_INTERVAL_MS)
+        self.log_signal.flush_timer.timeout.connect(self.flush_batch)
+        
+        # 待发送的日志 (消息, 级别)，emit 可能来自任意线程，用锁保护
+        self._buffer: List[Tuple[str, int]] = []
+        self._buffer_lock = threading.Lock()
         
         # 设置日志格式
-        self.setFormatter(logging.Formatter(
-            "[%(asctime)s] %(levelname)-5s %(message)s",
-            datefmt="%H:%M:%S"
-        ))
+        self.setFormatter(_SHARED_FORMATTER)
     
     def emit(self, record: logging.LogRecord) -> None:
         """发送日志记录
         
-        将日志记录格式化后通过信号发送。
+        将日志记录格式化后放入缓冲区，由定时器或缓冲区满时批量发送。
         
         Args:
             record: 日志记录对象
         """
+        # 直接调用 handle() 时不经过 Logger 的级别判断，这里在格式化之前再过滤一次
+        if record.levelno < self.level:
+            return
         try:
             # 格式化日志消息
             msg = self.format(record)
-            # 通过信号发送日志消息和级别
-            self.log_signal.log_message.emit(msg, record.levelno)
+            batch = None
+            with self._buffer_lock:
+                self._buffer.append((msg, record.levelno))
+                pending = len(self._buffer)
+                if pending >= self.MAX_BATCH_SIZE:
+                    batch, self._buffer = self._buffer, []
+            if batch is not None:
+                self.log_signal.log_batch.emit(batch)
+            elif pending == 1:
+                self.log_signal.flush_requested.emit()
         except Exception:
             # 处理日志时出错，调用父类的错误处理
             self.handleError(record)
+    
+    def flush_batch(self) -> None:
+        """立即发送缓冲区中的日志"""
+        with self._buffer_lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self.log_signal.log_batch.emit(batch)
 
 
 class LogManager:
@@ -73,6 +147,8 @@ class LogManager:
     
     _instance: Optional["LogManager"] = None
     _qt_handler: Optional[QTextEditLogHandler] = None
+    # 保护 setup_logging，避免多线程同时配置时重复添加处理器
+    _lock = threading.Lock()
     
     def __new__(cls):
         """单例模式"""
@@ -101,40 +177,37 @@ class LogManager:
         Returns:
             QTextEditLogHandler: Qt 日志处理器，用于连接 UI
         """
-        # 获取根日志记录器
-        root_logger = logging.getLogger()
-        root_logger.setLevel(level)
-        
-        # 清除现有的处理器（避免重复添加）
-        root_logger.handlers.clear()
-        
-        # 添加控制台处理器
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
-        console_handler.setFormatter(logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s"
-        ))
-        root_logger.addHandler(console_handler)
-        
-        # 添加文件处理器（如果指定了文件）
-        if log_file:
-            try:
-                from pathlib import Path
-                Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-                file_handler = logging.FileHandler(log_file, encoding="utf-8")
-                file_handler.setLevel(level)
-                file_handler.setFormatter(logging.Formatter(
-                    "%(asctime)s - %(levelname)s - %(message)s"
-                ))
-                root_logger.addHandler(file_handler)
-            except Exception as e:
-                logging.warning(f"无法创建日志文件: {e}")
-        
-        # 创建并添加 Qt 处理器
-        self._qt_handler = QTextEditLogHandler(level)
-        root_logger.addHandler(self._qt_handler)
-        
-        return self._qt_handler
+        with self._lock:
+            # 获取根日志记录器
+            root_logger = logging.getLogger()
+            root_logger.setLevel(level)
+            
+            # 清除现有的处理器（避免重复添加）
+            root_logger.handlers.clear()
+            
+            # 添加控制台处理器
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(level)
+            console_handler.setFormatter(_SHARED_FILE_FORMATTER)
+            root_logger.addHandler(console_handler)
+            
+            # 添加文件处理器（如果指定了文件）
+            if log_file:
+                try:
+                    from pathlib import Path
+                    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+                    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+                    file_handler.setLevel(level)
+                    file_handler.setFormatter(_SHARED_FILE_FORMATTER)
+                    root_logger.addHandler(file_handler)
+                except Exception as e:
+                    logging.warning(f"无法创建日志文件: {e}")
+            
+            # 创建并添加 Qt 处理器
+            self._qt_handler = QTextEditLogHandler(level)
+            root_logger.addHandler(self._qt_handler)
+            
+            return self._qt_handler
     
     def get_qt_handler(self) -> Optional[QTextEditLogHandler]:
         """获取 Qt 日志处理器
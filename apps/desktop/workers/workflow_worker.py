@@ -7,7 +7,11 @@
 
 import asyncio
 import logging
+import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
 from datetime import datetime
 from typing import Optional, Callable
 from enum import Enum, auto
@@ -16,6 +20,7 @@ from PyQt6.QtCore import QThread, pyqtSignal
 # 导入工作流模块（从 src 中导入）
 from wechat_ai_daily.workflows import DailyGenerator, RPAArticleCollector, APIArticleCollector, DailyPublisher
 from wechat_ai_daily.workflows.base import CancelledError
+from wechat_ai_daily.utils.env_loader import find_project_root
 
 
 class WorkflowType(Enum):
@@ -26,6 +31,17 @@ class WorkflowType(Enum):
     FULL = auto()         # 完整流程（采集 + 生成 + 发布）
 
 
+class _StageCancelled(Exception):
+    """完整工作流的某个阶段已被取消（取消信号已发出）"""
+
+
+# 采集模式 -> (采集器类, run 是否为异步方法)
+_COLLECTORS = {
+    "api": (APIArticleCollector, False),
+    "rpa": (RPAArticleCollector, True),
+}
+
+
 class WorkflowWorker(QThread):
     """工作流执行线程
 
@@ -44,6 +60,13 @@ class WorkflowWorker(QThread):
     finished_signal = pyqtSignal(bool, str, str)  # (成功, 消息, 输出文件)
     error = pyqtSignal(str)
 
+    # 同步工作流对象缓存：(类, 配置路径) -> ((配置文件 mtime_ns, .env mtime_ns), 实例)
+    # 复用其 HTTP 会话与 access token；配置文件或 .env 变化后重新创建
+    # （构造时会读取 .env 中的 token / cookie / AppSecret 等凭据）。
+    # 持有 AsyncOpenAI 客户端的生成器/RPA 采集器不缓存：其连接池绑定创建时的事件循环，
+    # 而每次运行都会创建新的事件循环
+    _pool: dict[tuple[type, str], tuple[tuple[int, Optional[int]], object]] = {}
+
     def __init__(
         self,
         config_path: str,
@@ -76,39 +99,181 @@ class WorkflowWorker(QThread):
         self.workflow_type = workflow_type
         self.target_date = target_date
         self.collect_mode = collect_mode
+        # 非 api 的模式均按 RPA 处理
+        self._collector_cls, self._collector_is_async = _COLLECTORS.get(
+            collect_mode, _COLLECTORS["rpa"])
         self.markdown_file = markdown_file
         self.html_file = html_file
         self.title = title
+        # 目标日期字符串与发布标题在整个工作流中不变，只计算一次
+        self._date_str = target_date.strftime('%Y-%m-%d')
+        # 用户未填写标题则自动生成
+        self._publish_title = title or f"AI日报 - {self._date_str}"
         self.start_time = start_time
         self.end_time = end_time
+        # 取消标志：供同步阶段（API 采集、发布）中的 cancel_checker 轮询，
+        # 这些阶段在线程池中运行，task.cancel() 只能让 await 返回，无法中断线程本身
         self._is_cancelled = False
+        # 当前事件循环及正在执行的工作流任务，用于跨线程取消异步阶段
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        # 最近一次发出的进度 (进度值, 状态文本, 详细信息)，相同的进度不重复发出
+        self._last_progress: Optional[tuple[int, str, str]] = None
 
     def cancel(self) -> None:
-        """取消工作流执行"""
+        """取消工作流执行
+
+        设置取消标志，并把 task.cancel() 投递到工作线程的事件循环，
+        正在 await 的异步阶段会立即收到 asyncio.CancelledError，无需等到阶段结束。
+        """
         self._is_cancelled = True
         logging.warning("用户请求取消工作流")
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # 事件循环已关闭，工作流已结束
+                pass
+
+    def _get_or_create(self, cls: type):
+        """获取可复用的同步工作流对象（APIArticleCollector / DailyPublisher）
+
+        Args:
+            cls: 工作流类
+
+        Returns:
+            工作流对象，配置文件与 .env 文件均未变化时复用上次创建的实例
+        """
+        try:
+            config_mtime = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return cls(config=self.config_path)
+        try:
+            env_mtime = os.stat(find_project_root() / ".env").st_mtime_ns
+        except OSError:
+            env_mtime = None
+        stamp = (config_mtime, env_mtime)
+
+        key = (cls, self.config_path)
+        cached = self._pool.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        instance = cls(config=self.config_path)
+        self._pool[key] = (stamp, instance)
+        return instance
+
+    async def _collect(self, progress: int, status: str) -> str:
+        """创建当前模式的采集器并执行采集
+
+        Args:
+            progress: 采集器初始化完成时上报的进度值
+            status: 进度状态文本
+
+        Returns:
+            str: 采集生成的文章链接文件路径
+        """
+        if self._collector_is_async:
+            collector = self._collector_cls(config=self.config_path)
+        else:
+            collector = self._get_or_create(self._collector_cls)
+        # 设置取消检查回调
+        collector.set_cancel_checker(lambda: self._is_cancelled)
+
+        self._emit_progress(progress, status, "采集器已初始化，开始采集...")
+
+        if self._collector_is_async:
+            return await collector.run()
+        # 同步方法放到线程池中执行，避免阻塞事件循环
+        return await self._run_sync(collector.run)
+
+    async def _run_sync(self, func: Callable, *args, **kwargs):
+        """在事件循环的默认线程池中执行同步函数
+
+        与 asyncio.to_thread 不同，不复制 contextvars 上下文（工作流未使用 contextvars）。
+
+        线程中的同步调用无法被 task.cancel() 打断：收到取消时继续等待它结束
+        （通过 cancel_checker 抛出 CancelledError，或已经完成），再按真实结果返回，
+        避免界面提示已取消而后台仍在采集或发布。
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, partial(func, *args, **kwargs))
+        while True:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.done():
+                    return future.result()
+                logging.info("等待当前步骤响应取消请求...")
+
+    @asynccontextmanager
+    async def _stage(self, stage_name: str, error_label: str):
+        """完整工作流单个阶段的异常处理
+
+        阶段内被用户取消时记录日志并发出取消信号，再抛出 _StageCancelled 结束整个工作流；
+        其他异常包装为带阶段名称的错误信息。
+
+        Args:
+            stage_name: 阶段名称（用于取消日志）
+            error_label: 阶段失败时错误信息的前缀
+        """
+        try:
+            yield
+        except CancelledError:
+            # 工作流被用户取消
+            logging.info(f"完整工作流已被用户取消（{stage_name}阶段）")
+            self.finished_signal.emit(False, "用户取消了操作", "")
+            raise _StageCancelled from None
+        except Exception as e:
+            raise Exception(f"{error_label}阶段失败: {str(e)}") from e
+
+    def _emit_progress(self, value: int, status: str, detail: str) -> None:
+        """发出进度信号（与上一次完全相同时跳过，避免无效的跨线程投递）"""
+        progress = (value, status, detail)
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+        self.progress.emit(value, status, detail)
 
     def run(self) -> None:
         """线程执行入口"""
         self.started_signal.emit()
 
         try:
-            # 创建新的事件循环（因为在新线程中）
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                # 根据工作流类型执行对应任务
-                if self.workflow_type == WorkflowType.COLLECT:
-                    loop.run_until_complete(self._run_collect())
-                elif self.workflow_type == WorkflowType.GENERATE:
-                    loop.run_until_complete(self._run_generate())
-                elif self.workflow_type == WorkflowType.PUBLISH:
-                    loop.run_until_complete(self._run_publish())
-                elif self.workflow_type == WorkflowType.FULL:
-                    loop.run_until_complete(self._run_full())
-            finally:
-                loop.close()
+            # 由 asyncio.Runner 管理本线程的事件循环：退出时除关闭循环外，
+            # 还会清理异步生成器并等待默认线程池结束
+            with asyncio.Runner() as runner:
+                loop = runner.get_loop()
+                # 各阶段依次执行，同一时刻最多只有一个同步调用
+                loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix="workflow"))
+                try:
+                    # 根据工作流类型执行对应任务
+                    if self.workflow_type == WorkflowType.COLLECT:
+                        coro = self._run_collect()
+                    elif self.workflow_type == WorkflowType.GENERATE:
+                        coro = self._run_generate()
+                    elif self.workflow_type == WorkflowType.PUBLISH:
+                        coro = self._run_publish()
+                    elif self.workflow_type == WorkflowType.FULL:
+                        coro = self._run_full()
+                    else:
+                        coro = None
+
+                    if coro is not None:
+                        self._task = loop.create_task(coro)
+                        self._loop = loop
+                        # 任务创建前已请求取消时，直接取消
+                        if self._is_cancelled:
+                            self._task.cancel()
+                        try:
+                            loop.run_until_complete(self._task)
+                        except asyncio.CancelledError:
+                            logging.info("工作流已被用户取消")
+                            self.finished_signal.emit(False, "用户取消了操作", "")
+                finally:
+                    self._loop = None
+                    self._task = None
 
         except Exception as e:
             error_msg = f"工作流执行失败: {str(e)}"
@@ -132,40 +297,16 @@ class WorkflowWorker(QThread):
                 f"{self.end_time.strftime('%Y-%m-%d %H:%M')}"
             )
         else:
-            logging.info(f"目标日期: {self.target_date.strftime('%Y-%m-%d')}")
+            logging.info(f"目标日期: {self._date_str}")
         logging.info("=" * 50)
 
-        self.progress.emit(0, f"正在采集公众号文章 ({mode_text}模式)", "初始化采集器...")
+        self._emit_progress(0, f"正在采集公众号文章 ({mode_text}模式)", "初始化采集器...")
 
         try:
-            if self.collect_mode == "api":
-                # API 模式：使用 APIArticleCollector（同步方法）
-                collector = APIArticleCollector(config=self.config_path)
-                # 设置取消检查回调
-                collector.set_cancel_checker(lambda: self._is_cancelled)
-
-                self.progress.emit(
-                    10, f"正在采集公众号文章 ({mode_text}模式)", "采集器已初始化，开始采集...")
-
-                # 执行采集（同步调用）
-                output_file = collector.run()
-            else:
-                # RPA 模式：使用 RPAArticleCollector（异步方法）
-                collector = RPAArticleCollector(config=self.config_path)
-                # 设置取消检查回调
-                collector.set_cancel_checker(lambda: self._is_cancelled)
-
-                self.progress.emit(
-                    10, f"正在采集公众号文章 ({mode_text}模式)", "采集器已初始化，开始采集...")
-
-                # 执行采集（异步调用）
-                output_file = await collector.run()
+            output_file = await self._collect(
+                10, f"正在采集公众号文章 ({mode_text}模式)")
 
-            if self._is_cancelled:
-                self.finished_signal.emit(False, "用户取消了操作", "")
-                return
-
-            self.progress.emit(100, "采集完成", f"输出文件: {output_file}")
+            self._emit_progress(100, "采集完成", f"输出文件: {output_file}")
             logging.info(f"文章采集完成，输出文件: {output_file}")
 
             self.finished_signal.emit(True, "文章采集完成", output_file)
@@ -185,10 +326,10 @@ class WorkflowWorker(QThread):
         logging.info("=" * 50)
         logging.info("开始执行公众号文章内容生成工作流")
         logging.info(f"输入文件: {self.markdown_file}")
-        logging.info(f"目标日期: {self.target_date.strftime('%Y-%m-%d')}")
+        logging.info(f"目标日期: {self._date_str}")
         logging.info("=" * 50)
 
-        self.progress.emit(0, "正在生成公众号文章内容", "初始化生成器...")
+        self._emit_progress(0, "正在生成公众号文章内容", "初始化生成器...")
 
         try:
             # 创建生成器
@@ -196,7 +337,7 @@ class WorkflowWorker(QThread):
             # 设置取消检查回调
             generator.set_cancel_checker(lambda: self._is_cancelled)
 
-            self.progress.emit(10, "正在生成公众号文章内容", "生成器已初始化，开始生成...")
+            self._emit_progress(10, "正在生成公众号文章内容", "生成器已初始化，开始生成...")
 
             # 执行生成
             # API 模式需要按“时间范围”过滤，RPA 模式按“目标日期”过滤
@@ -209,11 +350,7 @@ class WorkflowWorker(QThread):
                 end_time=end_time
             )
 
-            if self._is_cancelled:
-                self.finished_signal.emit(False, "用户取消了操作", "")
-                return
-
-            self.progress.emit(100, "公众号文章内容生成完成", f"输出文件: {output_file}")
+            self._emit_progress(100, "公众号文章内容生成完成", f"输出文件: {output_file}")
             logging.info(f"公众号文章内容生成完成，输出文件: {output_file}")
 
             self.finished_signal.emit(True, "公众号文章内容生成完成", output_file or "")
@@ -233,43 +370,37 @@ class WorkflowWorker(QThread):
         logging.info("=" * 50)
         logging.info("开始执行发布草稿工作流")
         logging.info(f"输入文件: {self.html_file}")
-        logging.info(f"目标日期: {self.target_date.strftime('%Y-%m-%d')}")
+        logging.info(f"目标日期: {self._date_str}")
         logging.info("=" * 50)
 
-        self.progress.emit(0, "正在发布草稿", "初始化发布器...")
+        self._emit_progress(0, "正在发布草稿", "初始化发布器...")
 
         try:
             # 创建发布器
-            publisher = DailyPublisher(config=self.config_path)
+            publisher = self._get_or_create(DailyPublisher)
             # 设置取消检查回调
             publisher.set_cancel_checker(lambda: self._is_cancelled)
 
-            self.progress.emit(20, "正在发布草稿", "发布器已初始化，开始发布...")
+            self._emit_progress(20, "正在发布草稿", "发布器已初始化，开始发布...")
 
-            # 确定标题（用户未填写则自动生成）
-            title = self.title
-            if not title:
-                title = f"AI日报 - {self.target_date.strftime('%Y-%m-%d')}"
+            title = self._publish_title
 
             logging.info(f"使用标题: {title}")
 
             # 从配置读取摘要描述
             from apps.desktop.utils.config_manager import ConfigManager
-            cfg_manager = ConfigManager(self.config_path)
+            cfg_manager = ConfigManager(self.config_path, read_only=True)
             digest = cfg_manager.get_publish_digest()
 
-            # 执行发布（DailyPublisher.run 是同步方法）
-            draft_media_id = publisher.run(
+            # 执行发布（DailyPublisher.run 是同步方法，放到线程池中执行）
+            draft_media_id = await self._run_sync(
+                publisher.run,
                 html_path=self.html_file,
                 title=title,
                 digest=digest
             )
 
-            if self._is_cancelled:
-                self.finished_signal.emit(False, "用户取消了操作", "")
-                return
-
-            self.progress.emit(100, "发布完成", f"草稿 media_id: {draft_media_id}")
+            self._emit_progress(100, "发布完成", f"草稿 media_id: {draft_media_id}")
             logging.info(f"草稿发布完成，media_id: {draft_media_id}")
 
             # 返回 media_id 作为输出（用特殊前缀标识）
@@ -299,129 +430,77 @@ class WorkflowWorker(QThread):
                 f"{self.end_time.strftime('%Y-%m-%d %H:%M')}"
             )
         else:
-            logging.info(f"目标日期: {self.target_date.strftime('%Y-%m-%d')}")
+            logging.info(f"目标日期: {self._date_str}")
         logging.info("=" * 50)
 
-        # 阶段1：采集文章（根据模式选择采集器）
-        self.progress.emit(0, f"阶段 1/3: 采集公众号文章 ({mode_text}模式)", "初始化采集器...")
-
         try:
-            if self.collect_mode == "api":
-                # API 模式：使用 APIArticleCollector（同步方法）
-                collector = APIArticleCollector(config=self.config_path)
-                # 设置取消检查回调
-                collector.set_cancel_checker(lambda: self._is_cancelled)
-
-                self.progress.emit(
-                    5, f"阶段 1/3: 采集公众号文章 ({mode_text}模式)", "采集器已初始化，开始采集...")
-
-                # 执行采集（同步调用）
-                markdown_file = collector.run()
-            else:
-                # RPA 模式：使用 RPAArticleCollector（异步方法）
-                collector = RPAArticleCollector(config=self.config_path)
-                # 设置取消检查回调
-                collector.set_cancel_checker(lambda: self._is_cancelled)
-
-                self.progress.emit(
-                    5, f"阶段 1/3: 采集公众号文章 ({mode_text}模式)", "采集器已初始化，开始采集...")
-
-                # 执行采集（异步调用）
-                markdown_file = await collector.run()
+            # 阶段1：采集文章（根据模式选择采集器）
+            self._emit_progress(0, f"阶段 1/3: 采集公众号文章 ({mode_text}模式)", "初始化采集器...")
 
-            if self._is_cancelled:
-                self.finished_signal.emit(False, "用户取消了操作", "")
-                return
+            async with self._stage("采集", "文章采集"):
+                markdown_file = await self._collect(
+                    5, f"阶段 1/3: 采集公众号文章 ({mode_text}模式)")
 
-            self.progress.emit(33, "阶段 1/3: 采集完成",
-                               f"已采集到文章链接: {markdown_file}")
-            logging.info(f"文章采集完成: {markdown_file}")
-
-        except CancelledError:
-            # 工作流被用户取消
-            logging.info("完整工作流已被用户取消（采集阶段）")
-            self.finished_signal.emit(False, "用户取消了操作", "")
-            return
-        except Exception as e:
-            raise Exception(f"文章采集阶段失败: {str(e)}") from e
+                self._emit_progress(33, "阶段 1/3: 采集完成",
+                                   f"已采集到文章链接: {markdown_file}")
+                logging.info(f"文章采集完成: {markdown_file}")
 
-        # 阶段2：生成公众号文章内容
-        self.progress.emit(35, "阶段 2/3: 生成公众号文章内容", "初始化生成器...")
-
-        try:
-            generator = DailyGenerator(config=self.config_path)
-            # 设置取消检查回调
-            generator.set_cancel_checker(lambda: self._is_cancelled)
-
-            self.progress.emit(40, "阶段 2/3: 生成公众号文章内容", "生成器已初始化，开始生成...")
-
-            # API 模式需要按“时间范围”过滤，RPA 模式按“目标日期”过滤
-            start_time = self.start_time if self.collect_mode == "api" else None
-            end_time = self.end_time if self.collect_mode == "api" else None
-            html_file = await generator.run(
-                markdown_file=markdown_file,
-                date=self.target_date,
-                start_time=start_time,
-                end_time=end_time
-            )
+            # 阶段2：生成公众号文章内容
+            self._emit_progress(35, "阶段 2/3: 生成公众号文章内容", "初始化生成器...")
 
-            if self._is_cancelled:
-                self.finished_signal.emit(False, "用户取消了操作", "")
-                return
+            async with self._stage("生成", "公众号文章内容生成"):
+                generator = DailyGenerator(config=self.config_path)
+                # 设置取消检查回调
+                generator.set_cancel_checker(lambda: self._is_cancelled)
 
-            self.progress.emit(66, "阶段 2/3: 生成完成", f"公众号文章内容文件: {html_file}")
-            logging.info(f"公众号文章内容生成完成: {html_file}")
+                self._emit_progress(40, "阶段 2/3: 生成公众号文章内容", "生成器已初始化，开始生成...")
 
-        except CancelledError:
-            # 工作流被用户取消
-            logging.info("完整工作流已被用户取消（生成阶段）")
-            self.finished_signal.emit(False, "用户取消了操作", "")
-            return
-        except Exception as e:
-            raise Exception(f"公众号文章内容生成阶段失败: {str(e)}") from e
+                # API 模式需要按“时间范围”过滤，RPA 模式按“目标日期”过滤
+                start_time = self.start_time if self.collect_mode == "api" else None
+                end_time = self.end_time if self.collect_mode == "api" else None
+                html_file = await generator.run(
+                    markdown_file=markdown_file,
+                    date=self.target_date,
+                    start_time=start_time,
+                    end_time=end_time
+                )
 
-        # 阶段3：发布草稿
-        self.progress.emit(70, "阶段 3/3: 发布到公众号草稿", "初始化发布器...")
+                self._emit_progress(66, "阶段 2/3: 生成完成", f"公众号文章内容文件: {html_file}")
+                logging.info(f"公众号文章内容生成完成: {html_file}")
 
-        try:
-            publisher = DailyPublisher(config=self.config_path)
-            # 设置取消检查回调
-            publisher.set_cancel_checker(lambda: self._is_cancelled)
+            # 阶段3：发布草稿
+            self._emit_progress(70, "阶段 3/3: 发布到公众号草稿", "初始化发布器...")
 
-            self.progress.emit(75, "阶段 3/3: 发布到公众号草稿", "发布器已初始化，开始发布...")
+            async with self._stage("发布", "发布草稿"):
+                publisher = self._get_or_create(DailyPublisher)
+                # 设置取消检查回调
+                publisher.set_cancel_checker(lambda: self._is_cancelled)
 
-            # 确定标题（用户未填写则自动生成）
-            title = self.title
-            if not title:
-                title = f"AI日报 - {self.target_date.strftime('%Y-%m-%d')}"
+                self._emit_progress(75, "阶段 3/3: 发布到公众号草稿", "发布器已初始化，开始发布...")
 
-            logging.info(f"使用标题: {title}")
+                title = self._publish_title
 
-            # 从配置读取摘要描述
-            from apps.desktop.utils.config_manager import ConfigManager
-            cfg_manager = ConfigManager(self.config_path)
-            digest = cfg_manager.get_publish_digest()
+                logging.info(f"使用标题: {title}")
 
-            # 执行发布（DailyPublisher.run 是同步方法）
-            draft_media_id = publisher.run(
-                html_path=html_file,
-                title=title,
-                digest=digest
-            )
+                # 从配置读取摘要描述
+                from apps.desktop.utils.config_manager import ConfigManager
+                cfg_manager = ConfigManager(self.config_path, read_only=True)
+                digest = cfg_manager.get_publish_digest()
 
-            if self._is_cancelled:
-                self.finished_signal.emit(False, "用户取消了操作", "")
-                return
+                # 执行发布（DailyPublisher.run 是同步方法，放到线程池中执行）
+                draft_media_id = await self._run_sync(
+                    publisher.run,
+                    html_path=html_file,
+                    title=title,
+                    digest=digest
+                )
 
-            self.progress.emit(100, "全部完成", f"草稿 media_id: {draft_media_id}")
-            logging.info(f"草稿发布完成: {draft_media_id}")
+                self._emit_progress(100, "全部完成", f"草稿 media_id: {draft_media_id}")
+                logging.info(f"草稿发布完成: {draft_media_id}")
 
-            self.finished_signal.emit(
-                True, "完整工作流执行完成", f"draft:{draft_media_id}")
+                self.finished_signal.emit(
+                    True, "完整工作流执行完成", f"draft:{draft_media_id}")
 
-        except CancelledError:
-            # 工作流被用户取消
-            logging.info("完整工作流已被用户取消（发布阶段）")
-            self.finished_signal.emit(False, "用户取消了操作", "")
-        except Exception as e:
-            raise Exception(f"发布草稿阶段失败: {str(e)}") from e
+        except _StageCancelled:
+            # 取消已在 _stage 中记录并通知，直接结束
+            return
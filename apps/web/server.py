@@ -500,7 +500,7 @@ class WorkflowRunner:
 
         title = params.title or f"AI日报 - {params.target_date.strftime('%Y-%m-%d')}"
         # 从配置读取摘要描述
-        cfg_manager = ConfigManager(str(CONFIG_PATH))
+        cfg_manager = ConfigManager(str(CONFIG_PATH), read_only=True)
         cfg_manager.load_config()
         digest = cfg_manager.get_publish_digest()
         draft_media_id = await asyncio.to_thread(
@@ -617,7 +617,7 @@ class WorkflowRunner:
 
         title = params.title or f"AI日报 - {params.target_date.strftime('%Y-%m-%d')}"
         # 从配置读取摘要描述
-        cfg_manager = ConfigManager(str(CONFIG_PATH))
+        cfg_manager = ConfigManager(str(CONFIG_PATH), read_only=True)
         cfg_manager.load_config()
         digest = cfg_manager.get_publish_digest()
         draft_media_id = await asyncio.to_thread(
@@ -681,7 +681,7 @@ async def index() -> FileResponse:
 
 @app.get("/api/config")
 async def get_config() -> Dict[str, Any]:
-    manager = ConfigManager(str(CONFIG_PATH))
+    manager = ConfigManager(str(CONFIG_PATH), read_only=True)
     manager.load_config()
 
     api_key, api_key_source = manager.get_api_key_with_source()
@@ -799,7 +799,7 @@ async def update_config(payload: ConfigUpdateRequest) -> Dict[str, Any]:
 
 @app.post("/api/workflow/start")
 async def start_workflow(payload: WorkflowStartRequest) -> Dict[str, Any]:
-    manager = ConfigManager(str(CONFIG_PATH))
+    manager = ConfigManager(str(CONFIG_PATH), read_only=True)
     manager.load_config()
 
     # 解析日期参数
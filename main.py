@@ -63,7 +63,7 @@ def parse_target_date(config_path: str = "configs/config.yaml") -> datetime:
         datetime: 解析后的目标日期
     """
     try:
-        yaml = YAML()
+        yaml = YAML(typ="safe")
         with open(config_path, "r", encoding="utf-8") as f:
             config = yaml.load(f) or {}
     except Exception as e:
@@ -100,7 +100,7 @@ def parse_date_range(config_path: str = "configs/config.yaml") -> tuple[datetime
         tuple[datetime, datetime]: (开始时间, 结束时间) 元组
     """
     try:
-        yaml = YAML()
+        yaml = YAML(typ="safe")
         with open(config_path, "r", encoding="utf-8") as f:
             config = yaml.load(f) or {}
     except Exception as e:
@@ -383,7 +383,7 @@ async def main():
         logging.info(f"使用标题: {title}")
 
         # 从配置读取摘要描述
-        yaml_reader = YAML()
+        yaml_reader = YAML(typ="safe")
         with open("configs/config.yaml", "r", encoding="utf-8") as f:
             pub_config = yaml_reader.load(f) or {}
         digest = pub_config.get("publish_config", {}).get("digest", "")
@@ -69,7 +69,7 @@ class APIArticleCollector(BaseWorkflow):
             raise FileNotFoundError(f"配置文件不存在: {config}")
 
         # 加载配置文件
-        yaml = YAML()
+        yaml = YAML(typ="safe")
         with open(config, "r", encoding="utf-8") as f:
             self.config = yaml.load(f)
 
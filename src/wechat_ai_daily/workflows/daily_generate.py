@@ -34,6 +34,9 @@ class DailyGenerator(BaseWorkflow):
     4. 使用LLM综合所有公众号文章的摘要内容，生成每日AI公众号文章内容，这些内容需要符合富文本的要求，可以直接复制粘贴形成我自己的公众号内容
     """
 
+    # 生成文章摘要时同时进行的大模型请求数上限
+    SUMMARY_CONCURRENCY = 8
+
     def __init__(self,
                  config: str = "configs/config.yaml",
                  llm_client: Optional[AsyncOpenAI] = None,
@@ -49,7 +52,7 @@ class DailyGenerator(BaseWorkflow):
         super().__init__()
 
         # 读取配置文件
-        yaml = YAML()
+        yaml = YAML(typ="safe")
         with open(config, "r", encoding="utf-8") as f:
             self.config = yaml.load(f)
 
@@ -1170,23 +1173,36 @@ class DailyGenerator(BaseWorkflow):
             logging.warning("未提取到任何文章，工作流结束")
             return []
 
-        # 步骤2：为每篇文章生成摘要
+        # 步骤2：为每篇文章生成摘要（各篇文章相互独立，限制并发数后并发调用大模型）
         logging.info("步骤2: 生成文章摘要...")
         total_articles = len(articles)
-        for index, article in enumerate(articles, 1):
-            # 检查是否被取消
-            self.check_cancelled()
+        semaphore = asyncio.Semaphore(self.SUMMARY_CONCURRENCY)
+
+        async def summarize(index: int, article: ArticleMetadata) -> Optional[ArticleSummary]:
+            async with semaphore:
+                # 检查是否被取消
+                self.check_cancelled()
+                return await self._generate_one_article_summary(
+                    article,
+                    index,
+                    total_articles
+                )
 
-            summary = await self._generate_one_article_summary(
-                article,
-                index,
-                total_articles
-            )
+        tasks = [asyncio.ensure_future(summarize(index, article))
+                 for index, article in enumerate(articles, 1)]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # 取消或异常时停止其余尚未完成的摘要任务
+            for task in tasks:
+                task.cancel()
+            raise
+
+        for article, summary in zip(articles, results):
             if summary:
                 summaries.append(summary)
             else:
                 logging.error(f"生成文章摘要失败: {article.title}")
-                continue
 
         # 步骤3：按评分降序排列
         summaries.sort(key=lambda x: x.score, reverse=True)
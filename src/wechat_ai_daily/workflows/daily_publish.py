@@ -7,7 +7,7 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 import requests
 
-from .base import BaseWorkflow
+from .base import BaseWorkflow, CancelledError
 from ..utils.wechat import PublishClient
 
 
@@ -292,11 +292,16 @@ class DailyPublisher(BaseWorkflow):
             logging.info(
                 f"✓ 基于HTML富文本内容构建微信公众号草稿内容成功，长度: {len(wechat_content)} 字符")
 
+            # 创建草稿不可撤销，执行前最后检查一次取消状态
+            self.check_cancelled()
+
             logging.info(f"✓ 开始创建微信公众号草稿...")
             draft_media_id = self._create_draft(wechat_content, title, digest)
             logging.info(f"✓ 微信公众号草稿创建成功，media_id: {draft_media_id}")
             return draft_media_id
 
+        except CancelledError:
+            raise
         except FileNotFoundError as e:
             logging.exception(f"HTML文件不存在: {e}")
             raise
@@ -323,6 +328,9 @@ class DailyPublisher(BaseWorkflow):
             draft_media_id = self.build_workflow(html_path, title, digest)
             logging.info(f"✓ 微信公众号自动发布工作流运行成功，media_id: {draft_media_id}")
             return draft_media_id
+        except CancelledError:
+            logging.info("微信公众号自动发布工作流已被取消")
+            raise
         except Exception as e:
             logging.exception(f"微信公众号自动发布工作流运行失败: {e}")
             raise
@@ -70,7 +70,7 @@ class RPAArticleCollector(BaseWorkflow):
         """
         # 获取操作系统的名称
         self.os_name = sys.platform
-        yaml = YAML()
+        yaml = YAML(typ="safe")
         with open(config, "r", encoding="utf-8") as f:
             self.config = yaml.load(f)
 
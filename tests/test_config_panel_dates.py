@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+测试配置面板保存日期配置
+
+配置文件中日期为空时，界面显示回退值（当天）；保存配置时必须把界面上显示的日期
+写入配置文件，否则 API 采集会因缺少 start_date / end_date 失败。
+"""
+
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# 添加项目根目录和 src 目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+from ruamel.yaml import YAML
+
+from apps.desktop.utils.config_manager import ConfigManager
+from apps.desktop.panels.config_panel import ConfigPanel
+
+
+def test_save_writes_displayed_dates_when_config_dates_are_null():
+    """测试：配置文件中日期为空时，保存会写入界面显示的日期"""
+    app = QApplication.instance() or QApplication([])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        # API Key 保存在 config.yaml 中，面板默认选择 config 保存方式（不会弹出 .env 提示框）
+        config_content = """target_date: null
+start_date:
+end_date:
+article_urls: []
+model_config:
+  LLM:
+    model: qwen-plus
+    api_key: sk-config-key
+  VLM:
+    model: qwen3-vl-plus
+    api_key: sk-config-key
+"""
+        config_path.write_text(config_content, encoding='utf-8')
+
+        old_root = os.environ.get('WECHAT_AI_DAILY_ROOT')
+        os.environ['WECHAT_AI_DAILY_ROOT'] = tmpdir
+        try:
+            config_manager = ConfigManager(str(config_path))
+            panel = ConfigPanel(config_manager)
+
+            assert panel.save_config(), "保存配置失败"
+
+            start_datetime, end_datetime = panel.get_selected_date_range()
+            saved = YAML(typ="safe").load(config_path.read_text(encoding='utf-8'))
+            assert saved["start_date"] == start_datetime.strftime("%Y-%m-%d %H:%M"), \
+                f"start_date 未写入: {saved['start_date']!r}"
+            assert saved["end_date"] == end_datetime.strftime("%Y-%m-%d %H:%M"), \
+                f"end_date 未写入: {saved['end_date']!r}"
+            # 日期字符串可能被 YAML 解析为 date 对象，统一转为字符串比较
+            assert str(saved["target_date"]) == panel.get_selected_date().strftime("%Y-%m-%d"), \
+                f"target_date 未写入: {saved['target_date']!r}"
+
+            # 再次保存时日期已与配置文件一致，不应有任何变化
+            mtime = config_path.stat().st_mtime_ns
+            assert panel.save_config()
+            assert config_path.stat().st_mtime_ns == mtime, "配置未变化时不应重写配置文件"
+
+            print("✓ 测试通过：日期为空时保存会写入界面显示的日期")
+
+        finally:
+            if old_root is None:
+                os.environ.pop('WECHAT_AI_DAILY_ROOT', None)
+            else:
+                os.environ['WECHAT_AI_DAILY_ROOT'] = old_root
+
+
+def test_load_dates_without_zero_padding():
+    """测试：月、日未补零的日期字符串（如 2025-1-5）也能正确解析，不会被回退值覆盖"""
+    app = QApplication.instance() or QApplication([])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        # 日期加引号，确保按字符串读取而不是被 YAML 解析为日期对象
+        config_content = """target_date: "2025-1-5"
+start_date: "2025-1-5 9:00"
+end_date: "2025-1-6 18:30"
+article_urls: []
+model_config:
+  LLM:
+    model: qwen-plus
+    api_key: sk-config-key
+  VLM:
+    model: qwen3-vl-plus
+    api_key: sk-config-key
+"""
+        config_path.write_text(config_content, encoding='utf-8')
+
+        old_root = os.environ.get('WECHAT_AI_DAILY_ROOT')
+        os.environ['WECHAT_AI_DAILY_ROOT'] = tmpdir
+        try:
+            panel = ConfigPanel(ConfigManager(str(config_path)))
+
+            assert panel.get_selected_date() == datetime(2025, 1, 5), \
+                f"target_date 解析错误: {panel.get_selected_date()!r}"
+            start_datetime, end_datetime = panel.get_selected_date_range()
+            assert start_datetime == datetime(2025, 1, 5, 9, 0), \
+                f"start_date 解析错误: {start_datetime!r}"
+            assert end_datetime == datetime(2025, 1, 6, 18, 30), \
+                f"end_date 解析错误: {end_datetime!r}"
+
+            print("✓ 测试通过：未补零的日期字符串能正确解析")
+
+        finally:
+            if old_root is None:
+                os.environ.pop('WECHAT_AI_DAILY_ROOT', None)
+            else:
+                os.environ['WECHAT_AI_DAILY_ROOT'] = old_root
+
+
+if __name__ == "__main__":
+    test_save_writes_displayed_dates_when_config_dates_are_null()
+    test_load_dates_without_zero_padding()
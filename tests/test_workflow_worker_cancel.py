@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+测试工作流线程在同步阶段（线程池中执行）被取消时的行为
+
+同步阶段无法被 task.cancel() 打断，取消后必须等待该阶段真正结束，
+再按真实结果发出 finished_signal，不能提前报告“已取消”。
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录和 src 目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from wechat_ai_daily.workflows.base import BaseWorkflow
+from apps.desktop.workers import workflow_worker
+from apps.desktop.workers.workflow_worker import WorkflowWorker, WorkflowType
+
+
+RUN_SECONDS = 1.0
+CANCEL_AFTER = 0.2
+
+
+class FakePublisher(BaseWorkflow):
+    """模拟耗时的同步发布器
+
+    honor_cancel 为 True 时在运行中检查取消状态，否则忽略取消直到完成。
+    """
+
+    honor_cancel = True
+
+    def __init__(self, config: str) -> None:
+        super().__init__()
+        self.finished_at = None
+
+    def build_workflow(self) -> None:
+        pass
+
+    def run(self, html_path: str, title: str, digest: str = "") -> str:
+        deadline = time.monotonic() + RUN_SECONDS
+        try:
+            while time.monotonic() < deadline:
+                if self.honor_cancel:
+                    self.check_cancelled()
+                time.sleep(0.01)
+            return "fake-media-id"
+        finally:
+            self.finished_at = time.monotonic()
+
+
+def _run_publish_with_cancel(honor_cancel: bool):
+    """执行发布工作流，并在运行途中请求取消
+
+    Returns:
+        (finished_signal 参数列表, finished_signal 发出时间, 发布器结束时间)
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        config_path.write_text("publish_config:\n  digest: test\n", encoding="utf-8")
+        html_path = Path(tmpdir) / "daily.html"
+        html_path.write_text("<section></section>", encoding="utf-8")
+
+        original_publisher = workflow_worker.DailyPublisher
+        FakePublisher.honor_cancel = honor_cancel
+        workflow_worker.DailyPublisher = FakePublisher
+        WorkflowWorker._pool.clear()
+        try:
+            worker = WorkflowWorker(
+                config_path=str(config_path),
+                workflow_type=WorkflowType.PUBLISH,
+                target_date=datetime.now(),
+                html_file=str(html_path),
+                title="测试标题",
+            )
+            finished = []
+            worker.finished_signal.connect(
+                lambda *args: finished.append((args, time.monotonic())))
+
+            threading.Timer(CANCEL_AFTER, worker.cancel).start()
+            # 直接在当前线程执行 run()，无需启动 Qt 事件循环
+            worker.run()
+
+            publisher = WorkflowWorker._pool[(FakePublisher, str(config_path))][1]
+        finally:
+            workflow_worker.DailyPublisher = original_publisher
+            WorkflowWorker._pool.clear()
+
+    assert len(finished) == 1, f"finished_signal 应只发出一次，实际: {finished}"
+    args, emitted_at = finished[0]
+    return args, emitted_at, publisher.finished_at
+
+
+def test_cancel_during_sync_stage_waits_for_stage():
+    """测试：同步阶段响应取消后才报告“用户取消了操作”"""
+    args, emitted_at, stage_finished_at = _run_publish_with_cancel(honor_cancel=True)
+
+    assert args == (False, "用户取消了操作", ""), f"unexpected finished args: {args}"
+    assert stage_finished_at is not None
+    assert emitted_at >= stage_finished_at, "同步阶段结束前就报告了取消"
+
+    print("✓ 测试通过：取消在同步阶段结束后才报告")
+
+
+def test_cancel_ignored_by_sync_stage_reports_real_result():
+    """测试：同步阶段忽略取消并完成时，报告真实的成功结果"""
+    args, emitted_at, stage_finished_at = _run_publish_with_cancel(honor_cancel=False)
+
+    assert args == (True, "草稿发布完成", "draft:fake-media-id"), f"unexpected finished args: {args}"
+    assert emitted_at >= stage_finished_at
+
+    print("✓ 测试通过：同步阶段完成后报告真实结果")
+
+
+if __name__ == "__main__":
+    test_cancel_during_sync_stage_waits_for_stage()
+    test_cancel_ignored_by_sync_stage_reports_real_result()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+测试工作流线程对同步工作流对象的复用
+
+APIArticleCollector / DailyPublisher 在构造时读取 .env 中的凭据，
+配置文件或 .env 任一发生变化后都必须重新创建，不能继续复用旧实例。
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录和 src 目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from apps.desktop.workers import workflow_worker
+from apps.desktop.workers.workflow_worker import WorkflowWorker, WorkflowType
+
+
+class FakeWorkflow:
+    """记录构造时读取到的 .env 内容"""
+
+    def __init__(self, config: str) -> None:
+        self.env_text = (Path(config).parent / ".env").read_text(encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    """确保文件修改时间发生变化（部分文件系统时间精度较低）"""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_pool_recreates_instance_after_env_change():
+    """测试：.env 变化后重新创建实例，未变化时复用"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        config_path = tmp / "config.yaml"
+        config_path.write_text("publish_config: {}\n", encoding="utf-8")
+        env_path = tmp / ".env"
+        env_path.write_text("WECHAT_API_COOKIE=old\n", encoding="utf-8")
+
+        original_find_root = workflow_worker.find_project_root
+        workflow_worker.find_project_root = lambda: tmp
+        WorkflowWorker._pool.clear()
+        try:
+            worker = WorkflowWorker(
+                config_path=str(config_path),
+                workflow_type=WorkflowType.PUBLISH,
+                target_date=datetime.now(),
+            )
+            first = worker._get_or_create(FakeWorkflow)
+            assert worker._get_or_create(FakeWorkflow) is first, "文件未变化时应复用实例"
+
+            env_path.write_text("WECHAT_API_COOKIE=new\n", encoding="utf-8")
+            _bump_mtime(env_path)
+            second = worker._get_or_create(FakeWorkflow)
+            assert second is not first, ".env 变化后应重新创建实例"
+            assert second.env_text == "WECHAT_API_COOKIE=new\n"
+
+            _bump_mtime(config_path)
+            assert worker._get_or_create(FakeWorkflow) is not second, "配置文件变化后应重新创建实例"
+        finally:
+            workflow_worker.find_project_root = original_find_root
+            WorkflowWorker._pool.clear()
+
+    print("✓ 测试通过：.env 或配置文件变化后重新创建工作流对象")
+
+
+if __name__ == "__main__":
+    test_pool_recreates_instance_after_env_change()